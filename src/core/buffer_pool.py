@@ -0,0 +1,91 @@
+"""Reusable frame-buffer pool to keep steady-state capture free of per-frame allocations."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+import threading
+from typing import Any, Iterator
+
+_ACTIVE_POOL: "BufferPool | None" = None
+
+
+class BufferPool:
+    """Hand out preallocated numpy buffers keyed by shape and dtype."""
+
+    def __init__(self, max_per_key: int = 8):
+        """Store the per-key retention limit for released buffers."""
+        self.max_per_key = max(1, int(max_per_key))
+        self._free: dict[tuple[tuple[int, ...], str], list[Any]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.discarded = 0
+
+    def acquire(self, shape: tuple[int, ...], dtype: Any = "uint8"):
+        """Return a free buffer of the given shape and dtype, allocating on a miss."""
+        import numpy as np
+
+        key = (tuple(int(v) for v in shape), np.dtype(dtype).str)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                self.hits += 1
+                return free.pop()
+            self.misses += 1
+        return np.empty(key[0], dtype=np.dtype(dtype))
+
+    def release(self, buffer) -> None:
+        """Return a buffer to the pool for reuse by later frames."""
+        if getattr(buffer, "flags", None) is None or not buffer.flags.owndata:
+            # Views would keep their parent alive and alias other frames; never pool them.
+            return
+        key = (tuple(int(v) for v in buffer.shape), buffer.dtype.str)
+        with self._lock:
+            free = self._free[key]
+            if len(free) >= self.max_per_key:
+                self.discarded += 1
+                return
+            free.append(buffer)
+            self.released += 1
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for run records."""
+        acquired = self.hits + self.misses
+        return {
+            "acquired": acquired,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / acquired) if acquired else 0.0,
+            "released": self.released,
+            "discarded": self.discarded,
+        }
+
+
+def get_buffer_pool() -> BufferPool | None:
+    """Return the pool enabled for the current run, if any."""
+    return _ACTIVE_POOL
+
+
+def set_buffer_pool(pool: BufferPool | None) -> None:
+    """Enable a pool for adapters in this process, or disable pooling with None."""
+    global _ACTIVE_POOL
+    _ACTIVE_POOL = pool
+
+
+@contextmanager
+def converted_color(cv2_module: Any, frame, code: int, *, channels: int) -> Iterator[Any]:
+    """Yield `cv2.cvtColor(frame, code)`, writing into a pooled buffer when pooling is on."""
+    pool = _ACTIVE_POOL
+    if pool is None:
+        yield cv2_module.cvtColor(frame, code)
+        return
+
+    height, width = frame.shape[:2]
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    dst = pool.acquire(shape, frame.dtype)
+    try:
+        yield cv2_module.cvtColor(frame, code, dst=dst)
+    finally:
+        pool.release(dst)
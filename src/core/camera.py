@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass
+import threading
+import time
 from typing import Any, Protocol
 
+READ_POLICIES = ("latest", "every")
+
 
 class _CaptureLike(Protocol):
     """Subset of the OpenCV capture API used by this wrapper."""
@@ -12,22 +18,66 @@ class _CaptureLike(Protocol):
 
     def set(self, propId: int, value: float) -> bool: ...
 
-    def read(self) -> tuple[bool, Any]: ...
+    def read(self, image: Any = None) -> tuple[bool, Any]: ...
 
     def get(self, propId: int) -> float: ...
 
     def release(self) -> None: ...
 
 
+@dataclass
+class CapturedFrame:
+    """One captured frame with its capture timestamp and sequence number."""
+
+    ok: bool
+    frame: Any
+    captured_at: float
+    sequence: int
+    pooled: bool = False
+
+
 class Camera:
     """Minimal camera abstraction used by runners and demos."""
 
-    def __init__(self, index: int = 0, width: int | None = None, height: int | None = None):
-        """Store the camera index and optional target resolution."""
+    def __init__(
+        self,
+        index: int = 0,
+        width: int | None = None,
+        height: int | None = None,
+        *,
+        threaded: bool = False,
+        buffer_size: int = 4,
+        read_policy: str = "latest",
+        read_timeout_s: float = 2.0,
+        pool: Any | None = None,
+    ):
+        """Store the camera index, optional target resolution, and capture mode."""
+        if read_policy not in READ_POLICIES:
+            raise ValueError(f"Unsupported camera read_policy: {read_policy}. Expected one of {READ_POLICIES}.")
+
         self.index = index
         self.width = int(width) if width is not None else None
         self.height = int(height) if height is not None else None
+        self.threaded = bool(threaded)
+        self.buffer_size = max(1, int(buffer_size))
+        self.read_policy = read_policy
+        self.read_timeout_s = float(read_timeout_s)
         self.cap: _CaptureLike | None = None
+        # Optional BufferPool; when set, frames are captured into reused buffers.
+        self.pool = pool
+        self._frame_shape: tuple[tuple[int, ...], Any] | None = None
+        # A live webcam never runs out of frames; offline sources flip this at end of stream.
+        self.exhausted = False
+
+        self.captured_frames = 0
+        self.dropped_frames = 0
+        self.failed_reads = 0
+        self._sequence = 0
+        self._last_consumed = 0
+        self._buffer: deque[CapturedFrame] = deque(maxlen=self.buffer_size)
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
 
     def _apply_resolution(self, cap: _CaptureLike) -> None:
         """Apply configured width and height to an opened capture device."""
@@ -38,33 +88,144 @@ class Camera:
         if self.height is not None:
             cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
 
+    def describe(self) -> str:
+        """Return a short human-readable source description."""
+        return f"webcam index {self.index}"
+
     def open(self) -> None:
         """Open the configured webcam index with Windows-friendly backend fallback."""
         import cv2
 
         # Windows MSMF can be very slow/unstable on some webcams; prefer DirectShow first.
         cap = cv2.VideoCapture(self.index, cv2.CAP_DSHOW)
-        if cap.isOpened():
-            self._apply_resolution(cap)
-            self.cap = cap
-            return
+        if not cap.isOpened():
+            cap.release()
+            cap = cv2.VideoCapture(self.index)
+            if not cap.isOpened():
+                cap.release()
+                raise RuntimeError(f"Unable to open webcam index {self.index}")
+
+        self._apply_resolution(cap)
+        self.cap = cap
+        if self.threaded:
+            self._start_capture_thread()
+
+    def _start_capture_thread(self) -> None:
+        """Start the background reader that keeps the ring buffer filled."""
+        self._stop_event.clear()
+        self._buffer.clear()
+        self._thread = threading.Thread(target=self._capture_loop, name=f"camera-{self.index}", daemon=True)
+        self._thread.start()
+
+    def _grab(self, cap: _CaptureLike) -> tuple[bool, Any, bool]:
+        """Read one frame, into a pooled buffer once the frame shape is known."""
+        pool = self.pool
+        if pool is None or self._frame_shape is None:
+            ok, frame = cap.read()
+            if ok and frame is not None:
+                self._frame_shape = (frame.shape, frame.dtype)
+            return ok, frame, False
+
+        target = pool.acquire(*self._frame_shape)
+        ok, frame = cap.read(target)
+        if not ok:
+            pool.release(target)
+            return ok, frame, False
+        if frame is not target:
+            # The backend allocated its own array (e.g. the resolution changed).
+            pool.release(target)
+            self._frame_shape = (frame.shape, frame.dtype)
+            return ok, frame, False
+        return ok, frame, True
+
+    def release_frame(self, captured: CapturedFrame) -> None:
+        """Return a pooled frame buffer once the caller has finished with it."""
+        if captured.pooled and self.pool is not None:
+            self.pool.release(captured.frame)
+
+    def _capture_loop(self) -> None:
+        """Continuously read frames into the ring buffer until the camera closes."""
+        cap = self.cap
+        while cap is not None and not self._stop_event.is_set():
+            ok, frame, pooled = self._grab(cap)
+            captured_at = time.perf_counter()
+            if not ok:
+                with self._condition:
+                    self.failed_reads += 1
+                # Avoid spinning on a camera that is temporarily returning nothing.
+                time.sleep(0.005)
+                continue
+
+            with self._condition:
+                self._sequence += 1
+                self.captured_frames += 1
+                if len(self._buffer) == self._buffer.maxlen:
+                    evicted = self._buffer.popleft()
+                    self.release_frame(evicted)
+                    if self.read_policy == "every":
+                        self.dropped_frames += 1
+                self._buffer.append(CapturedFrame(True, frame, captured_at, self._sequence, pooled))
+                self._condition.notify_all()
+
+    def _read_buffered(self) -> CapturedFrame:
+        """Take the next frame from the ring buffer according to the read policy."""
+        deadline = time.perf_counter() + self.read_timeout_s
+        with self._condition:
+            while not self._buffer:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or self._stop_event.is_set():
+                    return CapturedFrame(False, None, time.perf_counter(), self._last_consumed)
+                self._condition.wait(remaining)
+
+            if self.read_policy == "every":
+                item = self._buffer.popleft()
+            else:
+                item = self._buffer.pop()
+                # Frames captured after the previous read but never handed out are stale now.
+                self.dropped_frames += max(0, item.sequence - self._last_consumed - 1)
+                while self._buffer:
+                    self.release_frame(self._buffer.popleft())
+            self._last_consumed = item.sequence
+            return item
+
+    def reset_cursor(self) -> None:
+        """Start a new run at the newest frame so frames captured between runs are not counted as dropped."""
+        with self._condition:
+            self._last_consumed = self._sequence
+            while self._buffer:
+                self.release_frame(self._buffer.popleft())
+
+    def read_frame(self) -> CapturedFrame:
+        """Read one frame together with its capture timestamp and sequence number."""
+        if self.cap is None:
+            raise RuntimeError("Camera not opened")
+        if self._thread is not None:
+            return self._read_buffered()
 
-        cap.release()
-        cap = cv2.VideoCapture(self.index)
-        if cap.isOpened():
-            self._apply_resolution(cap)
-            self.cap = cap
-            return
+        ok, frame, pooled = self._grab(self.cap)
+        captured_at = time.perf_counter()
+        if not ok:
+            self.failed_reads += 1
+            return CapturedFrame(False, frame, captured_at, self._sequence)
 
-        cap.release()
-        raise RuntimeError(f"Unable to open webcam index {self.index}")
+        self._sequence += 1
+        self.captured_frames += 1
+        self._last_consumed = self._sequence
+        return CapturedFrame(True, frame, captured_at, self._sequence, pooled)
 
     def read(self) -> tuple[bool, Any]:
         """Read a single frame from the active webcam stream."""
-        if self.cap is None:
-            raise RuntimeError("Camera not opened")
-        ok, frame = self.cap.read()
-        return ok, frame
+        captured = self.read_frame()
+        return captured.ok, captured.frame
+
+    def capture_stats(self) -> dict:
+        """Return capture counters for run records."""
+        return {
+            "capture_mode": f"threaded_{self.read_policy}" if self.threaded else "blocking",
+            "captured_frames": self.captured_frames,
+            "dropped_frames": self.dropped_frames,
+            "failed_reads": self.failed_reads,
+        }
 
     def actual_resolution(self) -> tuple[int | None, int | None]:
         """Return the resolution reported by the active capture device."""
@@ -78,7 +239,17 @@ class Camera:
         return width, height
 
     def close(self) -> None:
-        """Release the webcam stream if it is open."""
+        """Stop background capture and release the webcam stream if it is open."""
+        if self._thread is not None:
+            self._stop_event.set()
+            with self._condition:
+                self._condition.notify_all()
+            self._thread.join(timeout=self.read_timeout_s)
+            self._thread = None
+        # Frames never handed out still hold pool buffers.
+        with self._condition:
+            while self._buffer:
+                self.release_frame(self._buffer.popleft())
         if self.cap is not None:
             self.cap.release()
             self.cap = None
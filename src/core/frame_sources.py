@@ -0,0 +1,339 @@
+"""Offline frame sources that replay recorded frames behind the Camera interface."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+import sys
+import time
+from typing import Any, Sequence
+
+from src.core.camera import Camera, CapturedFrame
+
+REPLAY_MODES = ("fast", "paced")
+FRAME_SOURCES = ("webcam", "video", "images", "array", "raw")
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
+
+
+class _ReplaySource(ABC):
+    """Shared replay bookkeeping for sources that yield frames from storage."""
+
+    def __init__(self, *, replay: str = "fast", loop: bool = False, fps: float = 30.0):
+        """Store replay pacing, looping, and the fallback frame rate."""
+        if replay not in REPLAY_MODES:
+            raise ValueError(f"Unsupported replay mode: {replay}. Expected one of {REPLAY_MODES}.")
+        self.replay = replay
+        self.loop = bool(loop)
+        self.fps = float(fps) if fps else 30.0
+        self.index = 0
+        self.exhausted = False
+        self.captured_frames = 0
+        self.failed_reads = 0
+        self.dropped_frames = 0
+        self._position = 0
+        self._loop_offset_s = 0.0
+        self._wall_start: float | None = None
+        self._media_start: float | None = None
+        self._opened = False
+
+    @abstractmethod
+    def _frame_count(self) -> int:
+        """Return the number of frames available for replay."""
+
+    @abstractmethod
+    def _load(self, position: int) -> tuple[Any, float | None]:
+        """Return the frame at a position plus its original timestamp in seconds."""
+
+    @abstractmethod
+    def describe(self) -> str:
+        """Return a short human-readable source description."""
+
+    def open(self) -> None:
+        """Prepare the source for replay from the first frame."""
+        self._position = 0
+        self._loop_offset_s = 0.0
+        self._wall_start = None
+        self._media_start = None
+        self.exhausted = False
+        self._opened = True
+
+    def _pace(self, media_ts: float) -> None:
+        """Sleep until the frame's original timestamp when pacing is enabled."""
+        if self.replay != "paced":
+            return
+        now = time.perf_counter()
+        if self._wall_start is None or self._media_start is None:
+            self._wall_start = now
+            self._media_start = media_ts
+            return
+        delay = (media_ts - self._media_start) - (now - self._wall_start)
+        if delay > 0:
+            time.sleep(delay)
+
+    def read_frame(self) -> CapturedFrame:
+        """Return the next recorded frame, pacing it if configured."""
+        if not self._opened:
+            raise RuntimeError("Frame source not opened")
+
+        total = self._frame_count()
+        if self._position >= total and self.loop and total > 0:
+            self._loop_offset_s += total / self.fps
+            self._position = 0
+        if self._position >= total:
+            self.exhausted = True
+            return CapturedFrame(False, None, time.perf_counter(), self.captured_frames)
+
+        position = self._position
+        frame, media_ts = self._load(position)
+        if frame is None and self._frame_count() <= position:
+            # The source found its real end while decoding: end of stream, not a failed read.
+            return self.read_frame()
+        if media_ts is None:
+            media_ts = position / self.fps
+        self._position += 1
+        if frame is None:
+            self.failed_reads += 1
+            return CapturedFrame(False, None, time.perf_counter(), self.captured_frames)
+
+        self._pace(media_ts + self._loop_offset_s)
+        self.captured_frames += 1
+        return CapturedFrame(True, frame, time.perf_counter(), self.captured_frames)
+
+    def reset_cursor(self) -> None:
+        """Replay never drops frames, so there is no read cursor to move between runs."""
+
+    def read(self) -> tuple[bool, Any]:
+        """Read a single frame using the Camera-compatible tuple contract."""
+        captured = self.read_frame()
+        return captured.ok, captured.frame
+
+    def capture_stats(self) -> dict:
+        """Return replay counters for run records."""
+        return {
+            "capture_mode": f"replay_{self.replay}",
+            "captured_frames": self.captured_frames,
+            "dropped_frames": self.dropped_frames,
+            "failed_reads": self.failed_reads,
+        }
+
+    def actual_resolution(self) -> tuple[int | None, int | None]:
+        """Return the resolution of the first recorded frame."""
+        if self._frame_count() == 0:
+            return None, None
+        frame, _unused_ts = self._load(0)
+        if frame is None:
+            return None, None
+        height, width = frame.shape[:2]
+        return int(width), int(height)
+
+    def close(self) -> None:
+        """Stop replay."""
+        self._opened = False
+
+
+class ArrayFrameSource(_ReplaySource):
+    """Replay frames from an in-memory array or sequence of frames."""
+
+    def __init__(
+        self,
+        frames: Sequence[Any],
+        *,
+        timestamps: Sequence[float] | None = None,
+        replay: str = "fast",
+        loop: bool = False,
+        fps: float = 30.0,
+        name: str = "in-memory",
+    ):
+        """Store the frame stack and optional per-frame timestamps in seconds."""
+        super().__init__(replay=replay, loop=loop, fps=fps)
+        if timestamps is not None and len(timestamps) != len(frames):
+            raise ValueError("Frame timestamps must match the number of frames.")
+        self.frames = frames
+        self.timestamps = timestamps
+        self.name = name
+
+    def _frame_count(self) -> int:
+        """Return the number of frames in the stack."""
+        return len(self.frames)
+
+    def _load(self, position: int) -> tuple[Any, float | None]:
+        """Return one frame from the stack without copying it."""
+        ts = float(self.timestamps[position]) if self.timestamps is not None else None
+        return self.frames[position], ts
+
+    def describe(self) -> str:
+        """Return a short human-readable source description."""
+        return f"frame array {self.name} ({len(self.frames)} frames)"
+
+
+class ImageDirectorySource(_ReplaySource):
+    """Replay the sorted image files in a directory as a frame stream."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        replay: str = "fast",
+        loop: bool = False,
+        fps: float = 30.0,
+    ):
+        """Store the image directory and replay options."""
+        super().__init__(replay=replay, loop=loop, fps=fps)
+        self.path = Path(path)
+        self._files: list[Path] = []
+
+    def open(self) -> None:
+        """List the image files to replay."""
+        if not self.path.is_dir():
+            raise RuntimeError(f"Image directory not found: {self.path}")
+        self._files = sorted(p for p in self.path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+        if not self._files:
+            raise RuntimeError(f"No images found in {self.path}")
+        super().open()
+
+    def _frame_count(self) -> int:
+        """Return the number of images found."""
+        return len(self._files)
+
+    def _load(self, position: int) -> tuple[Any, float | None]:
+        """Decode one image file."""
+        import cv2
+
+        return cv2.imread(str(self._files[position])), None
+
+    def describe(self) -> str:
+        """Return a short human-readable source description."""
+        return f"image directory {self.path}"
+
+
+class VideoFileSource(_ReplaySource):
+    """Replay a recorded video file through OpenCV."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        replay: str = "fast",
+        loop: bool = False,
+    ):
+        """Store the video path and replay options."""
+        super().__init__(replay=replay, loop=loop)
+        self.path = Path(path)
+        self.cap: Any | None = None
+        self._total = 0
+
+    def open(self) -> None:
+        """Open the video file and read its frame count and rate."""
+        import cv2
+
+        if not self.path.exists():
+            raise RuntimeError(f"Video file not found: {self.path}")
+        cap = cv2.VideoCapture(str(self.path))
+        if not cap.isOpened():
+            cap.release()
+            raise RuntimeError(f"Unable to open video file {self.path}")
+        self.cap = cap
+        # Streams and some containers report 0 or -1; read until decoding fails instead.
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        self._total = frame_count if frame_count > 0 else sys.maxsize
+        self.fps = float(cap.get(cv2.CAP_PROP_FPS) or 0) or self.fps
+        super().open()
+
+    def _frame_count(self) -> int:
+        """Return the container frame count, or `sys.maxsize` until an unknown count is found."""
+        return self._total
+
+    def _load(self, position: int) -> tuple[Any, float | None]:
+        """Decode the next frame, seeking only when replay restarts."""
+        import cv2
+
+        if self.cap is None:
+            return None, None
+        if position == 0 and int(self.cap.get(cv2.CAP_PROP_POS_FRAMES) or 0) != 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        ok, frame = self.cap.read()
+        if not ok:
+            # Container frame counts can overstate (or not know) the decodable frames;
+            # lowering the total here makes read_frame report end of stream.
+            self._total = position
+            return None, None
+        return frame, float(self.cap.get(cv2.CAP_PROP_POS_MSEC) or 0) / 1000.0
+
+    def actual_resolution(self) -> tuple[int | None, int | None]:
+        """Return the resolution stored in the video container."""
+        import cv2
+
+        if self.cap is None:
+            return None, None
+        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 0) or None
+        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0) or None
+        return width, height
+
+    def describe(self) -> str:
+        """Return a short human-readable source description."""
+        return f"video file {self.path}"
+
+    def close(self) -> None:
+        """Release the video file."""
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        super().close()
+
+
+def _resolve_path(configured: str) -> Path:
+    """Resolve a configured path relative to the repo root."""
+    path = Path(configured)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parents[2] / path
+    return path
+
+
+def create_frame_source(camera_cfg: dict, *, frames: Sequence[Any] | None = None):
+    """Build a webcam or offline frame source from a `camera:` config block."""
+    source = str(camera_cfg.get("source", "webcam")).strip().lower()
+    replay = str(camera_cfg.get("replay", "fast")).strip().lower()
+    loop = bool(camera_cfg.get("loop", False))
+    fps = float(camera_cfg.get("fps", 30.0))
+
+    if frames is not None:
+        return ArrayFrameSource(frames, replay=replay, loop=loop, fps=fps)
+
+    if source == "webcam":
+        return Camera(
+            index=int(camera_cfg.get("index", 0)),
+            width=camera_cfg.get("width"),
+            height=camera_cfg.get("height"),
+            threaded=bool(camera_cfg.get("threaded", False)),
+            buffer_size=int(camera_cfg.get("buffer_size", 4)),
+            read_policy=str(camera_cfg.get("read_policy", "latest")),
+        )
+
+    configured = camera_cfg.get("path")
+    if not configured:
+        raise ValueError(f"camera.source '{source}' requires camera.path.")
+    path = _resolve_path(str(configured))
+
+    if source == "video":
+        return VideoFileSource(path, replay=replay, loop=loop)
+    if source == "images":
+        return ImageDirectorySource(path, replay=replay, loop=loop, fps=fps)
+    if source == "array":
+        import numpy as np
+
+        stack = np.load(path, mmap_mode="r")
+        return ArrayFrameSource(stack, replay=replay, loop=loop, fps=fps, name=path.name)
+    if source == "raw":
+        from src.core.raw_frames import RawFrameReader
+
+        reader = RawFrameReader(path)
+        return ArrayFrameSource(
+            reader.frames,
+            timestamps=reader.timestamps if len(reader.timestamps) == len(reader) else None,
+            replay=replay,
+            loop=loop,
+            fps=fps,
+            name=path.name,
+        )
+
+    raise ValueError(f"Unsupported camera.source: {source}. Expected one of {FRAME_SOURCES}.")
@@ -1,33 +1,149 @@
 ﻿"""Simple timing and throughput metrics collected during webcam runs."""
 
 from dataclasses import dataclass, field
+import math
 import time
 
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-memory latency histogram with logarithmic buckets, in the style of HdrHistogram.
+
+    Bucket `i` covers `[lowest_ms * (1 + precision) ** i, lowest_ms * (1 + precision) ** (i + 1))`,
+    so percentiles are exact to within `precision` relative error whatever the range, and
+    1 us to one hour fits in about 2,200 buckets at the default 1%. Count, sum, sum of
+    squares, min, and max are kept exactly, so histograms from separate runs merge
+    without loss.
+    """
+
+    precision: float = 0.01
+    lowest_ms: float = 0.001
+    count: int = 0
+    sum_ms: float = 0.0
+    sum_sq_ms: float = 0.0
+    min_ms: float | None = None
+    max_ms: float | None = None
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    def _index(self, value_ms: float) -> int:
+        """Return the bucket index for a latency value."""
+        if value_ms <= self.lowest_ms:
+            return 0
+        return int(math.log(value_ms / self.lowest_ms) / math.log1p(self.precision))
+
+    def _bucket_value(self, index: int) -> float:
+        """Return the geometric midpoint of a bucket, the value reported for its samples."""
+        return self.lowest_ms * (1.0 + self.precision) ** (index + 0.5)
+
+    def record(self, value_ms: float) -> None:
+        """Add one latency sample."""
+        value_ms = max(0.0, float(value_ms))
+        index = self._index(value_ms)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum_ms += value_ms
+        self.sum_sq_ms += value_ms * value_ms
+        self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+        self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Fold another histogram with the same bucket layout into this one."""
+        if (other.precision, other.lowest_ms) != (self.precision, self.lowest_ms):
+            raise ValueError("Cannot merge latency histograms with different bucket layouts.")
+        for index, bucket_count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + bucket_count
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+        self.sum_sq_ms += other.sum_sq_ms
+        if other.min_ms is not None:
+            self.min_ms = other.min_ms if self.min_ms is None else min(self.min_ms, other.min_ms)
+        if other.max_ms is not None:
+            self.max_ms = other.max_ms if self.max_ms is None else max(self.max_ms, other.max_ms)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the latency at or below which `percentile` percent of samples fall."""
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(self.count * percentile / 100.0))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Clamping keeps p0/p100 exact and never reports a value outside the observed range.
+                return min(max(self._bucket_value(index), self.min_ms), self.max_ms)
+        return self.max_ms
+
+    def std_ms(self) -> float | None:
+        """Return the population standard deviation."""
+        if self.count == 0:
+            return None
+        mean = self.sum_ms / self.count
+        return math.sqrt(max(0.0, self.sum_sq_ms / self.count - mean * mean))
+
+    def summary(self) -> dict:
+        """Return min, percentiles, max, mean, and standard deviation."""
+        return {
+            "min_processing_ms": self.min_ms,
+            **{f"p{p}_processing_ms": self.percentile(p) for p in LATENCY_PERCENTILES},
+            "max_processing_ms": self.max_ms,
+            "std_processing_ms": self.std_ms(),
+        }
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-friendly data; buckets become sorted [index, count] pairs."""
+        return {
+            "precision": self.precision,
+            "lowest_ms": self.lowest_ms,
+            "count": self.count,
+            "sum_ms": self.sum_ms,
+            "sum_sq_ms": self.sum_sq_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "buckets": [[index, self.buckets[index]] for index in sorted(self.buckets)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """Rebuild a histogram serialized by `to_dict`."""
+        return cls(
+            precision=float(data["precision"]),
+            lowest_ms=float(data["lowest_ms"]),
+            count=int(data["count"]),
+            sum_ms=float(data["sum_ms"]),
+            sum_sq_ms=float(data["sum_sq_ms"]),
+            min_ms=data.get("min_ms"),
+            max_ms=data.get("max_ms"),
+            buckets={int(index): int(bucket_count) for index, bucket_count in data.get("buckets", [])},
+        )
+
 
 @dataclass
 class RunMetrics:
-    """Collect per-frame timings and provide summary-level metrics."""
+    """Collect per-frame timings in constant memory and provide summary-level metrics."""
 
     frame_count: int = 0
-    processing_times_ms: list[float] = field(default_factory=list)
+    first_processing_ms: float | None = None
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     started_at: float = field(default_factory=time.time)
 
     def record_frame(self, elapsed_ms: float) -> None:
         """Record elapsed processing time for one frame."""
         self.frame_count += 1
-        self.processing_times_ms.append(elapsed_ms)
+        if self.first_processing_ms is None:
+            self.first_processing_ms = elapsed_ms
+        self.latency.record(elapsed_ms)
 
     def summary(self) -> dict:
-        """Return aggregate stats such as FPS and average processing latency."""
+        """Return aggregate stats such as FPS, latency percentiles, and the serialized histogram."""
         duration = max(time.time() - self.started_at, 1e-9)
-        avg_ms = (
-            sum(self.processing_times_ms) / len(self.processing_times_ms)
-            if self.processing_times_ms
-            else 0.0
-        )
+        avg_ms = self.latency.sum_ms / self.latency.count if self.latency.count else 0.0
         return {
             "frame_count": self.frame_count,
             "duration_s": duration,
             "fps": self.frame_count / duration,
             "avg_processing_ms": avg_ms,
+            **self.latency.summary(),
+            "latency_histogram": self.latency.to_dict(),
         }
@@ -0,0 +1,107 @@
+"""Memory-mapped raw frame recording and zero-copy replay for bit-exact benchmarks."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+INDEX_SUFFIX = ".index.json"
+
+
+def index_path_for(path: str | Path) -> Path:
+    """Return the sidecar index path for a raw `.npy` frame store."""
+    path = Path(path)
+    return path.with_name(path.stem + INDEX_SUFFIX)
+
+
+class RawFrameRecorder:
+    """Append raw frames to a preallocated memory-mapped `.npy` store."""
+
+    def __init__(self, path: str | Path, *, capacity: int, frame_shape: tuple[int, ...], dtype: str = "uint8"):
+        """Preallocate storage for `capacity` frames of one shape and dtype."""
+        import numpy as np
+
+        if capacity <= 0:
+            raise ValueError("Raw frame recorder capacity must be positive.")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.capacity = int(capacity)
+        self.frame_shape = tuple(int(v) for v in frame_shape)
+        self.count = 0
+        self.overflow_frames = 0
+        self.timestamps: list[float] = []
+        self.frame_numbers: list[int] = []
+        self._first_ts: float | None = None
+        self._store: Any | None = np.lib.format.open_memmap(
+            self.path,
+            mode="w+",
+            dtype=np.dtype(dtype),
+            shape=(self.capacity, *self.frame_shape),
+        )
+
+    def write(self, frame, *, captured_at: float, frame_number: int) -> bool:
+        """Copy one frame into the next slot; return False once capacity is reached."""
+        if self._store is None:
+            raise RuntimeError("Raw frame recorder is closed")
+        if self.count >= self.capacity or tuple(frame.shape) != self.frame_shape:
+            self.overflow_frames += 1
+            return False
+
+        if self._first_ts is None:
+            self._first_ts = captured_at
+        self._store[self.count] = frame
+        self.timestamps.append(captured_at - self._first_ts)
+        self.frame_numbers.append(int(frame_number))
+        self.count += 1
+        return True
+
+    def release(self) -> None:
+        """Flush frames to disk and write the sidecar index."""
+        if self._store is None:
+            return
+        self._store.flush()
+        dtype = str(self._store.dtype)
+        self._store = None
+
+        index = {
+            "count": self.count,
+            "capacity": self.capacity,
+            "frame_shape": list(self.frame_shape),
+            "dtype": dtype,
+            "overflow_frames": self.overflow_frames,
+            "timestamps_s": self.timestamps,
+            "frame_numbers": self.frame_numbers,
+        }
+        index_path_for(self.path).write_text(json.dumps(index), encoding="utf-8")
+
+
+class RawFrameReader:
+    """Open a raw frame store and expose zero-copy views of the recorded frames."""
+
+    def __init__(self, path: str | Path):
+        """Memory-map the store read-only and load its sidecar index."""
+        import numpy as np
+
+        self.path = Path(path)
+        sidecar = index_path_for(self.path)
+        if not self.path.exists():
+            raise RuntimeError(f"Raw frame store not found: {self.path}")
+        if not sidecar.exists():
+            raise RuntimeError(f"Raw frame index not found: {sidecar}")
+
+        index = json.loads(sidecar.read_text(encoding="utf-8"))
+        self.count = int(index.get("count", 0))
+        self.timestamps: list[float] = [float(ts) for ts in index.get("timestamps_s", [])]
+        self.frame_numbers: list[int] = [int(n) for n in index.get("frame_numbers", [])]
+        store = np.load(self.path, mmap_mode="r")
+        self.frames = store[: self.count]
+
+    def __len__(self) -> int:
+        """Return the number of recorded frames."""
+        return self.count
+
+    def __getitem__(self, position: int):
+        """Return a read-only view of one recorded frame."""
+        return self.frames[position]
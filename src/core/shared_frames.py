@@ -0,0 +1,118 @@
+"""Shared-memory frame ring for zero-copy fan-out to worker processes."""
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+import time
+from typing import Any
+
+
+def _aligned(size: int, alignment: int = 64) -> int:
+    """Round a byte size up to the given alignment."""
+    return (size + alignment - 1) // alignment * alignment
+
+
+class SharedFrameRing:
+    """Fixed-size ring of frame slots in shared memory with per-slot reference counts.
+
+    The owning process writes each frame once into a free slot and marks it with the
+    number of readers. Readers map the same block, view the slot without copying,
+    and release it when done; the writer blocks while the next slot is still in use.
+    """
+
+    def __init__(self, spec: dict, condition: Any, *, create: bool):
+        """Create or attach to the shared block described by `spec`."""
+        import numpy as np
+
+        self.spec = dict(spec)
+        self.slots = int(spec["slots"])
+        self.frame_shape = tuple(int(v) for v in spec["frame_shape"])
+        self.dtype = np.dtype(spec["dtype"])
+        self.frame_nbytes = int(np.prod(self.frame_shape)) * self.dtype.itemsize
+        self._slot_stride = _aligned(self.frame_nbytes)
+        self._meta_offset = self._slot_stride * self.slots
+        total = self._meta_offset + 8 * self.slots
+        self._condition = condition
+        self._owner = create
+
+        if create:
+            self._shm = shared_memory.SharedMemory(create=True, size=total)
+            self.spec["name"] = self._shm.name
+        else:
+            self._shm = shared_memory.SharedMemory(name=spec["name"])
+
+        self._refcounts = np.ndarray((self.slots,), dtype=np.int64, buffer=self._shm.buf, offset=self._meta_offset)
+        if create:
+            self._refcounts[:] = 0
+
+        self._next_slot = 0
+        self.frames_written = 0
+        self.backpressure_waits = 0
+        self.blocked_ms = 0.0
+
+    @classmethod
+    def create(cls, *, slots: int, frame_shape: tuple[int, ...], dtype: str, condition: Any) -> "SharedFrameRing":
+        """Allocate a new ring owned by the calling process."""
+        spec = {"slots": max(1, int(slots)), "frame_shape": list(frame_shape), "dtype": str(dtype)}
+        return cls(spec, condition, create=True)
+
+    @classmethod
+    def attach(cls, spec: dict, condition: Any) -> "SharedFrameRing":
+        """Attach to a ring created by another process."""
+        return cls(spec, condition, create=False)
+
+    def view(self, slot: int):
+        """Return a read-only numpy view of one slot without copying."""
+        import numpy as np
+
+        frame = np.ndarray(self.frame_shape, dtype=self.dtype, buffer=self._shm.buf, offset=slot * self._slot_stride)
+        frame.flags.writeable = False
+        return frame
+
+    def write(self, frame, *, readers: int, timeout_s: float | None = None) -> int | None:
+        """Copy a frame into the next free slot for `readers` consumers and return the slot.
+
+        Returns None when the slot is still referenced after `timeout_s`.
+        """
+        import numpy as np
+
+        slot = self._next_slot
+        with self._condition:
+            if self._refcounts[slot] > 0:
+                self.backpressure_waits += 1
+                wait_start = time.perf_counter()
+                ready = self._condition.wait_for(lambda: self._refcounts[slot] == 0, timeout_s)
+                self.blocked_ms += (time.perf_counter() - wait_start) * 1000.0
+                if not ready:
+                    return None
+
+        target = np.ndarray(self.frame_shape, dtype=self.dtype, buffer=self._shm.buf, offset=slot * self._slot_stride)
+        np.copyto(target, frame)
+        with self._condition:
+            self._refcounts[slot] = int(readers)
+        self._next_slot = (slot + 1) % self.slots
+        self.frames_written += 1
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Drop one reader reference to a slot and wake a blocked writer."""
+        with self._condition:
+            self._refcounts[slot] = max(0, int(self._refcounts[slot]) - 1)
+            if self._refcounts[slot] == 0:
+                self._condition.notify_all()
+
+    def stats(self) -> dict:
+        """Return writer-side counters for run records."""
+        return {
+            "ring_slots": self.slots,
+            "frames_written": self.frames_written,
+            "backpressure_waits": self.backpressure_waits,
+            "backpressure_blocked_ms": self.blocked_ms,
+        }
+
+    def close(self) -> None:
+        """Detach from the block and free it when this process owns it."""
+        self._refcounts = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
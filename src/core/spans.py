@@ -0,0 +1,116 @@
+"""Named timing spans that break frame latency down into per-stage statistics."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from src.core.metrics import LatencyHistogram
+
+# Canonical stage order for reports; the runner times capture/aggregate/render/write and
+# adapters time preprocess/infer/postprocess inside their own call.
+STAGES = ("capture", "preprocess", "infer", "postprocess", "aggregate", "render", "write")
+
+_ACTIVE_RECORDER: "SpanRecorder | None" = None
+
+
+class _NullSpan:
+    """Shared do-nothing span handed out while no recorder is active."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        """Do nothing and return the shared span."""
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        """Do nothing and let exceptions propagate."""
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Time one `with` block and report it to a recorder on exit."""
+
+    __slots__ = ("recorder", "name", "started_at")
+
+    def __init__(self, recorder: "SpanRecorder", name: str):
+        """Bind the span to its recorder and stage name."""
+        self.recorder = recorder
+        self.name = name
+        self.started_at = 0.0
+
+    def __enter__(self) -> "_Span":
+        """Start the clock."""
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        """Record the elapsed time and let exceptions propagate."""
+        self.recorder.record(self.name, (time.perf_counter() - self.started_at) * 1000.0)
+        return False
+
+
+class SpanRecorder:
+    """Collect one latency histogram per stage name; safe to share across pipeline threads."""
+
+    def __init__(self) -> None:
+        """Start with no recorded stages."""
+        self._stages: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        """Add one timed occurrence of a stage."""
+        with self._lock:
+            histogram = self._stages.get(name)
+            if histogram is None:
+                histogram = self._stages[name] = LatencyHistogram()
+            histogram.record(elapsed_ms)
+
+    def _ordered_names(self) -> list[str]:
+        """Return recorded stage names, known stages first in pipeline order; the caller holds `_lock`."""
+        known = [name for name in STAGES if name in self._stages]
+        return known + sorted(name for name in self._stages if name not in STAGES)
+
+    def histograms(self) -> dict[str, dict]:
+        """Serialize each stage's histogram for the JSON log."""
+        with self._lock:
+            return {name: self._stages[name].to_dict() for name in self._ordered_names()}
+
+    def stats(self) -> dict[str, dict]:
+        """Return count, total, mean, p50/p95, and max per stage."""
+        with self._lock:
+            return {name: stage_summary(self._stages[name]) for name in self._ordered_names()}
+
+
+def stage_summary(histogram: LatencyHistogram) -> dict:
+    """Summarize one stage histogram in milliseconds."""
+    return {
+        "count": histogram.count,
+        "total_ms": histogram.sum_ms,
+        "avg_ms": (histogram.sum_ms / histogram.count) if histogram.count else None,
+        "p50_ms": histogram.percentile(50),
+        "p95_ms": histogram.percentile(95),
+        "max_ms": histogram.max_ms,
+    }
+
+
+def get_span_recorder() -> SpanRecorder | None:
+    """Return the recorder enabled for the current run, if any."""
+    return _ACTIVE_RECORDER
+
+
+def set_span_recorder(recorder: SpanRecorder | None) -> None:
+    """Enable span timing for this process, or disable it with None."""
+    global _ACTIVE_RECORDER
+    _ACTIVE_RECORDER = recorder
+
+
+def span(name: str) -> _Span | _NullSpan:
+    """Return a context manager that times a named stage; a shared no-op when disabled."""
+    recorder = _ACTIVE_RECORDER
+    if recorder is None:
+        return _NULL_SPAN
+    return _Span(recorder, name)
@@ -11,7 +11,9 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from src.core.metrics import LATENCY_PERCENTILES, LatencyHistogram
 from src.core.reporting import write_csv_rows
+from src.core.spans import STAGES
 
 
 def _load_payload(path: Path) -> dict:
@@ -43,6 +45,108 @@ def _collect_ocr_rows(payload: dict, path: Path) -> list[dict]:
     return []
 
 
+def _run_group_key(record: dict) -> tuple[str, str, str, str, str]:
+    """Return the task/library/condition/mode/backend group a run's histograms merge into.
+
+    Serial, pipelined, paired, fan-out and backend runs measure different latencies, so
+    they are never merged with each other.
+    """
+    return (
+        str(record.get("task", "")),
+        str(record.get("library", "")),
+        str(record.get("condition", "")),
+        str(record.get("execution_mode") or ""),
+        str(record.get("inference_backend") or ""),
+    )
+
+
+def _collect_latency_histogram(payload: dict, merged: dict[tuple, dict]) -> None:
+    """Merge a run's serialized latency histogram into its task/library/condition/mode group."""
+    record = payload.get("record")
+    histogram = (payload.get("metrics") or {}).get("latency_histogram")
+    if not isinstance(record, dict) or not isinstance(histogram, dict):
+        return
+    group = merged.setdefault(_run_group_key(record), {"histogram": None, "repeats": 0})
+    run_histogram = LatencyHistogram.from_dict(histogram)
+    if group["histogram"] is None:
+        group["histogram"] = run_histogram
+    else:
+        group["histogram"].merge(run_histogram)
+    group["repeats"] += 1
+
+
+def _latency_rows(merged: dict[tuple, dict]) -> list[dict]:
+    """Turn merged histograms into one percentile row per task/library/condition/mode."""
+    rows = []
+    for (task_name, library_name, condition, execution_mode, backend), group in sorted(merged.items()):
+        histogram = group["histogram"]
+        rows.append(
+            {
+                "task": task_name,
+                "library": library_name,
+                "condition": condition,
+                "execution_mode": execution_mode,
+                "inference_backend": backend,
+                "repeats": group["repeats"],
+                "frames": histogram.count,
+                "avg_processing_ms": (histogram.sum_ms / histogram.count) if histogram.count else None,
+                **histogram.summary(),
+            }
+        )
+    return rows
+
+
+def _collect_stage_histograms(payload: dict, merged: dict[tuple, dict]) -> None:
+    """Merge a run's per-stage span histograms into task/library/condition/mode/stage groups."""
+    record = payload.get("record")
+    stages = (payload.get("metrics") or {}).get("stage_histograms")
+    if not isinstance(record, dict) or not isinstance(stages, dict):
+        return
+    for stage, histogram in stages.items():
+        key = (*_run_group_key(record), stage)
+        group = merged.setdefault(key, {"histogram": None, "repeats": 0, "frames": 0})
+        run_histogram = LatencyHistogram.from_dict(histogram)
+        if group["histogram"] is None:
+            group["histogram"] = run_histogram
+        else:
+            group["histogram"].merge(run_histogram)
+        group["repeats"] += 1
+        group["frames"] += int(record.get("frames_processed") or 0)
+
+
+def _stage_rows(merged: dict[tuple, dict]) -> list[dict]:
+    """Turn merged stage histograms into one row per task/library/condition/mode/stage, in pipeline order."""
+    rows = []
+
+    def _order(key: tuple) -> tuple:
+        *run_key, stage = key
+        rank = STAGES.index(stage) if stage in STAGES else len(STAGES)
+        return *run_key, rank, stage
+
+    for key in sorted(merged, key=_order):
+        task_name, library_name, condition, execution_mode, backend, stage = key
+        group = merged[key]
+        histogram = group["histogram"]
+        rows.append(
+            {
+                "task": task_name,
+                "library": library_name,
+                "condition": condition,
+                "execution_mode": execution_mode,
+                "inference_backend": backend,
+                "stage": stage,
+                "repeats": group["repeats"],
+                "frames": group["frames"],
+                "occurrences": histogram.count,
+                "ms_per_frame": (histogram.sum_ms / group["frames"]) if group["frames"] else None,
+                "avg_ms": (histogram.sum_ms / histogram.count) if histogram.count else None,
+                **{f"p{p}_ms": histogram.percentile(p) for p in LATENCY_PERCENTILES},
+                "max_ms": histogram.max_ms,
+            }
+        )
+    return rows
+
+
 def export_logs(*, logs_root: str | Path = "data/logs", output_dir: str | Path = "results/tables") -> dict[str, Path]:
     """Export paper-ready CSV tables from saved logs and return output paths."""
     logs_root = Path(logs_root)
@@ -50,9 +154,13 @@ def export_logs(*, logs_root: str | Path = "data/logs", output_dir: str | Path =
     face_rows = []
     object_rows = []
     ocr_rows = []
+    latency_groups: dict[tuple, dict] = {}
+    stage_groups: dict[tuple, dict] = {}
 
     for path in sorted(logs_root.rglob("*.json")):
         payload = _load_payload(path)
+        _collect_latency_histogram(payload, latency_groups)
+        _collect_stage_histograms(payload, stage_groups)
         face_rows.extend(_collect_live_task_row(payload, path, task_name="human_cues"))
         object_rows.extend(_collect_live_task_row(payload, path, task_name="object_recognition"))
         ocr_rows.extend(_collect_ocr_rows(payload, path))
@@ -72,11 +180,15 @@ def export_logs(*, logs_root: str | Path = "data/logs", output_dir: str | Path =
     face_path = write_csv_rows(face_rows, output_dir / "face_detection_summary.csv")
     object_path = write_csv_rows(object_rows, output_dir / "object_recognition_summary.csv")
     ocr_path = write_csv_rows(ocr_rows, output_dir / "ocr_summary.csv")
+    latency_path = write_csv_rows(_latency_rows(latency_groups), output_dir / "latency_summary.csv")
+    stage_path = write_csv_rows(_stage_rows(stage_groups), output_dir / "stage_summary.csv")
 
     return {
         "face": face_path,
         "object": object_path,
         "ocr": ocr_path,
+        "latency": latency_path,
+        "stages": stage_path,
     }
 
 
@@ -92,6 +204,8 @@ def main() -> None:
     print(f"Wrote {outputs['face']}")
     print(f"Wrote {outputs['object']}")
     print(f"Wrote {outputs['ocr']}")
+    print(f"Wrote {outputs['latency']}")
+    print(f"Wrote {outputs['stages']}")
 
 
 if __name__ == "__main__":
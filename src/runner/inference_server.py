@@ -0,0 +1,532 @@
+"""Resident inference server that keeps task adapters loaded across runner invocations."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import ipaddress
+import json
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+import os
+from pathlib import Path
+import secrets
+import sys
+import threading
+import time
+from typing import Any, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.config import load_config
+from src.tasks.interface import TaskAdapter, TaskResult
+from src.tasks.registry import TASK_MODULES, create_task_adapter, get_task_adapter_class
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+DEFAULT_IDLE_EVICT_S = 900.0
+AUTHKEY_ENV = "INFERENCE_SERVER_AUTHKEY"
+DEFAULT_AUTHKEY_FILE = Path.home() / ".cache" / "webcam-bench" / "inference_server.key"
+# Config sections that steer the runner rather than the adapter; they do not split resident models.
+RUNNER_SECTIONS = ("run", "camera", "experiment", "inference_server", "comparison", "fanout", "paired")
+# Failures a client sees when the server is down, restarted, or uses another auth key.
+CLIENT_ERRORS = (OSError, EOFError, RuntimeError, AuthenticationError)
+
+
+def parse_address(address: str) -> str | tuple[str, int]:
+    """Turn `host:port` into a TCP address and `unix:/path` into a Unix socket path."""
+    text = str(address).strip()
+    if text.startswith("unix:"):
+        return text[len("unix:") :]
+    host, sep, port = text.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Unsupported inference server address: {address}. Use host:port or unix:/path.")
+    return host.strip("[]") or "127.0.0.1", int(port)
+
+
+def _server_cfg(cfg: dict | None) -> dict:
+    """Return the `inference_server` config block."""
+    return ((cfg or {}).get("inference_server", {}) or {}) if isinstance(cfg, dict) else {}
+
+
+def _is_loopback(host: str) -> bool:
+    """Return True for localhost names and loopback IP addresses."""
+    if host.lower() == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def check_address(address: str, *, allow_remote: bool = False) -> str:
+    """Validate an address, refusing non-loopback TCP hosts unless remote access is allowed.
+
+    Requests are unpickled, so anyone who can connect and authenticate can run code in the server.
+    """
+    parsed = parse_address(address)
+    if isinstance(parsed, tuple) and not allow_remote and not _is_loopback(parsed[0]):
+        raise ValueError(
+            f"Inference server address {address} is not a loopback host. "
+            "Set inference_server.allow_remote: true to listen on or connect to other hosts."
+        )
+    return address
+
+
+def server_settings(cfg: dict | None) -> tuple[str, float]:
+    """Read the validated address and idle-eviction timeout from the `inference_server` block."""
+    server_cfg = _server_cfg(cfg)
+    address = check_address(
+        str(server_cfg.get("address", DEFAULT_ADDRESS)),
+        allow_remote=bool(server_cfg.get("allow_remote", False)),
+    )
+    idle_evict_s = float(server_cfg.get("idle_evict_s", DEFAULT_IDLE_EVICT_S))
+    return address, idle_evict_s
+
+
+def server_authkey(cfg: dict | None, *, create: bool = False) -> bytes:
+    """Return the auth key from config, `INFERENCE_SERVER_AUTHKEY`, or the per-user key file.
+
+    There is no built-in key: with neither setting, the server (`create=True`) writes a
+    random key to `inference_server.authkey_file` with mode 0600 and clients read it back.
+    """
+    server_cfg = _server_cfg(cfg)
+    configured = server_cfg.get("authkey") or os.getenv(AUTHKEY_ENV)
+    if configured:
+        return str(configured).encode("utf-8")
+
+    key_path = Path(server_cfg.get("authkey_file") or DEFAULT_AUTHKEY_FILE).expanduser()
+    if create and not key_path.exists():
+        key_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        try:
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "w", encoding="ascii") as handle:
+                handle.write(secrets.token_hex(32))
+    try:
+        key = key_path.read_text(encoding="ascii").strip()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(
+            f"Inference server auth key file not found: {key_path}. Start the server first, "
+            f"or set inference_server.authkey / {AUTHKEY_ENV}."
+        ) from exc
+    if not key:
+        raise ValueError(f"Inference server auth key file is empty: {key_path}")
+    return key.encode("utf-8")
+
+
+def process_rss_mb() -> float | None:
+    """Return this process's resident memory in MiB (current on Linux, peak elsewhere)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux but bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def adapter_config_key(cfg: dict | None) -> str:
+    """Hash the adapter-relevant part of a config so differently configured clients get separate models."""
+    relevant = {key: value for key, value in (cfg or {}).items() if key not in RUNNER_SECTIONS}
+    encoded = json.dumps(relevant, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class _ResidentModel:
+    """One loaded adapter plus the counters reported by `status`."""
+
+    def __init__(self, adapter: TaskAdapter):
+        """Wrap a freshly created adapter."""
+        self.adapter = adapter
+        self.lock = threading.Lock()
+        self.load_ms = 0.0
+        self.frames = 0
+        self.last_used = time.monotonic()
+        # Guarded by the server's `_lock`: requests between lookup and `lock`, and eviction state.
+        self.in_flight = 0
+        self.closed = False
+
+
+class InferenceServer:
+    """Hold task adapters loaded and serve frames to runner clients over a local socket.
+
+    Adapters are keyed by task, library, and a hash of the adapter-relevant config, so a
+    client with other settings gets its own instance instead of reconfiguring a shared
+    one. Models unused for `idle_evict_s` seconds are closed.
+    """
+
+    def __init__(self, address: str, *, authkey: bytes, idle_evict_s: float = DEFAULT_IDLE_EVICT_S):
+        """Store the listen address and eviction policy."""
+        self.address = address
+        self.authkey = authkey
+        self.idle_evict_s = float(idle_evict_s)
+        self.started_at = time.monotonic()
+        self.evicted = 0
+        self._models: dict[tuple[str, str, str], _ResidentModel] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _checkout(self, key: tuple[str, str, str], *, create_cfg: dict | None = None) -> tuple[_ResidentModel | None, bool]:
+        """Look up (or create) a resident and mark it in use so the idle evictor leaves it alone."""
+        with self._lock:
+            resident = self._models.get(key)
+            if resident is not None or create_cfg is None:
+                if resident is not None:
+                    resident.in_flight += 1
+                return resident, resident is not None
+
+        # Build the adapter without the server lock so other clients are not stalled.
+        adapter = create_task_adapter(key[0], key[1], create_cfg)
+        with self._lock:
+            resident = self._models.get(key)
+            warm = resident is not None
+            if resident is None:
+                resident = _ResidentModel(adapter)
+                self._models[key] = resident
+            resident.in_flight += 1
+        if warm:
+            # Another client created the same model first; keep theirs.
+            adapter.close()
+        return resident, warm
+
+    def _checkin(self, resident: _ResidentModel) -> None:
+        """Release a resident taken with `_checkout`."""
+        with self._lock:
+            resident.in_flight -= 1
+            resident.last_used = time.monotonic()
+
+    def load(self, task_name: str, library_name: str, cfg: dict, *, cold: bool = False) -> dict:
+        """Make sure an adapter is loaded and report whether it was already warm."""
+        key = (task_name, library_name, adapter_config_key(cfg))
+        if cold:
+            with self._lock:
+                stale = self._detach(key)
+            if stale is not None:
+                self._close(key, stale)
+        while True:
+            resident, warm = self._checkout(key, create_cfg=cfg)
+            try:
+                with resident.lock:
+                    if resident.closed:
+                        # Evicted between lookup and lock; look it up again.
+                        continue
+                    start = time.perf_counter()
+                    try:
+                        resident.adapter.load()
+                        error = None
+                    except Exception as exc:  # noqa: BLE001
+                        error = str(exc)
+                    load_ms = (time.perf_counter() - start) * 1000.0
+                    if not warm:
+                        resident.load_ms = load_ms
+            finally:
+                self._checkin(resident)
+            return {"warm": warm, "load_ms": load_ms, "error": error, "model_key": key[2]}
+
+    def process(self, task_name: str, library_name: str, model_key: str, frames: Sequence[Any], *, batch: bool) -> dict:
+        """Run one frame (or a batch) through a resident adapter."""
+        resident, _warm = self._checkout((task_name, library_name, model_key))
+        if resident is None:
+            return {"status": "not_loaded"}
+        try:
+            with resident.lock:
+                if resident.closed:
+                    return {"status": "not_loaded"}
+                start = time.perf_counter()
+                if batch:
+                    results = resident.adapter.process_batch(frames)
+                else:
+                    results = [resident.adapter.process(frames[0])]
+                elapsed_ms = (time.perf_counter() - start) * 1000.0
+                resident.frames += len(frames)
+        finally:
+            self._checkin(resident)
+        return {"status": "ok", "results": results, "elapsed_ms": elapsed_ms}
+
+    def status(self) -> dict:
+        """Report warm models, memory use, and eviction counters."""
+        now = time.monotonic()
+        with self._lock:
+            models = [
+                {
+                    "task": task_name,
+                    "library": library_name,
+                    "config": model_key,
+                    "load_ms": resident.load_ms,
+                    "frames": resident.frames,
+                    "idle_s": now - resident.last_used,
+                }
+                for (task_name, library_name, model_key), resident in self._models.items()
+            ]
+        return {
+            "status": "ok",
+            "address": self.address,
+            "uptime_s": now - self.started_at,
+            "warm_models": len(models),
+            "rss_mb": process_rss_mb(),
+            "evicted": self.evicted,
+            "idle_evict_s": self.idle_evict_s,
+            "models": models,
+        }
+
+    def _detach(self, key: tuple[str, str, str]) -> _ResidentModel | None:
+        """Forget one resident and mark it closed; the caller holds `_lock` and then calls `_close`."""
+        resident = self._models.pop(key, None)
+        if resident is None:
+            return None
+        # Requests that already checked it out see `closed` once they take its lock.
+        resident.closed = True
+        self.evicted += 1
+        return resident
+
+    def _close(self, key: tuple[str, str, str], resident: _ResidentModel) -> None:
+        """Close a detached resident without `_lock`, after any request using it finishes."""
+        with resident.lock:
+            resident.adapter.close()
+        print(f"[INFO] Evicted {key[0]}/{key[1]}")
+
+    def evict(self, task_name: str | None = None, library_name: str | None = None) -> int:
+        """Evict matching adapters (all when no task/library is given) and return how many."""
+        with self._lock:
+            detached = [
+                (key, self._detach(key))
+                for key in list(self._models)
+                if (task_name is None or key[0] == task_name) and (library_name is None or key[1] == library_name)
+            ]
+        for key, resident in detached:
+            self._close(key, resident)
+        return len(detached)
+
+    def _evict_idle(self) -> None:
+        """Background loop that closes adapters idle for longer than `idle_evict_s`."""
+        interval = max(1.0, min(30.0, self.idle_evict_s / 4.0))
+        while not self._stop.wait(interval):
+            now = time.monotonic()
+            with self._lock:
+                # Checked-out residents have a request in flight; check again next round.
+                detached = [
+                    (key, self._detach(key))
+                    for key, resident in list(self._models.items())
+                    if now - resident.last_used >= self.idle_evict_s and resident.in_flight == 0
+                ]
+            for key, resident in detached:
+                self._close(key, resident)
+
+    def _dispatch(self, message: dict) -> dict:
+        """Handle one request message and return the reply."""
+        op = message.get("op")
+        if op == "process":
+            return self.process(message["task"], message["library"], message["model"], [message["frame"]], batch=False)
+        if op == "process_batch":
+            return self.process(message["task"], message["library"], message["model"], message["frames"], batch=True)
+        if op == "load":
+            reply = self.load(message["task"], message["library"], message.get("cfg") or {}, cold=bool(message.get("cold")))
+            return {"status": "ok", **reply}
+        if op == "status":
+            return self.status()
+        if op == "evict":
+            return {"status": "ok", "evicted": self.evict(message.get("task"), message.get("library"))}
+        if op == "shutdown":
+            self._stop.set()
+            return {"status": "ok"}
+        return {"status": "error", "error": f"Unknown inference server request: {op}"}
+
+    def _serve_connection(self, conn: Connection) -> None:
+        """Answer requests on one client connection until it disconnects."""
+        with conn:
+            while not self._stop.is_set():
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    reply = self._dispatch(message)
+                except Exception as exc:  # noqa: BLE001
+                    reply = {"status": "error", "error": str(exc)}
+                conn.send(reply)
+                if message.get("op") == "shutdown":
+                    # Wake the accept() call so serve_forever can return.
+                    try:
+                        Client(parse_address(self.address), authkey=self.authkey).close()
+                    except OSError:
+                        pass
+                    return
+
+    def serve_forever(self) -> None:
+        """Accept client connections until a shutdown request arrives, then close every model."""
+        evictor = threading.Thread(target=self._evict_idle, name="inference-evict", daemon=True)
+        evictor.start()
+        with Listener(parse_address(self.address), authkey=self.authkey) as listener:
+            print(f"[INFO] Inference server listening on {self.address} (idle eviction after {self.idle_evict_s:.0f} s)")
+            while not self._stop.is_set():
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError) as exc:
+                    print(f"[WARN] Rejected inference client: {exc}")
+                    continue
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        self.evict()
+        print("[INFO] Inference server stopped")
+
+
+class InferenceClient:
+    """Blocking request/reply connection to an `InferenceServer`."""
+
+    def __init__(self, address: str, *, authkey: bytes):
+        """Connect and authenticate."""
+        self.address = address
+        self._conn = Client(parse_address(address), authkey=authkey)
+        self._lock = threading.Lock()
+
+    def request(self, op: str, **payload: Any) -> dict:
+        """Send one request and return the reply, raising on server-side errors."""
+        with self._lock:
+            self._conn.send({"op": op, **payload})
+            reply = self._conn.recv()
+        if reply.get("status") == "error":
+            raise RuntimeError(reply.get("error"))
+        return reply
+
+    def close(self) -> None:
+        """Close the connection; the server keeps its models."""
+        self._conn.close()
+
+
+class ServerAdapter(TaskAdapter):
+    """Client-side adapter that forwards frames to a resident inference server."""
+
+    def __init__(self, task_name: str, library_name: str, cfg: dict[str, Any] | None = None, *, cold: bool = False):
+        """Remember which model to use; the connection opens on first use."""
+        self.task = task_name
+        self.library = library_name
+        self.cold = cold
+        self._client: InferenceClient | None = None
+        self._load_reply: dict[str, Any] = {}
+        super().__init__(cfg)
+
+    def setup(self, cfg: dict[str, Any]) -> None:
+        """Resolve and validate the server address; the auth key is read when connecting."""
+        super().setup(cfg)
+        self.address, _idle_evict_s = server_settings(self.cfg)
+
+    @property
+    def supports_batch(self) -> bool:
+        """Mirror the batching support of the adapter class the server hosts."""
+        adapter_cls = get_task_adapter_class(self.task, self.library)
+        return adapter_cls.process_batch is not TaskAdapter.process_batch
+
+    def _connection(self) -> InferenceClient:
+        """Return the open client connection."""
+        if self._client is None:
+            self._client = InferenceClient(self.address, authkey=server_authkey(self.cfg))
+        return self._client
+
+    def load(self) -> None:
+        """Ask the server to load (or confirm) the model; only the first load honours a cold start."""
+        reply = self._connection().request("load", task=self.task, library=self.library, cfg=self.cfg, cold=self.cold)
+        self.cold = False
+        self._load_reply = reply
+        if reply.get("error"):
+            raise RuntimeError(reply["error"])
+
+    def _run(self, op: str, **payload: Any) -> list[TaskResult]:
+        """Send frames to the server, reloading the model once if it was evicted meanwhile."""
+        model_key = adapter_config_key(self.cfg)
+        reply = self._connection().request(op, task=self.task, library=self.library, model=model_key, **payload)
+        if reply.get("status") == "not_loaded":
+            self.load()
+            reply = self._connection().request(op, task=self.task, library=self.library, model=model_key, **payload)
+        if reply.get("status") != "ok":
+            raise RuntimeError(f"Inference server could not run {self.task}/{self.library}.")
+        return reply["results"]
+
+    def process(self, frame) -> TaskResult:
+        """Run one frame on the server."""
+        try:
+            return self._run("process", frame=frame)[0]
+        except CLIENT_ERRORS as exc:
+            return self.failure(f"Inference server error: {exc}")
+
+    def process_batch(self, frames: Sequence[Any]) -> list[TaskResult]:
+        """Run a batch of frames on the server."""
+        try:
+            return self._run("process_batch", frames=list(frames))
+        except CLIENT_ERRORS as exc:
+            return [self.failure(f"Inference server error: {exc}") for _ in frames]
+
+    def stats(self) -> dict[str, Any]:
+        """Report server memory, warm-model count, and whether this model started warm."""
+        try:
+            status = self._connection().request("status")
+        except CLIENT_ERRORS:
+            return {}
+        return {
+            "server_address": self.address,
+            "server_model_warm": self._load_reply.get("warm"),
+            "server_warm_models": status["warm_models"],
+            "server_rss_mb": status["rss_mb"],
+        }
+
+    def close(self) -> None:
+        """Close the connection; the model stays loaded on the server."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+def _configured_libraries(cfg: dict) -> list[tuple[str, str]]:
+    """Return the task/library pairs named by a task config for preloading."""
+    task_cfg = cfg.get("task", {}) or {}
+    task_name = str(task_cfg.get("name", "")).strip()
+    libraries = task_cfg.get("libraries") or ([task_cfg["library"]] if task_cfg.get("library") else [])
+    return [(task_name, str(lib)) for lib in libraries if (task_name, str(lib)) in TASK_MODULES]
+
+
+def main() -> None:
+    """Start the resident server, or query/stop a running one."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", help="Task config whose libraries are loaded at start-up.")
+    parser.add_argument("--address", help=f"host:port or unix:/path (default {DEFAULT_ADDRESS}).")
+    parser.add_argument("--idle-evict-s", type=float)
+    parser.add_argument("--status", action="store_true", help="Print the status of a running server.")
+    parser.add_argument("--stop", action="store_true", help="Ask a running server to shut down.")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config) if args.config else {}
+    address, idle_evict_s = server_settings(cfg)
+    if args.address:
+        address = check_address(args.address, allow_remote=bool(_server_cfg(cfg).get("allow_remote", False)))
+    if args.idle_evict_s is not None:
+        idle_evict_s = args.idle_evict_s
+    authkey = server_authkey(cfg, create=not (args.status or args.stop))
+
+    if args.status or args.stop:
+        client = InferenceClient(address, authkey=authkey)
+        try:
+            print(client.request("shutdown" if args.stop else "status"))
+        finally:
+            client.close()
+        return
+
+    server = InferenceServer(address, authkey=authkey, idle_evict_s=idle_evict_s)
+    for task_name, library_name in _configured_libraries(cfg):
+        reply = server.load(task_name, library_name, cfg)
+        if reply["error"]:
+            print(f"[WARN] Could not preload {task_name}/{library_name}: {reply['error']}")
+        else:
+            print(f"[INFO] Loaded {task_name}/{library_name} in {reply['load_ms']:.1f} ms")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Bounded-queue stage pipeline used by the pipelined run_task execution mode."""
+
+from __future__ import annotations
+
+from collections import deque
+import threading
+import time
+from typing import Any, Callable
+
+PIPELINE_POLICIES = ("block", "drop")
+END = object()
+
+
+class StageQueue:
+    """Bounded FIFO between two stages that either blocks or drops the oldest item when full."""
+
+    def __init__(self, name: str, maxsize: int, policy: str, on_drop: Callable[[Any], None] | None = None):
+        """Store the queue bound, full-queue policy, and drop callback."""
+        if policy not in PIPELINE_POLICIES:
+            raise ValueError(f"Unsupported pipeline policy: {policy}. Expected one of {PIPELINE_POLICIES}.")
+        self.name = name
+        self.maxsize = max(1, int(maxsize))
+        self.policy = policy
+        self.on_drop = on_drop
+        self._items: deque[Any] = deque()
+        self._condition = threading.Condition()
+        self.dropped = 0
+        self.max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+
+    def put(self, item: Any) -> None:
+        """Enqueue an item, applying the full-queue policy."""
+        with self._condition:
+            if self.policy == "block":
+                while len(self._items) >= self.maxsize:
+                    self._condition.wait()
+            elif len(self._items) >= self.maxsize:
+                stale = self._items.popleft()
+                self.dropped += 1
+                if self.on_drop is not None:
+                    self.on_drop(stale)
+            self._items.append(item)
+            depth = len(self._items)
+            self.max_depth = max(self.max_depth, depth)
+            self._depth_total += depth
+            self._depth_samples += 1
+            self._condition.notify_all()
+
+    def put_end(self) -> None:
+        """Enqueue the end-of-stream marker; it is never dropped."""
+        with self._condition:
+            self._items.append(END)
+            self._condition.notify_all()
+
+    def get(self) -> Any:
+        """Block until an item is available and return it."""
+        with self._condition:
+            while not self._items:
+                self._condition.wait()
+            item = self._items.popleft()
+            self._condition.notify_all()
+            return item
+
+    def stats(self) -> dict:
+        """Return depth and drop counters for run records."""
+        return {
+            "max_depth": self.max_depth,
+            "avg_depth": (self._depth_total / self._depth_samples) if self._depth_samples else 0.0,
+            "dropped": self.dropped,
+            "capacity": self.maxsize,
+        }
+
+
+def run_pipeline(
+    *,
+    source: Callable[[], Any],
+    stages: list[tuple[str, Callable[[Any], Any]]],
+    sink: Callable[[Any], bool],
+    stop_event: threading.Event,
+    queue_size: int = 2,
+    policy: str = "block",
+    on_drop: Callable[[Any], None] | None = None,
+) -> dict:
+    """Run `source -> stages... -> sink` with one thread per stage and return stage stats.
+
+    `source` returns an item, None to skip, or END to finish. Each stage returns the
+    item to pass on or None to drop it. `sink` runs on the calling thread (so GUI calls
+    stay on the main thread) and returns False to stop the run. Once `stop_event` is
+    set, upstream stages discard in-flight items and the pipeline drains.
+    """
+    names = ["source", *[name for name, _fn in stages]]
+    queues = [StageQueue(f"{names[idx]}->{nxt}", queue_size, policy, on_drop) for idx, nxt in enumerate([*names[1:], "sink"])]
+    busy_ms = {name: 0.0 for name in names}
+    items = {name: 0 for name in names}
+    errors: list[BaseException] = []
+
+    def _discard(item: Any) -> None:
+        if on_drop is not None:
+            on_drop(item)
+
+    def _source_loop() -> None:
+        out = queues[0]
+        try:
+            while not stop_event.is_set():
+                start = time.perf_counter()
+                item = source()
+                busy_ms["source"] += (time.perf_counter() - start) * 1000.0
+                if item is END:
+                    break
+                if item is None:
+                    continue
+                items["source"] += 1
+                out.put(item)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+            stop_event.set()
+        finally:
+            out.put_end()
+
+    def _stage_loop(name: str, fn: Callable[[Any], Any], inbox: StageQueue, out: StageQueue) -> None:
+        try:
+            while True:
+                item = inbox.get()
+                if item is END:
+                    break
+                if stop_event.is_set():
+                    _discard(item)
+                    continue
+                start = time.perf_counter()
+                result = fn(item)
+                busy_ms[name] += (time.perf_counter() - start) * 1000.0
+                items[name] += 1
+                if result is not None:
+                    out.put(result)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+            stop_event.set()
+            # Keep draining so upstream stages never block on a full queue.
+            while inbox.get() is not END:
+                pass
+        finally:
+            out.put_end()
+
+    threads = [threading.Thread(target=_source_loop, name="pipeline-source", daemon=True)]
+    for idx, (name, fn) in enumerate(stages):
+        threads.append(
+            threading.Thread(
+                target=_stage_loop,
+                args=(name, fn, queues[idx], queues[idx + 1]),
+                name=f"pipeline-{name}",
+                daemon=True,
+            )
+        )
+    for thread in threads:
+        thread.start()
+
+    sink_busy_ms = 0.0
+    sink_items = 0
+    sink_stopped = False
+    inbox = queues[-1]
+    while True:
+        item = inbox.get()
+        if item is END:
+            break
+        if sink_stopped or errors:
+            _discard(item)
+            continue
+        start = time.perf_counter()
+        try:
+            keep_going = sink(item)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+            stop_event.set()
+            continue
+        sink_busy_ms += (time.perf_counter() - start) * 1000.0
+        sink_items += 1
+        if not keep_going:
+            sink_stopped = True
+            stop_event.set()
+
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+    busy_ms["sink"] = sink_busy_ms
+    items["sink"] = sink_items
+    return {
+        "policy": policy,
+        "queue_size": queue_size,
+        "stages": {name: {"items": items[name], "busy_ms": busy_ms[name]} for name in [*names, "sink"]},
+        "queues": {queue.name: queue.stats() for queue in queues},
+    }
@@ -0,0 +1,154 @@
+"""Process-pool inference backend that keeps one preloaded adapter per worker."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+import multiprocessing
+import os
+import queue
+import time
+from typing import Any
+
+from src.tasks.interface import TaskResult
+from src.tasks.registry import create_task_adapter
+
+_WORKER_RUNNER: Any | None = None
+_WORKER_NAMES: tuple[str, str] = ("", "")
+_WORKER_READY: dict[str, Any] = {}
+
+
+def _init_worker(
+    task_name: str,
+    library_name: str,
+    cfg: dict,
+    warmup_shape: tuple[int, ...] | None,
+    ready_queue: Any,
+) -> None:
+    """Import and configure the adapter once, load its model, and report on `ready_queue`."""
+    global _WORKER_RUNNER, _WORKER_NAMES, _WORKER_READY
+    started_at = time.perf_counter()
+    runner = None
+    error = None
+    try:
+        runner = create_task_adapter(task_name, library_name, cfg)
+        runner.load()
+        if warmup_shape is not None:
+            import numpy as np
+
+            # One blank frame also pays for first-inference allocations; setup() then
+            # clears any per-frame state (e.g. Haar ROI history) the blank frame left behind.
+            runner(np.zeros(warmup_shape, dtype=np.uint8))
+            runner.setup(cfg)
+    except Exception as exc:  # noqa: BLE001
+        error = str(exc)
+
+    _WORKER_RUNNER = runner
+    _WORKER_NAMES = (task_name, library_name)
+    _WORKER_READY = {"pid": os.getpid(), "load_ms": (time.perf_counter() - started_at) * 1000.0, "error": error}
+    ready_queue.put(dict(_WORKER_READY))
+
+
+def _worker_ready() -> dict[str, Any]:
+    """Report the worker's pid and model load time once its initializer has run."""
+    return dict(_WORKER_READY)
+
+
+def _process_frame(frame) -> tuple[TaskResult, float]:
+    """Run the preloaded adapter on one frame and return a compact result plus latency."""
+    task_name, library_name = _WORKER_NAMES
+    start = time.perf_counter()
+    try:
+        result = _WORKER_RUNNER(frame) if _WORKER_RUNNER is not None else None
+    except Exception as exc:  # noqa: BLE001
+        result = None
+        error = str(exc)
+    else:
+        error = "Process worker has no configured adapter." if result is None else None
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    if result is None:
+        result = {"task": task_name, "library": library_name, "ok": False, "outputs": {}, "error": error}
+    return result, elapsed_ms
+
+
+class ProcessInferenceBackend:
+    """Dispatch frames to a pool of worker processes that each host a preloaded adapter."""
+
+    def __init__(
+        self,
+        task_name: str,
+        library_name: str,
+        cfg: dict,
+        *,
+        workers: int = 2,
+        warmup_shape: tuple[int, ...] | None = None,
+    ):
+        """Store the adapter selection, config, and worker count."""
+        self.task_name = task_name
+        self.library_name = library_name
+        self.cfg = cfg
+        self.workers = max(1, int(workers))
+        self.warmup_shape = warmup_shape
+        self.worker_load_ms: list[float] = []
+        self.load_errors: list[str] = []
+        self.startup_ms = 0.0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self, timeout_s: float = 300.0) -> None:
+        """Spawn the workers and wait until every one has loaded its model."""
+        started_at = time.perf_counter()
+        ctx = multiprocessing.get_context("spawn")
+        ready_queue = ctx.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self.task_name, self.library_name, self.cfg, self.warmup_shape, ready_queue),
+        )
+        # One probe per worker makes the executor spawn the full pool up front. A worker
+        # that initializes first can answer every probe, so readiness comes from the queue.
+        probes = [self._executor.submit(_worker_ready) for _ in range(self.workers)]
+        deadline = time.perf_counter() + timeout_s
+        ready: dict[int, dict] = {}
+        try:
+            while len(ready) < self.workers:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timed out waiting for {self.workers} inference workers to load.")
+                try:
+                    info = ready_queue.get(timeout=min(remaining, 1.0))
+                except queue.Empty:
+                    # A worker that dies in its initializer breaks the pool and fails the probes.
+                    failed = next((probe.exception() for probe in probes if probe.done() and probe.exception()), None)
+                    if failed is not None:
+                        raise RuntimeError(f"Inference workers exited during start-up: {failed}") from failed
+                    continue
+                ready[info["pid"]] = info
+        except BaseException:
+            self.close()
+            raise
+        finally:
+            ready_queue.close()
+        self.worker_load_ms = [info["load_ms"] for info in ready.values()]
+        self.load_errors = sorted({info["error"] for info in ready.values() if info["error"] is not None})
+        self.startup_ms = (time.perf_counter() - started_at) * 1000.0
+
+    def submit(self, frame) -> Future:
+        """Queue one frame; the future resolves to (TaskResult, worker latency in ms)."""
+        if self._executor is None:
+            raise RuntimeError("Process backend not started")
+        return self._executor.submit(_process_frame, frame)
+
+    def stats(self) -> dict:
+        """Return startup telemetry for run records."""
+        return {
+            "workers": self.workers,
+            "startup_ms": self.startup_ms,
+            "worker_load_ms": self.worker_load_ms,
+            "load_errors": self.load_errors,
+        }
+
+    def close(self) -> None:
+        """Shut the pool down, cancelling frames that never started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -5,15 +5,18 @@ import copy
 import json
 from pathlib import Path
 import sys
+import time
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from src.core.config import load_config
+from src.core.frame_sources import create_frame_source
 from src.core.logging_utils import safe_name, timestamp_string, write_run_log
 from src.core.reporting import write_csv_rows
 from src.runner.export_results import export_logs
+from src.runner.run_paired import run_paired
 from src.runner.run_single_task import run_task
 from src.tasks.registry import TASK_MODULES
 
@@ -51,6 +54,64 @@ def _expand_matrix(comp_cfg: dict) -> list[tuple[str, str, str, int]]:
     return all_pairs
 
 
+def _group_paired(experiments: list[tuple[str, str, str, int]]) -> list[tuple[str, list[str], str, int]]:
+    """Group experiments that differ only by library so paired runs share frames."""
+    grouped: dict[tuple[str, str, int], list[str]] = {}
+    for task, library, condition, repeat in experiments:
+        grouped.setdefault((task, condition, repeat), []).append(library)
+    return [(task, libraries, condition, repeat) for (task, condition, repeat), libraries in grouped.items()]
+
+
+def _build_experiment_cfg(
+    base_cfg: dict,
+    comp_cfg: dict,
+    *,
+    task: str,
+    libraries: list[str],
+    condition: str,
+    repeat: int,
+    log_dir: str,
+) -> dict:
+    """Build the per-run config for one experiment from the comparison config."""
+    cfg = copy.deepcopy(base_cfg)
+    cfg["task"] = {
+        "name": task,
+        "library": libraries[0],
+        "libraries": list(libraries),
+    }
+
+    cfg.setdefault("run", {})
+    if "max_frames" in comp_cfg:
+        cfg["run"]["max_frames"] = comp_cfg["max_frames"]
+    if "max_seconds" in comp_cfg:
+        cfg["run"]["max_seconds"] = comp_cfg["max_seconds"]
+    if "warmup_frames" in comp_cfg:
+        cfg["run"]["warmup_frames"] = comp_cfg["warmup_frames"]
+    if "warmup" in comp_cfg:
+        cfg["run"]["warmup"] = comp_cfg["warmup"]
+    if "record_video" in comp_cfg:
+        cfg["run"]["record_video"] = bool(comp_cfg["record_video"])
+    if "record_format" in comp_cfg:
+        cfg["run"]["record_format"] = comp_cfg["record_format"]
+    if "video_dir" in comp_cfg:
+        cfg["run"]["video_dir"] = comp_cfg["video_dir"]
+    if "show_preview" in comp_cfg:
+        cfg["run"]["show_preview"] = bool(comp_cfg["show_preview"])
+    cfg["run"]["log_dir"] = log_dir
+
+    task_run_overrides = comp_cfg.get("task_run_overrides", {})
+    if isinstance(task_run_overrides, dict):
+        overrides = task_run_overrides.get(task, {})
+        if isinstance(overrides, dict):
+            cfg["run"].update(overrides)
+
+    cfg["experiment"] = {
+        "condition": condition,
+        "repeat": repeat,
+    }
+    return cfg
+
+
 def _build_log_stem(task_name: str, library_name: str, condition: str, repeat: int) -> str:
     """Build a readable log filename stem for one experiment run."""
     return "_".join(
@@ -63,14 +124,14 @@ def _build_log_stem(task_name: str, library_name: str, condition: str, repeat: i
     )
 
 
-def _show_condition_preview(camera_index: int, condition: str, width: int | None, height: int | None) -> bool:
+def _show_condition_preview(camera_cfg: dict, condition: str, camera=None) -> bool:
     """Show a live setup preview and wait for SPACE to start condition runs."""
     import cv2
 
-    from src.core.camera import Camera
-
-    cam = Camera(index=camera_index, width=width, height=height)
-    cam.open()
+    cam = camera
+    if cam is None:
+        cam = create_frame_source(camera_cfg)
+        cam.open()
     try:
         while True:
             ok, frame = cam.read()
@@ -102,22 +163,25 @@ def _show_condition_preview(camera_index: int, condition: str, width: int | None
             if key == 27:  # ESC
                 return False
     finally:
-        cam.close()
+        if camera is None:
+            cam.close()
         cv2.destroyAllWindows()
 
 
 def _wait_for_condition_ready(
     *,
     condition: str,
-    camera_index: int,
-    width: int | None,
-    height: int | None,
+    camera_cfg: dict,
     interactive: bool,
     preview: bool,
+    camera=None,
 ) -> bool:
     """Gate each condition so the user can physically set the environment first."""
     if not interactive:
         return True
+    if str(camera_cfg.get("source", "webcam")).strip().lower() != "webcam":
+        print(f"[SETUP] Condition: {condition} (offline frame source; no scene setup needed)")
+        return True
 
     print()
     print(f"[SETUP] Condition: {condition}")
@@ -125,7 +189,7 @@ def _wait_for_condition_ready(
 
     if preview:
         print("[SETUP] Opening preview. Press SPACE to start this condition, ESC to cancel.")
-        return _show_condition_preview(camera_index, condition, width, height)
+        return _show_condition_preview(camera_cfg, condition, camera=camera)
 
     answer = input("[SETUP] Press Enter to start, or type 'q' to stop: ").strip().lower()
     return answer != "q"
@@ -161,99 +225,109 @@ def main() -> None:
     condition_preview = bool(comp_cfg.get("condition_preview", True))
     pause_before_run = bool(comp_cfg.get("pause_before_run", False))
     camera_cfg = base_cfg.get("camera", {})
-    camera_index = int(camera_cfg.get("index", 0))
-    camera_width = int(camera_cfg["width"]) if camera_cfg.get("width") is not None else None
-    camera_height = int(camera_cfg["height"]) if camera_cfg.get("height") is not None else None
+    camera_session = bool(comp_cfg.get("camera_session", False))
+    if camera_session and str(camera_cfg.get("source", "webcam")).strip().lower() != "webcam":
+        # Replay sources restart per run so every library sees the same frames.
+        print("[WARN] comparison.camera_session only applies to webcam sources; opening per run instead.")
+        camera_session = False
     comparison_name = str(comp_cfg.get("name", "comparison"))
     log_dir = str(comp_cfg.get("log_dir", "data/logs/comparison"))
     summary_dir = Path(comp_cfg.get("summary_dir", "results/summaries"))
-    task_run_overrides = comp_cfg.get("task_run_overrides", {})
+    paired = bool(comp_cfg.get("paired", False))
     export_after_run = bool(comp_cfg.get("export_after_run", True))
     export_logs_root = comp_cfg.get("export_logs_root", "data/logs")
     export_output_dir = comp_cfg.get("export_output_dir", "results/tables")
 
-    total = len(experiments)
-    print(f"[INFO] Running {total} comparison experiments...")
+    if paired:
+        units = _group_paired(experiments)
+        print(f"[INFO] Running {len(experiments)} comparison experiments as {len(units)} paired runs...")
+    else:
+        units = [(task, [library], condition, repeat) for task, library, condition, repeat in experiments]
+        print(f"[INFO] Running {len(experiments)} comparison experiments...")
+    total = len(units)
+
+    session_camera = None
+    session_open_ms = None
+    if camera_session:
+        session_camera = create_frame_source(camera_cfg)
+        print(f"[INFO] Opening {session_camera.describe()} for the whole comparison session...")
+        open_start = time.perf_counter()
+        session_camera.open()
+        session_open_ms = (time.perf_counter() - open_start) * 1000.0
+        print(f"[INFO] Session camera opened in {session_open_ms:.1f} ms")
 
     run_summaries = []
     active_condition = None
-    for idx, (task, library, condition, repeat) in enumerate(experiments, start=1):
-        if condition != active_condition:
-            ready = _wait_for_condition_ready(
-                condition=condition,
-                camera_index=camera_index,
-                width=camera_width,
-                height=camera_height,
-                interactive=interactive_conditions,
-                preview=condition_preview,
+    try:
+        for idx, (task, libraries, condition, repeat) in enumerate(units, start=1):
+            library = "+".join(libraries)
+            condition_changed = condition != active_condition
+            if condition_changed:
+                ready = _wait_for_condition_ready(
+                    condition=condition,
+                    camera_cfg=camera_cfg,
+                    interactive=interactive_conditions,
+                    preview=condition_preview,
+                    camera=session_camera,
+                )
+                if not ready:
+                    print("[INFO] Comparison cancelled during condition setup.")
+                    break
+                active_condition = condition
+
+            print(
+                f"[INFO] ({idx}/{total}) task={task}, library={library}, condition={condition}, repeat={repeat}"
             )
-            if not ready:
-                print("[INFO] Comparison cancelled during condition setup.")
+            if not _wait_for_run_ready(
+                enabled=pause_before_run,
+                task=task,
+                library=library,
+                condition=condition,
+                repeat=repeat,
+            ):
+                print("[INFO] Comparison stopped before run start.")
                 break
-            active_condition = condition
-
-        print(
-            f"[INFO] ({idx}/{total}) task={task}, library={library}, condition={condition}, repeat={repeat}"
-        )
-        if not _wait_for_run_ready(
-            enabled=pause_before_run,
-            task=task,
-            library=library,
-            condition=condition,
-            repeat=repeat,
-        ):
-            print("[INFO] Comparison stopped before run start.")
-            break
-
-        cfg = copy.deepcopy(base_cfg)
-        cfg["task"] = {
-            "name": task,
-            "library": library,
-            "libraries": [library],
-        }
-
-        cfg.setdefault("run", {})
-        if "max_frames" in comp_cfg:
-            cfg["run"]["max_frames"] = comp_cfg["max_frames"]
-        if "max_seconds" in comp_cfg:
-            cfg["run"]["max_seconds"] = comp_cfg["max_seconds"]
-        if "warmup_frames" in comp_cfg:
-            cfg["run"]["warmup_frames"] = comp_cfg["warmup_frames"]
-        if "record_video" in comp_cfg:
-            cfg["run"]["record_video"] = bool(comp_cfg["record_video"])
-        if "video_dir" in comp_cfg:
-            cfg["run"]["video_dir"] = comp_cfg["video_dir"]
-        if "show_preview" in comp_cfg:
-            cfg["run"]["show_preview"] = bool(comp_cfg["show_preview"])
-        cfg["run"]["log_dir"] = log_dir
-
-        if isinstance(task_run_overrides, dict):
-            overrides = task_run_overrides.get(task, {})
-            if isinstance(overrides, dict):
-                cfg["run"].update(overrides)
-
-        cfg["experiment"] = {
-            "condition": condition,
-            "repeat": repeat,
-        }
-
-        payload, _unused_log_path = run_task(cfg, write_log=False)
-        review = {"verdict": None, "notes": None}
-        payload["review"] = review
-        record = dict(payload.get("record", {}))
-        record["verdict"] = review.get("verdict")
-        record["notes"] = review.get("notes")
-        payload["record"] = record
-
-        log_path = write_run_log(
-            payload,
-            out_dir=log_dir,
-            stem=_build_log_stem(task, library, condition, repeat),
-        )
-
-        run_row = dict(record)
-        run_row["log_path"] = str(log_path)
-        run_summaries.append(run_row)
+
+            cfg = _build_experiment_cfg(
+                base_cfg,
+                comp_cfg,
+                task=task,
+                libraries=libraries,
+                condition=condition,
+                repeat=repeat,
+                log_dir=log_dir,
+            )
+            if session_camera is not None and not condition_changed:
+                # The session camera is already settled for this condition.
+                cfg["run"]["warmup_frames"] = 0
+
+            if paired:
+                payloads = [payload for payload, _unused_log_path in run_paired(cfg, libraries, write_log=False, camera=session_camera)]
+            else:
+                payload, _unused_log_path = run_task(cfg, write_log=False, camera=session_camera)
+                payloads = [payload]
+
+            for payload in payloads:
+                review = {"verdict": None, "notes": None}
+                payload["review"] = review
+                record = dict(payload.get("record", {}))
+                record["session_open_ms"] = session_open_ms
+                record["verdict"] = review.get("verdict")
+                record["notes"] = review.get("notes")
+                payload["record"] = record
+
+                log_path = write_run_log(
+                    payload,
+                    out_dir=log_dir,
+                    stem=_build_log_stem(task, str(record.get("library", library)), condition, repeat),
+                )
+
+                run_row = dict(record)
+                run_row["log_path"] = str(log_path)
+                run_summaries.append(run_row)
+    finally:
+        if session_camera is not None:
+            session_camera.close()
 
     summary_dir.mkdir(parents=True, exist_ok=True)
     ts = timestamp_string()
@@ -285,6 +359,8 @@ def main() -> None:
         print(f"[INFO] Updated cumulative table: {outputs['face']}")
         print(f"[INFO] Updated cumulative table: {outputs['object']}")
         print(f"[INFO] Updated cumulative table: {outputs['ocr']}")
+        print(f"[INFO] Updated cumulative table: {outputs['latency']}")
+        print(f"[INFO] Updated cumulative table: {outputs['stages']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,304 @@
+"""Fan each captured frame out to one worker process per library via shared memory."""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+from pathlib import Path
+import queue
+import sys
+import time
+from typing import Any, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.config import load_config
+from src.core.frame_sources import create_frame_source
+from src.core.logging_utils import safe_name, write_run_log
+from src.core.metrics import RunMetrics
+from src.core.shared_frames import SharedFrameRing
+from src.runner.run_single_task import (
+    ResultAggregate,
+    _build_log_stem,
+    _build_run_payload,
+    _build_run_record,
+    _latency_split,
+    _preload_adapter,
+    _run_frame,
+    _warm_up_camera,
+)
+from src.tasks.registry import TASK_MODULES, create_task_adapter
+
+
+def _fanout_worker(task_name: str, library_name: str, cfg: dict, spec: dict, condition, in_queue, out_queue) -> None:
+    """Host one task adapter and process frame slots until a stop message arrives."""
+    ring = SharedFrameRing.attach(spec, condition)
+    try:
+        task_runner = create_task_adapter(task_name, library_name, cfg)
+    except Exception as exc:  # noqa: BLE001
+        out_queue.put(("error", library_name, str(exc)))
+        ring.close()
+        return
+
+    # Load the models before reporting ready so the first fanned-out frame is not a cold start.
+    model_load_ms, load_error = _preload_adapter(task_runner)
+    if load_error is not None:
+        out_queue.put(("error", library_name, load_error))
+        task_runner.close()
+        ring.close()
+        return
+
+    out_queue.put(("ready", library_name, model_load_ms))
+    while True:
+        message = in_queue.get()
+        if message is None:
+            break
+        slot, sequence = message
+        frame = ring.view(slot)
+        start = time.perf_counter()
+        result = _run_frame(task_runner, frame, task_name=task_name, library_name=library_name)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        del frame
+        ring.release(slot)
+        out_queue.put(("result", library_name, (sequence, elapsed_ms, result)))
+
+    task_runner.close()
+    ring.close()
+    out_queue.put(("done", library_name, None))
+
+
+def run_fanout(
+    cfg: dict,
+    *,
+    write_log: bool = True,
+    frames: Sequence[Any] | None = None,
+) -> list[tuple[dict, str | None]]:
+    """Run every configured library for one task on the same live frames in parallel."""
+    task_cfg = cfg.get("task", {})
+    task_name = str(task_cfg.get("name", "")).strip()
+    if not task_name:
+        raise ValueError("Task config must define 'task.name'.")
+    libraries = [str(lib) for lib in task_cfg.get("libraries", []) if (task_name, str(lib)) in TASK_MODULES]
+    if not libraries:
+        raise ValueError("Fan-out runs need at least one supported library in 'task.libraries'.")
+
+    run_cfg = cfg.get("run", {})
+    max_frames = int(run_cfg.get("max_frames", 120))
+    max_seconds = run_cfg.get("max_seconds")
+    max_seconds = float(max_seconds) if max_seconds is not None else None
+    warmup_frames = int(run_cfg.get("warmup_frames", 0))
+    log_dir = str(run_cfg.get("log_dir", f"data/logs/{safe_name(task_name)}"))
+    fanout_cfg = cfg.get("fanout", {})
+    ring_slots = int(fanout_cfg.get("ring_slots", 4))
+    slot_timeout_s = float(fanout_cfg.get("slot_timeout_s", 5.0))
+    ready_timeout_s = float(fanout_cfg.get("ready_timeout_s", 120.0))
+
+    experiment = cfg.get("experiment", {})
+    condition = str(experiment.get("condition", "default"))
+    repeat = int(experiment.get("repeat", 1))
+
+    # The camera is opened before the try below so it is always the last thing closed; the
+    # ring and workers are only created inside the try, and cleanup skips them if they never started.
+    camera = create_frame_source(cfg.get("camera", {}), frames=frames)
+    print(f"[INFO] Opening {camera.describe()}...")
+    open_start = time.perf_counter()
+    camera.open()
+    open_ms = (time.perf_counter() - open_start) * 1000.0
+
+    ctx = multiprocessing.get_context("spawn")
+    slot_condition = ctx.Condition()
+    out_queue = ctx.Queue()
+    in_queues = {lib: ctx.Queue() for lib in libraries}
+    workers: list = []
+    ring: SharedFrameRing | None = None
+    aggregates = {lib: ResultAggregate() for lib in libraries}
+    metrics: dict[str, RunMetrics] = {}
+    model_load_ms: dict[str, float] = {}
+    sent_frames = 0
+    dropped_frames = 0
+    observed_width = None
+    observed_height = None
+
+    def _handle(message) -> str | None:
+        """Fold one worker message into the per-library aggregates."""
+        kind, library, body = message
+        if kind == "result":
+            _sequence, elapsed_ms, result = body
+            metrics[library].record_frame(elapsed_ms)
+            aggregates[library].add(result)
+        elif kind == "ready":
+            model_load_ms[library] = body
+        elif kind == "error":
+            raise RuntimeError(f"Fan-out worker for {task_name}/{library} failed to start: {body}")
+        return kind
+
+    warmup = None
+    try:
+        if warmup_frames > 0:
+            warmup = _warm_up_camera(camera, warmup_frames, run_cfg.get("warmup", {}))
+
+        first = camera.read_frame()
+        while not first.ok and not camera.exhausted:
+            first = camera.read_frame()
+        if not first.ok:
+            raise RuntimeError("Frame source produced no frames for the fan-out run.")
+        observed_height, observed_width = first.frame.shape[:2]
+
+        ring = SharedFrameRing.create(
+            slots=ring_slots,
+            frame_shape=tuple(first.frame.shape),
+            dtype=str(first.frame.dtype),
+            condition=slot_condition,
+        )
+        for lib in libraries:
+            worker = ctx.Process(
+                target=_fanout_worker,
+                args=(task_name, lib, cfg, ring.spec, slot_condition, in_queues[lib], out_queue),
+                name=f"fanout-{task_name}-{lib}",
+                daemon=True,
+            )
+            worker.start()
+            workers.append(worker)
+
+        ready = 0
+        ready_deadline = time.perf_counter() + ready_timeout_s
+        while ready < len(libraries):
+            remaining = ready_deadline - time.perf_counter()
+            if remaining <= 0:
+                raise RuntimeError("Timed out waiting for fan-out workers to load their adapters.")
+            if _handle(out_queue.get(timeout=remaining)) == "ready":
+                ready += 1
+        print(
+            "[INFO] Fan-out workers ready: "
+            + ", ".join(f"{lib} ({model_load_ms[lib]:.1f} ms load)" for lib in libraries)
+        )
+
+        metrics = {lib: RunMetrics() for lib in libraries}
+        capture_started_at = time.perf_counter()
+        captured = first
+        while True:
+            if sent_frames >= max_frames:
+                break
+            if max_seconds is not None and (time.perf_counter() - capture_started_at) >= max_seconds:
+                break
+            if captured is None:
+                captured = camera.read_frame()
+            if not captured.ok:
+                if camera.exhausted:
+                    break
+                for lib in libraries:
+                    aggregates[lib].failed_frames += 1
+                captured = None
+                continue
+
+            slot = ring.write(captured.frame, readers=len(libraries), timeout_s=slot_timeout_s)
+            if slot is None:
+                # A dead worker never releases its slots, so every later write would time out.
+                dead = [(lib, worker.exitcode) for lib, worker in zip(libraries, workers) if not worker.is_alive()]
+                if dead:
+                    details = ", ".join(f"{lib} (exit code {exitcode})" for lib, exitcode in dead)
+                    raise RuntimeError(f"Fan-out worker exited during the run: {details}")
+                dropped_frames += 1
+            else:
+                sent_frames += 1
+                for lib in libraries:
+                    in_queues[lib].put((slot, captured.sequence))
+            captured = None
+
+            while True:
+                try:
+                    _handle(out_queue.get_nowait())
+                except queue.Empty:
+                    break
+    finally:
+        try:
+            for lib_queue in in_queues.values():
+                lib_queue.put(None)
+            done = 0
+            while workers and done < len(workers):
+                try:
+                    kind, library, body = out_queue.get(timeout=slot_timeout_s)
+                except queue.Empty:
+                    break
+                # Never raise here: that would skip the cleanup below and mask the original error.
+                if kind == "done":
+                    done += 1
+                elif kind == "result" and library in metrics:
+                    _handle((kind, library, body))
+                elif kind == "error":
+                    print(f"[WARN] Fan-out worker for {task_name}/{library} failed: {body}")
+        finally:
+            for worker in workers:
+                worker.join(timeout=slot_timeout_s)
+                if worker.is_alive():
+                    worker.terminate()
+            ring_stats = ring.stats() if ring is not None else {}
+            if ring is not None:
+                ring.close()
+            camera.close()
+
+    capture_stats = camera.capture_stats()
+    capture_stats["fanout"] = {**ring_stats, "dropped_frames": dropped_frames, "libraries": libraries}
+    outputs = []
+    for lib in libraries:
+        summary = metrics[lib].summary() if lib in metrics else RunMetrics().summary()
+        record = _build_run_record(
+            task_name=task_name,
+            library_name=lib,
+            condition=condition,
+            repeat=repeat,
+            summary=summary,
+            open_ms=open_ms,
+            warmup_frames=warmup_frames,
+            aggregate=aggregates[lib],
+            warmup=warmup,
+            resolution=(observed_width, observed_height),
+            video_path=None,
+            capture_stats=capture_stats,
+        )
+        first_inference_ms, steady_state_ms = _latency_split(metrics[lib]) if lib in metrics else (None, None)
+        record["model_preloaded"] = lib in model_load_ms
+        record["model_load_ms"] = model_load_ms.get(lib)
+        record["first_inference_ms"] = first_inference_ms
+        record["steady_state_ms"] = steady_state_ms
+        record["execution_mode"] = "fanout"
+        payload = _build_run_payload(
+            cfg=cfg,
+            record=record,
+            aggregate=aggregates[lib],
+            summary=summary,
+            open_ms=open_ms,
+            capture_stats=capture_stats,
+            max_frames=max_frames,
+            max_seconds=max_seconds,
+            video_path=None,
+        )
+        out_file = None
+        if write_log:
+            out_file = str(
+                write_run_log(
+                    payload,
+                    out_dir=log_dir,
+                    stem=_build_log_stem(task_name, lib, condition, repeat),
+                )
+            )
+            print(f"Run complete. task={task_name}, library={lib}, mode=fanout, log={out_file}")
+        outputs.append((payload, out_file))
+
+    return outputs
+
+
+def main() -> None:
+    """Run all libraries in `task.libraries` side by side on shared live frames."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", required=True)
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    run_fanout(cfg, write_log=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""Run several libraries concurrently on identical frames and pair their latencies."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import math
+from pathlib import Path
+import sys
+import time
+from typing import Any, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.core.config import load_config
+from src.core.frame_sources import create_frame_source
+from src.core.logging_utils import safe_name, write_run_log
+from src.core.metrics import LatencyHistogram, RunMetrics
+from src.runner.run_single_task import (
+    ResultAggregate,
+    _build_log_stem,
+    _build_run_payload,
+    _build_run_record,
+    _capture_delta,
+    _latency_split,
+    _preload_adapter,
+    _report_preload,
+    _run_frame,
+    _warm_up_camera,
+)
+from src.tasks.registry import TASK_MODULES, create_task_adapter
+
+
+def _timed_frame(task_runner, frame, *, task_name: str, library_name: str) -> tuple[Any, float]:
+    """Run one adapter on a frame inside a pool thread and return result plus latency."""
+    start = time.perf_counter()
+    result = _run_frame(task_runner, frame, task_name=task_name, library_name=library_name)
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+class _PairedDifferences:
+    """Running statistics of per-frame latency differences in fixed memory.
+
+    Mean and variance use Welford's update. Differences can be negative, so the median
+    comes from two log-bucketed histograms of negative and non-negative magnitudes.
+    """
+
+    def __init__(self) -> None:
+        """Start with no samples."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._negative = LatencyHistogram()
+        self._positive = LatencyHistogram()
+
+    def add(self, diff_ms: float) -> None:
+        """Fold one paired difference into the running statistics."""
+        self.count += 1
+        delta = diff_ms - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (diff_ms - self.mean)
+        if diff_ms < 0:
+            self._negative.record(-diff_ms)
+        else:
+            self._positive.record(diff_ms)
+
+    def _median(self) -> float | None:
+        """Return the median difference to within the histograms' relative precision."""
+        rank = (self.count + 1) // 2
+        negatives = self._negative.count
+        if rank <= negatives:
+            # Negative differences sort by descending magnitude.
+            return -self._negative.percentile(100.0 * (negatives - rank + 1) / negatives)
+        positives = self._positive.count
+        return self._positive.percentile(100.0 * (rank - negatives) / positives)
+
+    def summary(self) -> dict:
+        """Summarize the differences with a normal-approximation 95% CI."""
+        count = self.count
+        if count == 0:
+            return {"frames": 0, "mean_diff_ms": None, "std_diff_ms": None, "ci95_low_ms": None, "ci95_high_ms": None}
+        std = math.sqrt(self._m2 / (count - 1)) if count > 1 else 0.0
+        half_width = 1.96 * std / math.sqrt(count) if count > 1 else 0.0
+        return {
+            "frames": count,
+            "mean_diff_ms": self.mean,
+            "median_diff_ms": self._median(),
+            "std_diff_ms": std,
+            "ci95_low_ms": self.mean - half_width,
+            "ci95_high_ms": self.mean + half_width,
+        }
+
+
+def run_paired(
+    cfg: dict,
+    libraries: list[str],
+    *,
+    write_log: bool = True,
+    frames: Sequence[Any] | None = None,
+    camera: Any | None = None,
+) -> list[tuple[dict, str | None]]:
+    """Send every captured frame to all `libraries` at once and return one payload per library.
+
+    Latency differences are paired per frame against the first library. Paired runs do
+    not render previews or record video, so every library sees exactly the same frames.
+    """
+    task_cfg = cfg.get("task", {})
+    task_name = str(task_cfg.get("name", "")).strip()
+    if not task_name:
+        raise ValueError("Task config must define 'task.name'.")
+    libraries = [str(lib) for lib in libraries if (task_name, str(lib)) in TASK_MODULES]
+    if not libraries:
+        raise ValueError("Paired runs need at least one supported library.")
+
+    run_cfg = cfg.get("run", {})
+    max_frames = int(run_cfg.get("max_frames", 120))
+    max_seconds = run_cfg.get("max_seconds")
+    max_seconds = float(max_seconds) if max_seconds is not None else None
+    warmup_frames = int(run_cfg.get("warmup_frames", 0))
+    log_dir = str(run_cfg.get("log_dir", f"data/logs/{safe_name(task_name)}"))
+
+    experiment = cfg.get("experiment", {})
+    condition = str(experiment.get("condition", "default"))
+    repeat = int(experiment.get("repeat", 1))
+
+    reference = libraries[0]
+    owns_camera = camera is None
+    if camera is None:
+        camera = create_frame_source(cfg.get("camera", {}), frames=frames)
+    runners = {}
+    preloads = {}
+    aggregates = {lib: ResultAggregate() for lib in libraries}
+    differences = {lib: _PairedDifferences() for lib in libraries[1:]}
+    paired_frames = 0
+    observed_width = None
+    observed_height = None
+    warmup = None
+    try:
+        for lib in libraries:
+            runners[lib] = create_task_adapter(task_name, lib, cfg)
+
+        # Load every model before timing starts so no library pays its load on the first paired frame.
+        for lib in libraries:
+            print(f"[INFO] Loading {task_name}/{lib} models...")
+            preloads[lib] = _preload_adapter(runners[lib])
+            _report_preload(*preloads[lib])
+
+        if owns_camera:
+            print(f"[INFO] Opening {camera.describe()}...")
+            open_start = time.perf_counter()
+            camera.open()
+            open_ms = (time.perf_counter() - open_start) * 1000.0
+        else:
+            open_ms = 0.0
+
+        if warmup_frames > 0:
+            warmup = _warm_up_camera(camera, warmup_frames, run_cfg.get("warmup", {}))
+
+        # Frames captured since the previous run's last read are not this run's drops.
+        camera.reset_cursor()
+        capture_baseline = camera.capture_stats()
+        metrics = {lib: RunMetrics() for lib in libraries}
+        wall_metrics = RunMetrics()
+        capture_started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(libraries), thread_name_prefix="paired") as pool:
+            while paired_frames < max_frames:
+                if max_seconds is not None and (time.perf_counter() - capture_started_at) >= max_seconds:
+                    break
+                captured = camera.read_frame()
+                if not captured.ok:
+                    if camera.exhausted:
+                        break
+                    for lib in libraries:
+                        aggregates[lib].failed_frames += 1
+                    continue
+
+                frame = captured.frame
+                observed_height, observed_width = frame.shape[:2]
+                wall_start = time.perf_counter()
+                futures = {
+                    lib: pool.submit(_timed_frame, runners[lib], frame, task_name=task_name, library_name=lib)
+                    for lib in libraries
+                }
+                latencies = {}
+                for lib, future in futures.items():
+                    result, elapsed_ms = future.result()
+                    metrics[lib].record_frame(elapsed_ms)
+                    aggregates[lib].add(result)
+                    latencies[lib] = elapsed_ms
+                wall_metrics.record_frame((time.perf_counter() - wall_start) * 1000.0)
+                for lib, stats in differences.items():
+                    stats.add(latencies[lib] - latencies[reference])
+                paired_frames += 1
+                if captured.pooled:
+                    camera.release_frame(captured)
+    finally:
+        for runner in runners.values():
+            runner.close()
+        if owns_camera:
+            camera.close()
+
+    differences = {lib: stats.summary() for lib, stats in differences.items()}
+    paired = {
+        "libraries": libraries,
+        "reference_library": reference,
+        "wall": wall_metrics.summary(),
+        "differences_vs_reference": differences,
+    }
+    capture_stats = _capture_delta(capture_baseline, camera.capture_stats())
+
+    outputs = []
+    for lib in libraries:
+        summary = metrics[lib].summary()
+        record = _build_run_record(
+            task_name=task_name,
+            library_name=lib,
+            condition=condition,
+            repeat=repeat,
+            summary=summary,
+            open_ms=open_ms,
+            warmup_frames=warmup_frames,
+            aggregate=aggregates[lib],
+            warmup=warmup,
+            resolution=(observed_width, observed_height),
+            video_path=None,
+            capture_stats=capture_stats,
+        )
+        record["camera_reused"] = not owns_camera
+        model_load_ms, load_error = preloads[lib]
+        first_inference_ms, steady_state_ms = _latency_split(metrics[lib])
+        record["model_preloaded"] = load_error is None
+        record["model_load_ms"] = model_load_ms
+        record["model_load_error"] = load_error
+        record["first_inference_ms"] = first_inference_ms
+        record["steady_state_ms"] = steady_state_ms
+        record["execution_mode"] = "paired"
+        record["paired_reference"] = reference
+        diff = differences.get(lib)
+        record["paired_mean_diff_ms"] = diff["mean_diff_ms"] if diff else 0.0
+        record["paired_ci95_low_ms"] = diff["ci95_low_ms"] if diff else 0.0
+        record["paired_ci95_high_ms"] = diff["ci95_high_ms"] if diff else 0.0
+        payload = _build_run_payload(
+            cfg=cfg,
+            record=record,
+            aggregate=aggregates[lib],
+            summary=summary,
+            open_ms=open_ms,
+            capture_stats=capture_stats,
+            max_frames=max_frames,
+            max_seconds=max_seconds,
+            video_path=None,
+        )
+        payload["paired"] = paired
+        out_file = None
+        if write_log:
+            out_file = str(
+                write_run_log(
+                    payload,
+                    out_dir=log_dir,
+                    stem=_build_log_stem(task_name, lib, condition, repeat),
+                )
+            )
+            print(f"Run complete. task={task_name}, library={lib}, mode=paired, log={out_file}")
+        outputs.append((payload, out_file))
+
+    return outputs
+
+
+def main() -> None:
+    """Run all libraries in `task.libraries` concurrently on identical frames."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", required=True)
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    run_paired(cfg, [str(lib) for lib in cfg.get("task", {}).get("libraries", [])], write_log=True)
+
+
+if __name__ == "__main__":
+    main()
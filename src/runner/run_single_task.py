@@ -1,26 +1,51 @@
 """Run one configured webcam task and write a structured metrics log."""
 
 import argparse
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from importlib import import_module
 from pathlib import Path
 import sys
+import threading
 import time
+from typing import Any, Callable, Sequence
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from src.core.camera import Camera
+from src.core.buffer_pool import BufferPool, set_buffer_pool
+from src.core.camera import Camera, CapturedFrame
 from src.core.config import load_config
+from src.core.frame_sources import create_frame_source
 from src.core.logging_utils import safe_name, write_run_log
-from src.core.metrics import RunMetrics
+from src.core.metrics import LATENCY_PERCENTILES, RunMetrics
+from src.core.raw_frames import RawFrameRecorder
+from src.core.spans import SpanRecorder, set_span_recorder, span
+from src.runner.pipeline import END as PIPELINE_END, PIPELINE_POLICIES, run_pipeline
+from src.runner.inference_server import ServerAdapter
+from src.runner.process_backend import ProcessInferenceBackend
 from src.runner.task_selection import select_library
-from src.tasks.interface import TaskResult
-from src.tasks.registry import get_task_runner
+from src.tasks.change_gate import ChangeGate
+from src.tasks.interface import TaskAdapter, TaskResult
+from src.tasks.ocr.gating import TextRegionGate
+from src.tasks.ocr.text_regions import region_config
+from src.tasks.registry import create_task_adapter
+from src.tasks.result_cache import ResultCache
+from src.tasks.tracking import DetectTrackRunner
 
 
+RECORD_FORMATS = ("mp4", "raw")
+WARMUP_STRATEGIES = ("fixed", "stable")
+EXECUTION_MODES = ("serial", "pipelined")
+INFERENCE_BACKENDS = ("inline", "process", "server")
+MODEL_START_MODES = ("warm", "cold")
+PRELOAD_MODES = ("background", "blocking", "off")
+
+# Adapters kept loaded between runs in this process for `run.model_start: warm`.
+_WARM_ADAPTERS: dict[tuple[str, str], TaskAdapter] = {}
+
 TASK_PRESET_CONFIGS = {
     "human": "configs/task_human.yaml",
     "object": "configs/task_object.yaml",
@@ -73,14 +98,214 @@ def _draw_detections(preview, detections: list[dict], cv2_module) -> None:
         )
 
 
-def _warm_up_camera(camera: Camera, warmup_frames: int) -> int:
-    """Discard a fixed number of frames before collecting timed metrics."""
+@dataclass
+class ResultAggregate:
+    """Accumulate per-frame task results into run-level detection statistics."""
+
+    failed_frames: int = 0
+    # Live-stream frames whose result had not arrived yet (or was already reported).
+    pending_frames: int = 0
+    frames_with_detection: int = 0
+    label_counts: Counter[str] = field(default_factory=Counter)
+    confidence_values: list[float] = field(default_factory=list)
+    last_result: TaskResult | None = None
+    last_output_text: str | None = None
+    last_matched_label: str | None = None
+
+    def add(self, result: TaskResult | None) -> list[dict]:
+        """Fold one frame result into the aggregate and return its detections."""
+        self.last_result = result
+        detections = []
+        if result and result.get("ok", False):
+            outputs = result.get("outputs", {})
+            if isinstance(outputs, dict) and outputs.get("pending"):
+                self.pending_frames += 1
+                return detections
+            detections = outputs.get("detections", []) if isinstance(outputs, dict) else []
+            if isinstance(outputs, dict):
+                raw_text = outputs.get("text")
+                if raw_text:
+                    cleaned_text = str(raw_text).strip()
+                    if cleaned_text:
+                        self.last_output_text = cleaned_text
+                raw_label = outputs.get("matched_label")
+                if raw_label:
+                    cleaned_label = str(raw_label).strip()
+                    if cleaned_label:
+                        self.last_matched_label = cleaned_label
+        else:
+            self.failed_frames += 1
+
+        if detections:
+            self.frames_with_detection += 1
+            for det in detections:
+                label = str(det.get("label", "unknown"))
+                self.label_counts[label] += 1
+                conf = det.get("confidence")
+                if conf is not None:
+                    self.confidence_values.append(float(conf))
+        return detections
+
+    def avg_confidence(self) -> float | None:
+        """Return the mean detection confidence, if any confidences were seen."""
+        if not self.confidence_values:
+            return None
+        return sum(self.confidence_values) / len(self.confidence_values)
+
+
+def _run_frame(task_runner, frame, *, task_name: str, library_name: str) -> TaskResult:
+    """Call a task runner on one frame, converting exceptions into failed results."""
+    try:
+        return task_runner(frame)
+    except Exception as exc:  # noqa: BLE001
+        return {
+            "task": task_name,
+            "library": library_name,
+            "ok": False,
+            "outputs": {},
+            "error": str(exc),
+        }
+
+
+def _acquire_adapter(task_name: str, library_name: str, cfg: dict, *, model_start: str, backend_name: str) -> TaskAdapter:
+    """Return the adapter for a run: reused across runs when warm, freshly created when cold.
+
+    With `run.backend: server` the resident server keeps models warm instead, so each
+    run gets a fresh client adapter.
+    """
+    key = (task_name, library_name)
+    if backend_name == "server":
+        return ServerAdapter(task_name, library_name, cfg, cold=model_start == "cold")
+    if model_start == "cold":
+        stale = _WARM_ADAPTERS.pop(key, None)
+        if stale is not None:
+            stale.close()
+        return create_task_adapter(task_name, library_name, cfg)
+
+    adapter = _WARM_ADAPTERS.get(key)
+    if adapter is None:
+        adapter = create_task_adapter(task_name, library_name, cfg)
+        _WARM_ADAPTERS[key] = adapter
+    else:
+        adapter.setup(cfg)
+    return adapter
+
+
+def _preload_adapter(adapter: TaskAdapter) -> tuple[float, str | None]:
+    """Load the adapter's models before timing starts; return load time and any error."""
+    start = time.perf_counter()
+    try:
+        adapter.load()
+    except Exception as exc:  # noqa: BLE001
+        return (time.perf_counter() - start) * 1000.0, str(exc)
+    return (time.perf_counter() - start) * 1000.0, None
+
+
+def _start_background_preload(adapter: TaskAdapter) -> Future:
+    """Load the adapter's models on a helper thread while the camera opens and warms up."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preload")
+    future = executor.submit(_preload_adapter, adapter)
+    # The submitted load keeps running; this only stops the executor from taking more work.
+    executor.shutdown(wait=False)
+    return future
+
+
+def _report_preload(model_load_ms: float, load_error: str | None) -> None:
+    """Print the outcome of a model preload."""
+    if load_error is not None:
+        print(f"[WARN] Model preload failed after {model_load_ms:.1f} ms: {load_error}")
+    else:
+        print(f"[INFO] Models ready in {model_load_ms:.1f} ms")
+
+
+def _latency_split(metrics: RunMetrics) -> tuple[float | None, float | None]:
+    """Split per-frame latencies into the first inference and the steady-state mean."""
+    first_ms = metrics.first_processing_ms
+    if first_ms is None:
+        return None, None
+    rest_count = metrics.latency.count - 1
+    return first_ms, ((metrics.latency.sum_ms - first_ms) / rest_count) if rest_count else None
+
+
+def _warm_up_camera(camera: Camera, warmup_frames: int, warmup_cfg: dict | None = None) -> dict:
+    """Discard frames before timing starts and return warm-up telemetry.
+
+    The `fixed` strategy discards exactly `warmup_frames` good frames. The `stable`
+    strategy stops as soon as the inter-frame interval and mean brightness settle
+    within the configured tolerances; it reads up to `max_frames` (default 300), so
+    slow or auto-exposing cameras are not cut off at `warmup_frames`. `stable` gives up
+    after `timeout_s` (default 10 s); `fixed` only does when `timeout_s` is set.
+    """
+    warmup_cfg = warmup_cfg or {}
+    strategy = str(warmup_cfg.get("strategy", "fixed")).strip().lower()
+    if strategy not in WARMUP_STRATEGIES:
+        raise ValueError(f"Unsupported run.warmup.strategy: {strategy}. Expected one of {WARMUP_STRATEGIES}.")
+    timeout_s = warmup_cfg.get("timeout_s")
+    if timeout_s is not None:
+        timeout_s = float(timeout_s)
+    elif strategy == "stable":
+        timeout_s = 10.0
+    window = max(2, int(warmup_cfg.get("window", 5)))
+    min_frames = int(warmup_cfg.get("min_frames", window + 1))
+    interval_tolerance = float(warmup_cfg.get("interval_tolerance", 0.25))
+    brightness_tolerance = float(warmup_cfg.get("brightness_tolerance", 3.0))
+    frame_limit = warmup_frames
+    if strategy == "stable":
+        frame_limit = max(warmup_frames, int(warmup_cfg.get("max_frames", 300)))
+
     completed = 0
-    while completed < warmup_frames:
-        ok = camera.read()
-        if ok:
-            completed += 1
-    return completed
+    failed_reads = 0
+    stable = strategy == "fixed"
+    intervals: deque[float] = deque(maxlen=window)
+    brightness: deque[float] = deque(maxlen=window)
+    last_captured_at = None
+    started_at = time.perf_counter()
+    while completed < frame_limit:
+        if timeout_s is not None and (time.perf_counter() - started_at) >= timeout_s:
+            stable = False
+            break
+
+        captured = camera.read_frame()
+        if not captured.ok:
+            failed_reads += 1
+            if camera.exhausted:
+                break
+            continue
+        completed += 1
+
+        if strategy == "stable":
+            if last_captured_at is not None:
+                intervals.append(captured.captured_at - last_captured_at)
+            last_captured_at = captured.captured_at
+            # Sparse sampling is enough to follow auto-exposure drift.
+            brightness.append(float(captured.frame[::8, ::8].mean()))
+        if captured.pooled:
+            camera.release_frame(captured)
+
+        if strategy == "stable" and completed >= min_frames and len(intervals) == window:
+            median_interval = sorted(intervals)[len(intervals) // 2]
+            interval_spread = (max(intervals) - min(intervals)) / max(median_interval, 1e-9)
+            brightness_spread = max(brightness) - min(brightness)
+            if interval_spread <= interval_tolerance and brightness_spread <= brightness_tolerance:
+                stable = True
+                break
+
+    return {
+        "strategy": strategy,
+        "frames": completed,
+        "failed_reads": failed_reads,
+        "ms": (time.perf_counter() - started_at) * 1000.0,
+        "stable": stable,
+    }
+
+
+def _capture_delta(before: dict, after: dict) -> dict:
+    """Return capture counters accumulated between two capture_stats() snapshots."""
+    delta = dict(after)
+    for key, value in after.items():
+        if isinstance(value, (int, float)) and isinstance(before.get(key), (int, float)):
+            delta[key] = value - before[key]
+    return delta
 
 
 def _build_log_stem(task_name: str, library_name: str, condition: str, repeat: int) -> str:
@@ -104,17 +329,19 @@ def _build_run_record(
     summary: dict,
     open_ms: float,
     warmup_frames: int,
-    frames_with_detection: int,
-    label_counts: Counter[str],
-    failed_frames: int,
-    avg_confidence: float | None,
+    aggregate: ResultAggregate,
+    warmup: dict | None = None,
     resolution: tuple[int | None, int | None],
     video_path: Path | None,
-    output_text: str | None,
-    matched_label: str | None,
+    capture_stats: dict | None = None,
+    avg_frame_age_ms: float | None = None,
 ) -> dict:
     """Create a flat record used by JSON logs and CSV summary exports."""
+    capture_stats = capture_stats or {}
+    warmup = warmup or {}
+    frames_with_detection = aggregate.frames_with_detection
     frames_processed = int(summary.get("frame_count", 0))
+    frames_with_result = frames_processed - aggregate.pending_frames
     duration_s = float(summary.get("duration_s", 0.0))
     return {
         "task": task_name,
@@ -122,271 +349,470 @@ def _build_run_record(
         "condition": condition,
         "repeat": repeat,
         "frames_processed": frames_processed,
-        "failed_frames": failed_frames,
+        "failed_frames": aggregate.failed_frames,
+        "pending_frames": aggregate.pending_frames,
         "duration_s": duration_s,
         "fps": float(summary.get("fps", 0.0)),
         "avg_processing_ms": float(summary.get("avg_processing_ms", 0.0)),
+        "min_processing_ms": summary.get("min_processing_ms"),
+        **{f"p{p}_processing_ms": summary.get(f"p{p}_processing_ms") for p in LATENCY_PERCENTILES},
+        "max_processing_ms": summary.get("max_processing_ms"),
+        "std_processing_ms": summary.get("std_processing_ms"),
         "webcam_open_ms": open_ms,
         "warmup_frames": warmup_frames,
+        "warmup_strategy": warmup.get("strategy"),
+        "warmup_frames_used": warmup.get("frames", 0),
+        "warmup_ms": warmup.get("ms", 0.0),
+        "warmup_stable": warmup.get("stable"),
+        "capture_mode": capture_stats.get("capture_mode"),
+        "camera_dropped_frames": capture_stats.get("dropped_frames", 0),
+        "avg_frame_age_ms": avg_frame_age_ms,
         "frame_width": resolution[0],
         "frame_height": resolution[1],
         "frames_with_detection": frames_with_detection,
-        "detection_rate": (frames_with_detection / frames_processed) if frames_processed else 0.0,
-        "label_counts": dict(label_counts),
-        "avg_confidence": avg_confidence,
-        "output_text": output_text,
-        "matched_label": matched_label,
+        "detection_rate": (frames_with_detection / frames_with_result) if frames_with_result > 0 else 0.0,
+        "label_counts": dict(aggregate.label_counts),
+        "avg_confidence": aggregate.avg_confidence(),
+        "output_text": aggregate.last_output_text,
+        "matched_label": aggregate.last_matched_label,
         "video_path": str(video_path) if video_path is not None else None,
         "verdict": None,
         "notes": None,
     }
 
 
-def run_task(cfg: dict, *, write_log: bool = True) -> tuple[dict, str | None]:
-    """Execute one task run from an in-memory config and return payload/log path."""
-    task_cfg = cfg.get("task", {})
-    task_name = str(task_cfg.get("name", "")).strip()
-    if not task_name:
-        raise ValueError("Task config must define 'task.name'.")
+@dataclass
+class FrameItem:
+    """One captured frame moving through the run-loop stages."""
 
-    library_name = select_library(task_cfg)
-    task_runner = get_task_runner(task_name, library_name)
-    task_module = import_module(task_runner.__module__)
-    configure_task = getattr(task_module, "configure", None)
-    if callable(configure_task):
-        configure_task(cfg)
+    captured: CapturedFrame
+    index: int
+    result: TaskResult | None = None
+    elapsed_ms: float = 0.0
+    detections: list[dict] = field(default_factory=list)
 
-    run_cfg = cfg.get("run", {})
-    max_frames = int(run_cfg.get("max_frames", 120))
-    max_seconds = run_cfg.get("max_seconds")
-    max_seconds = float(max_seconds) if max_seconds is not None else None
-    warmup_frames = int(run_cfg.get("warmup_frames", 0))
-    record_video = bool(run_cfg.get("record_video", False))
-    show_preview = bool(run_cfg.get("show_preview", False))
-    video_dir = Path(run_cfg.get("video_dir", "data/captures"))
-    log_dir = str(run_cfg.get("log_dir", f"data/logs/{safe_name(task_name)}"))
 
-    experiment = cfg.get("experiment", {})
-    condition = str(experiment.get("condition", "default"))
-    repeat = int(experiment.get("repeat", 1))
+class _TaskLoop:
+    """Per-run state plus the capture, infer, aggregate, and render stages of run_task.
 
-    camera_cfg = cfg.get("camera", {})
-    camera = Camera(
-        index=int(camera_cfg.get("index", 0)),
-        width=camera_cfg.get("width"),
-        height=camera_cfg.get("height"),
-    )
+    The serial loop calls the stages back to back; the pipelined mode runs them on
+    separate threads. Either way each stage touches only its own slice of the state.
+    """
 
-    failed_frames = 0
-    last_result: TaskResult | None = None
-    label_counts: Counter[str] = Counter()
-    confidence_values: list[float] = []
-    frames_with_detection = 0
-    observed_width = None
-    observed_height = None
-    last_output_text = None
-    last_matched_label = None
-
-    print(f"[INFO] Opening webcam index {camera.index}...")
-    open_start = time.perf_counter()
-    camera.open()
-    open_ms = (time.perf_counter() - open_start) * 1000.0
-    print(f"[INFO] Webcam opened in {open_ms:.1f} ms")
+    def __init__(
+        self,
+        *,
+        camera: Any,
+        task_runner: Callable[[Any], TaskResult],
+        task_name: str,
+        library_name: str,
+        condition: str,
+        repeat: int,
+        max_frames: int,
+        max_seconds: float | None,
+        record_video: bool,
+        record_format: str,
+        video_dir: Path,
+        show_preview: bool,
+        pool: BufferPool | None,
+    ):
+        """Store run settings and initialize per-run state."""
+        self.camera = camera
+        self.task_runner = task_runner
+        self.task_name = task_name
+        self.library_name = library_name
+        self.condition = condition
+        self.repeat = repeat
+        self.max_frames = max_frames
+        self.max_seconds = max_seconds
+        self.record_video = record_video
+        self.record_format = record_format
+        self.video_dir = video_dir
+        self.pool = pool
 
-    if warmup_frames > 0:
-        print(f"[INFO] Warming up camera for {warmup_frames} frames...")
-        _warm_up_camera(camera, warmup_frames)
+        self.aggregate = ResultAggregate()
+        self.metrics = RunMetrics()
+        self.capture_started_at = time.perf_counter()
+        self.captured_count = 0
+        # Failed reads are counted here, on the capture thread, and folded into the aggregate
+        # after the run; in pipelined mode the aggregate itself is updated on another thread.
+        self.capture_failures = 0
+        self.frame_age_total_ms = 0.0
+        self.first_result_at: float | None = None
+        self.observed_width: int | None = None
+        self.observed_height: int | None = None
+        self.writer: Any | None = None
+        self.video_path: Path | None = None
+        self.cv2: Any | None = None
+        if show_preview:
+            import cv2
 
-    metrics = RunMetrics()
-    capture_started_at = time.perf_counter()
+            self.cv2 = cv2
 
-    writer = None
-    video_path = None
+    def start(self) -> None:
+        """Reset the clocks at the start of the timed region."""
+        self.metrics = RunMetrics()
+        self.capture_started_at = time.perf_counter()
 
-    cv2 = None
-    if show_preview:
-        import cv2 as _cv2
+    def time_limit_reached(self) -> bool:
+        """Return True once the run has used its max_seconds budget."""
+        return self.max_seconds is not None and (time.perf_counter() - self.capture_started_at) >= self.max_seconds
 
-        cv2 = _cv2
+    def capture(self) -> FrameItem | None:
+        """Read one frame; return None on a failed read and mark exhaustion on end of stream."""
+        with span("capture"):
+            captured = self.camera.read_frame()
+        if not captured.ok:
+            if self.camera.exhausted:
+                return None
+            self.capture_failures += 1
+            return None
 
-    try:
-        frame_idx = 0
-        while True:
-            if frame_idx >= max_frames:
-                break
-            if max_seconds is not None and (time.perf_counter() - capture_started_at) >= max_seconds:
-                break
+        self.captured_count += 1
+        self.observed_height, self.observed_width = captured.frame.shape[:2]
+        return FrameItem(captured=captured, index=self.captured_count)
 
-            ok, frame = camera.read()
-            if not ok:
-                failed_frames += 1
-                continue
+    def infer(self, item: FrameItem) -> FrameItem:
+        """Run the task adapter on the frame and time it."""
+        start = time.perf_counter()
+        self.frame_age_total_ms += (start - item.captured.captured_at) * 1000.0
+        item.result = _run_frame(
+            self.task_runner,
+            item.captured.frame,
+            task_name=self.task_name,
+            library_name=self.library_name,
+        )
+        item.elapsed_ms = (time.perf_counter() - start) * 1000.0
+        return item
 
-            frame_idx += 1
-            observed_height, observed_width = frame.shape[:2]
-
-            if record_video and writer is None:
-                ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-                stem = "_".join(
-                    [
-                        safe_name(task_name),
-                        safe_name(library_name),
-                        safe_name(condition),
-                        f"r{repeat}",
-                        ts,
-                    ]
-                )
-                video_path = video_dir / f"{stem}.mp4"
-                writer = _create_video_writer(video_path, fps=20.0, size=(observed_width, observed_height))
+    def aggregate_result(self, item: FrameItem) -> FrameItem:
+        """Record timing and fold the frame result into the run aggregate."""
+        if self.first_result_at is None:
+            self.first_result_at = time.perf_counter()
+        with span("aggregate"):
+            self.metrics.record_frame(item.elapsed_ms)
+            item.detections = self.aggregate.add(item.result)
+        return item
 
-            start = time.perf_counter()
-            try:
-                last_result = task_runner(frame)
-            except Exception as exc:  # noqa: BLE001
-                last_result = {
-                    "task": task_name,
-                    "library": library_name,
-                    "ok": False,
-                    "outputs": {},
-                    "error": str(exc),
-                }
-
-            elapsed_ms = (time.perf_counter() - start) * 1000.0
-            metrics.record_frame(elapsed_ms)
-
-            detections = []
-            if last_result and last_result.get("ok", False):
-                outputs = last_result.get("outputs", {})
-                detections = outputs.get("detections", []) if isinstance(outputs, dict) else []
-                if isinstance(outputs, dict):
-                    raw_text = outputs.get("text")
-                    if raw_text:
-                        cleaned_text = str(raw_text).strip()
-                        if cleaned_text:
-                            last_output_text = cleaned_text
-                    raw_label = outputs.get("matched_label")
-                    if raw_label:
-                        cleaned_label = str(raw_label).strip()
-                        if cleaned_label:
-                            last_matched_label = cleaned_label
-            else:
-                failed_frames += 1
+    def _open_writer(self, frame) -> None:
+        """Create the capture writer on the first rendered frame."""
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stem = "_".join(
+            [
+                safe_name(self.task_name),
+                safe_name(self.library_name),
+                safe_name(self.condition),
+                f"r{self.repeat}",
+                ts,
+            ]
+        )
+        if self.record_format == "raw":
+            # Raw frames replay bit-exactly via camera.source: raw with no decode cost.
+            self.video_path = self.video_dir / f"{stem}.npy"
+            self.writer = RawFrameRecorder(
+                self.video_path,
+                capacity=self.max_frames,
+                frame_shape=frame.shape,
+                dtype=str(frame.dtype),
+            )
+        else:
+            height, width = frame.shape[:2]
+            self.video_path = self.video_dir / f"{stem}.mp4"
+            self.writer = _create_video_writer(self.video_path, fps=20.0, size=(width, height))
 
-            if detections:
-                frames_with_detection += 1
-                for det in detections:
-                    label = str(det.get("label", "unknown"))
-                    label_counts[label] += 1
-                    conf = det.get("confidence")
-                    if conf is not None:
-                        confidence_values.append(float(conf))
+    def render(self, item: FrameItem) -> bool:
+        """Write and preview one processed frame; return False when the operator quits."""
+        captured = item.captured
+        frame = captured.frame
+        if self.record_video:
+            with span("write"):
+                if self.writer is None:
+                    self._open_writer(frame)
+                if isinstance(self.writer, RawFrameRecorder):
+                    self.writer.write(frame, captured_at=captured.captured_at, frame_number=captured.sequence)
+                else:
+                    self.writer.write(frame)
 
-            if writer is not None:
-                writer.write(frame)
+        cv2 = self.cv2
+        if cv2 is None:
+            self.discard(item)
+            return True
 
-            if show_preview and cv2 is not None:
+        with span("render"):
+            if self.pool is not None:
+                preview = self.pool.acquire(frame.shape, frame.dtype)
+                preview[...] = frame
+            else:
                 preview = frame.copy()
-                if detections:
-                    _draw_detections(preview, detections, cv2)
+            self.discard(item)
+
+            aggregate = self.aggregate
+            if item.detections:
+                _draw_detections(preview, item.detections, cv2)
+            cv2.putText(
+                preview,
+                f"{self.task_name}/{self.library_name} | {self.condition} | r{self.repeat}",
+                (10, 25),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.6,
+                (255, 255, 255),
+                2,
+            )
+            cv2.putText(
+                preview,
+                f"frame {item.index} | q=stop",
+                (10, 50),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.6,
+                (255, 255, 255),
+                2,
+            )
+            if aggregate.last_output_text:
                 cv2.putText(
                     preview,
-                    f"{task_name}/{library_name} | {condition} | r{repeat}",
-                    (10, 25),
+                    aggregate.last_output_text[:80],
+                    (10, 75),
                     cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (255, 255, 255),
+                    0.5,
+                    (0, 220, 255),
                     2,
                 )
+            elif aggregate.last_matched_label:
                 cv2.putText(
                     preview,
-                    f"frame {frame_idx} | q=stop",
-                    (10, 50),
+                    f"match {aggregate.last_matched_label}",
+                    (10, 75),
                     cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (255, 255, 255),
+                    0.5,
+                    (0, 220, 255),
                     2,
                 )
-                if last_output_text:
-                    cv2.putText(
-                        preview,
-                        last_output_text[:80],
-                        (10, 75),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (0, 220, 255),
-                        2,
-                    )
-                elif last_matched_label:
-                    cv2.putText(
-                        preview,
-                        f"match {last_matched_label}",
-                        (10, 75),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (0, 220, 255),
-                        2,
-                    )
-                cv2.imshow("Run Preview", preview)
-                if cv2.waitKey(1) & 0xFF == ord("q"):
-                    print("[INFO] Preview quit requested; ending run early.")
+            cv2.imshow("Run Preview", preview)
+            if self.pool is not None:
+                self.pool.release(preview)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                print("[INFO] Preview quit requested; ending run early.")
+                return False
+        return True
+
+    def discard(self, item: FrameItem) -> None:
+        """Return a frame's pooled buffer once no stage needs it any more."""
+        if item.captured.pooled:
+            self.camera.release_frame(item.captured)
+
+    def run_serial(self) -> None:
+        """Run capture, inference, aggregation, and rendering back to back per frame."""
+        while True:
+            if self.captured_count >= self.max_frames:
+                break
+            if self.time_limit_reached():
+                break
+
+            item = self.capture()
+            if item is None:
+                if self.camera.exhausted:
+                    print("[INFO] Frame source exhausted; ending run.")
                     break
-    finally:
-        if writer is not None:
-            writer.release()
-        camera.close()
-        if show_preview and cv2 is not None:
-            cv2.destroyAllWindows()
+                continue
 
-    summary = metrics.summary()
-    avg_confidence = (sum(confidence_values) / len(confidence_values)) if confidence_values else None
-    reported_resolution = (
-        observed_width,
-        observed_height,
-    ) if observed_width is not None and observed_height is not None else camera.actual_resolution()
-    record = _build_run_record(
-        task_name=task_name,
-        library_name=library_name,
-        condition=condition,
-        repeat=repeat,
-        summary=summary,
-        open_ms=open_ms,
-        warmup_frames=warmup_frames,
-        frames_with_detection=frames_with_detection,
-        label_counts=label_counts,
-        failed_frames=failed_frames,
-        avg_confidence=avg_confidence,
-        resolution=reported_resolution,
-        video_path=video_path,
-        output_text=last_output_text,
-        matched_label=last_matched_label,
-    )
+            self.infer(item)
+            self.aggregate_result(item)
+            if not self.render(item):
+                break
+
+    def run_windowed(self, backend: ProcessInferenceBackend) -> None:
+        """Keep up to one frame per worker in flight and fold results back in capture order."""
+        pending: deque[tuple[FrameItem, Any]] = deque()
+        stopped = False
+        while not stopped:
+            if self.captured_count >= self.max_frames or self.time_limit_reached():
+                break
+
+            item = self.capture()
+            if item is None:
+                if self.camera.exhausted:
+                    print("[INFO] Frame source exhausted; ending run.")
+                    break
+                continue
 
-    run_payload = {
+            self.frame_age_total_ms += (time.perf_counter() - item.captured.captured_at) * 1000.0
+            pending.append((item, backend.submit(item.captured.frame)))
+            while len(pending) >= backend.workers and not stopped:
+                stopped = not self._finish_remote(*pending.popleft())
+
+        while pending:
+            item, future = pending.popleft()
+            if stopped:
+                future.cancel()
+                self.discard(item)
+            else:
+                stopped = not self._finish_remote(item, future)
+
+    def _finish_remote(self, item: FrameItem, future) -> bool:
+        """Wait for one worker result, then aggregate and render it like a local frame."""
+        item.result, item.elapsed_ms = future.result()
+        self.aggregate_result(item)
+        return self.render(item)
+
+    def run_batched(self, batch_runner: Callable[[list[Any]], list[TaskResult]], batch_size: int) -> dict:
+        """Hand frames to the adapter's `process_batch` in groups and return batch latency stats.
+
+        Each frame is charged the amortized share of its batch as processing time; the
+        end-to-end latency from capture to result (which includes waiting for the batch
+        to fill) is reported separately.
+        """
+        batch: list[FrameItem] = []
+        batches = 0
+        batch_total_ms = 0.0
+        latency_total_ms = 0.0
+        latency_frames = 0
+        stopped = False
+
+        def _flush() -> bool:
+            nonlocal batches, batch_total_ms, latency_total_ms, latency_frames
+            start = time.perf_counter()
+            for item in batch:
+                self.frame_age_total_ms += (start - item.captured.captured_at) * 1000.0
+            try:
+                results = list(batch_runner([item.captured.frame for item in batch]))
+            except Exception as exc:  # noqa: BLE001
+                results = []
+                error = str(exc)
+            else:
+                error = "process_batch returned the wrong number of results."
+            if len(results) != len(batch):
+                results = [
+                    {"task": self.task_name, "library": self.library_name, "ok": False, "outputs": {}, "error": error}
+                    for _ in batch
+                ]
+            finished_at = time.perf_counter()
+            batch_ms = (finished_at - start) * 1000.0
+            batches += 1
+            batch_total_ms += batch_ms
+            keep_going = True
+            for item, result in zip(batch, results):
+                latency_total_ms += (finished_at - item.captured.captured_at) * 1000.0
+                latency_frames += 1
+                if not keep_going:
+                    self.discard(item)
+                    continue
+                item.result = result
+                item.elapsed_ms = batch_ms / len(batch)
+                self.aggregate_result(item)
+                keep_going = self.render(item)
+            batch.clear()
+            return keep_going
+
+        while not stopped:
+            if self.captured_count >= self.max_frames or self.time_limit_reached():
+                break
+
+            item = self.capture()
+            if item is None:
+                if self.camera.exhausted:
+                    print("[INFO] Frame source exhausted; ending run.")
+                    break
+                continue
+
+            batch.append(item)
+            if len(batch) >= batch_size:
+                stopped = not _flush()
+        if batch:
+            _flush()
+
+        return {
+            "batch_size": batch_size,
+            "batches": batches,
+            "avg_batch_ms": (batch_total_ms / batches) if batches else 0.0,
+            "avg_frame_latency_ms": (latency_total_ms / latency_frames) if latency_frames else 0.0,
+        }
+
+    def run_pipelined(self, *, queue_size: int, policy: str) -> dict:
+        """Run the stages on separate threads linked by bounded queues and return stage stats.
+
+        Capture and inference run on worker threads; rendering stays on the calling
+        thread because HighGUI windows must be driven from the main thread.
+        """
+        stop_event = threading.Event()
+
+        def _source():
+            if self.time_limit_reached():
+                return PIPELINE_END
+            if policy == "block" and self.captured_count >= self.max_frames:
+                return PIPELINE_END
+            item = self.capture()
+            if item is None and self.camera.exhausted:
+                print("[INFO] Frame source exhausted; ending run.")
+                return PIPELINE_END
+            return item
+
+        def _aggregate(item: FrameItem) -> FrameItem:
+            self.aggregate_result(item)
+            if self.metrics.frame_count >= self.max_frames:
+                stop_event.set()
+            return item
+
+        return run_pipeline(
+            source=_source,
+            stages=[("infer", self.infer), ("aggregate", _aggregate)],
+            sink=self.render,
+            stop_event=stop_event,
+            queue_size=queue_size,
+            policy=policy,
+            on_drop=self.discard,
+        )
+
+    def close(self) -> None:
+        """Release the writer and preview windows."""
+        if self.writer is not None:
+            self.writer.release()
+        if self.cv2 is not None:
+            self.cv2.destroyAllWindows()
+
+
+def _build_run_payload(
+    *,
+    cfg: dict,
+    record: dict,
+    aggregate: ResultAggregate,
+    summary: dict,
+    open_ms: float,
+    capture_stats: dict,
+    max_frames: int,
+    max_seconds: float | None,
+    video_path: Path | None,
+    stage_histograms: dict | None = None,
+) -> dict:
+    """Wrap a run record with config, timing, and metrics sections for the JSON log."""
+    return {
         "schema_version": 1,
         "result_type": "live_task_run",
         "record": record,
         "config": cfg,
         "experiment": {
-            "condition": condition,
-            "repeat": repeat,
+            "condition": record["condition"],
+            "repeat": record["repeat"],
         },
         "execution": {
-            "task": task_name,
-            "library": library_name,
-            "last_result": last_result,
+            "task": record["task"],
+            "library": record["library"],
+            "last_result": aggregate.last_result,
         },
         "timing": {
             "open_ms": open_ms,
+            "capture": capture_stats,
             "run_limit": {
                 "max_frames": max_frames,
                 "max_seconds": max_seconds,
             },
         },
         "metrics": {
-            "frames_with_detection": frames_with_detection,
+            "frames_with_detection": aggregate.frames_with_detection,
             "detection_rate": record["detection_rate"],
-            "label_counts": dict(label_counts),
-            "avg_confidence": avg_confidence,
+            "label_counts": dict(aggregate.label_counts),
+            "avg_confidence": aggregate.avg_confidence(),
+            "latency_histogram": summary.get("latency_histogram"),
+            "stage_histograms": stage_histograms,
         },
         "artifacts": {
             "video_path": str(video_path) if video_path is not None else None,
@@ -398,6 +824,360 @@ def run_task(cfg: dict, *, write_log: bool = True) -> tuple[dict, str | None]:
         "summary": summary,
     }
 
+
+def run_task(
+    cfg: dict,
+    *,
+    write_log: bool = True,
+    frames: Sequence[Any] | None = None,
+    camera: Any | None = None,
+) -> tuple[dict, str | None]:
+    """Execute one task run from an in-memory config and return payload/log path.
+
+    When `frames` is given, the run replays that in-memory frame stack instead of
+    the source configured in the `camera:` block. When an already-open `camera` is
+    given, the run reads from it and leaves it open for the caller.
+    """
+    task_cfg = cfg.get("task", {})
+    task_name = str(task_cfg.get("name", "")).strip()
+    if not task_name:
+        raise ValueError("Task config must define 'task.name'.")
+
+    library_name = select_library(task_cfg)
+    run_cfg = cfg.get("run", {})
+    model_start = str(run_cfg.get("model_start", "warm")).strip().lower()
+    if model_start not in MODEL_START_MODES:
+        raise ValueError(f"Unsupported run.model_start: {model_start}. Expected one of {MODEL_START_MODES}.")
+    preload = run_cfg.get("preload", "background")
+    if isinstance(preload, bool):
+        preload = "background" if preload else "off"
+    preload = str(preload).strip().lower()
+    if preload not in PRELOAD_MODES:
+        raise ValueError(f"Unsupported run.preload: {preload}. Expected one of {PRELOAD_MODES}.")
+    backend_name = str(run_cfg.get("backend", "inline")).strip().lower()
+    if backend_name not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unsupported run.backend: {backend_name}. Expected one of {INFERENCE_BACKENDS}.")
+    adapter = _acquire_adapter(task_name, library_name, cfg, model_start=model_start, backend_name=backend_name)
+    task_runner = adapter
+
+    max_frames = int(run_cfg.get("max_frames", 120))
+    max_seconds = run_cfg.get("max_seconds")
+    max_seconds = float(max_seconds) if max_seconds is not None else None
+    warmup_frames = int(run_cfg.get("warmup_frames", 0))
+    warmup_cfg = run_cfg.get("warmup", {})
+    record_video = bool(run_cfg.get("record_video", False))
+    record_format = str(run_cfg.get("record_format", "mp4")).strip().lower()
+    if record_format not in RECORD_FORMATS:
+        raise ValueError(f"Unsupported run.record_format: {record_format}. Expected one of {RECORD_FORMATS}.")
+    show_preview = bool(run_cfg.get("show_preview", False))
+    use_buffer_pool = bool(run_cfg.get("buffer_pool", False))
+    use_spans = bool(run_cfg.get("spans", False))
+    execution_mode = str(run_cfg.get("execution", "serial")).strip().lower()
+    if execution_mode not in EXECUTION_MODES:
+        raise ValueError(f"Unsupported run.execution: {execution_mode}. Expected one of {EXECUTION_MODES}.")
+    pipeline_cfg = run_cfg.get("pipeline", {})
+    pipeline_queue_size = int(pipeline_cfg.get("queue_size", 2))
+    pipeline_policy = str(pipeline_cfg.get("policy", "block")).strip().lower()
+    if pipeline_policy not in PIPELINE_POLICIES:
+        raise ValueError(f"Unsupported run.pipeline.policy: {pipeline_policy}. Expected one of {PIPELINE_POLICIES}.")
+    if backend_name == "process" and execution_mode != "serial":
+        raise ValueError("run.backend: process already overlaps frames; use it with run.execution: serial.")
+    workers = int(run_cfg.get("workers", 2))
+    batch_size = max(1, int(run_cfg.get("batch_size", 1)))
+    batch_runner = adapter.process_batch if batch_size > 1 and adapter.supports_batch else None
+    if batch_size > 1 and batch_runner is None:
+        print(f"[WARN] {task_name}/{library_name} has no native process_batch(); processing frames one at a time.")
+    if batch_runner is not None and (execution_mode != "serial" or backend_name == "process"):
+        raise ValueError("run.batch_size > 1 requires run.execution: serial and run.backend: inline or server.")
+    ocr_gate_cfg = (cfg.get("ocr", {}) or {}).get("gate", {}) or {}
+    gate = None
+    if task_name == "ocr" and bool(ocr_gate_cfg.get("enabled", False)):
+        if backend_name == "process" or batch_runner is not None:
+            raise ValueError("ocr.gate runs in-process; use run.backend: inline or server without batching.")
+        gate = TextRegionGate(
+            task_runner,
+            library_name=library_name,
+            region_params=region_config(cfg),
+            crop=str(ocr_gate_cfg.get("crop", "union")).strip().lower(),
+        )
+        task_runner = gate
+
+    tracking_cfg = run_cfg.get("tracking", {}) or {}
+    tracker = None
+    if int(tracking_cfg.get("detect_every", 1)) > 1:
+        if backend_name == "process" or batch_runner is not None:
+            raise ValueError("run.tracking needs frames in order on one runner; use run.backend: inline or server without batching.")
+        tracker = DetectTrackRunner(
+            task_runner,
+            detect_every=int(tracking_cfg["detect_every"]),
+            min_confidence=float(tracking_cfg.get("min_confidence", 0.5)),
+            max_points=int(tracking_cfg.get("max_points", 30)),
+            max_fb_error=float(tracking_cfg.get("max_fb_error", 1.0)),
+        )
+    frame_runner = tracker if tracker is not None else task_runner
+
+    cache_cfg = run_cfg.get("result_cache", {}) or {}
+    result_cache = None
+    if bool(cache_cfg.get("enabled", False)):
+        if backend_name == "process" or batch_runner is not None:
+            raise ValueError("run.result_cache runs in-process; use run.backend: inline or server without batching.")
+        result_cache = ResultCache(
+            frame_runner,
+            max_entries=int(cache_cfg.get("max_entries", 32)),
+            ttl_s=float(cache_cfg.get("ttl_s", 5.0)),
+            max_distance=int(cache_cfg.get("max_distance", 4)),
+            hash_size=int(cache_cfg.get("hash_size", 8)),
+        )
+        frame_runner = result_cache
+
+    change_cfg = run_cfg.get("change_gate", {}) or {}
+    change_gate = None
+    if bool(change_cfg.get("enabled", False)):
+        if backend_name == "process" or batch_runner is not None:
+            raise ValueError("run.change_gate runs in-process; use run.backend: inline or server without batching.")
+        change_gate = ChangeGate(
+            frame_runner,
+            scale=float(change_cfg.get("scale", 0.25)),
+            pixel_threshold=int(change_cfg.get("pixel_threshold", 25)),
+            min_changed_area=float(change_cfg.get("min_changed_area", 0.01)),
+            max_skip_frames=int(change_cfg.get("max_skip_frames", 30)),
+            carry_forward=bool(change_cfg.get("carry_forward", False)),
+        )
+        frame_runner = change_gate
+    video_dir = Path(run_cfg.get("video_dir", "data/captures"))
+    log_dir = str(run_cfg.get("log_dir", f"data/logs/{safe_name(task_name)}"))
+
+    experiment = cfg.get("experiment", {})
+    condition = str(experiment.get("condition", "default"))
+    repeat = int(experiment.get("repeat", 1))
+
+    setup_started_at = time.perf_counter()
+    model_load_ms = None
+    model_wait_ms = None
+    load_error = None
+    preload_future = None
+    if preload != "off" and backend_name != "process":
+        print(f"[INFO] Loading {task_name}/{library_name} models ({model_start} start, {preload})...")
+        if preload == "background":
+            preload_future = _start_background_preload(adapter)
+        else:
+            model_load_ms, load_error = _preload_adapter(adapter)
+            _report_preload(model_load_ms, load_error)
+
+    backend = None
+    if backend_name == "process":
+        camera_cfg = cfg.get("camera", {})
+        warmup_shape = (int(camera_cfg.get("height") or 480), int(camera_cfg.get("width") or 640), 3)
+        backend = ProcessInferenceBackend(task_name, library_name, cfg, workers=workers, warmup_shape=warmup_shape)
+        print(f"[INFO] Starting {backend.workers} inference workers for {task_name}/{library_name}...")
+        backend.start()
+        print(f"[INFO] Inference workers ready in {backend.startup_ms:.1f} ms")
+        for error in backend.load_errors:
+            print(f"[WARN] Inference worker failed to load its model: {error}")
+
+    owns_camera = camera is None
+    if camera is None:
+        camera = create_frame_source(cfg.get("camera", {}), frames=frames)
+
+    pool = BufferPool() if use_buffer_pool else None
+    if pool is not None and owns_camera and isinstance(camera, Camera):
+        camera.pool = pool
+
+    try:
+        if owns_camera:
+            print(f"[INFO] Opening {camera.describe()}...")
+            open_start = time.perf_counter()
+            camera.open()
+            open_ms = (time.perf_counter() - open_start) * 1000.0
+            print(f"[INFO] Frame source opened in {open_ms:.1f} ms")
+        else:
+            open_ms = 0.0
+            print(f"[INFO] Reusing open {camera.describe()}")
+
+        warmup = None
+        if warmup_frames > 0:
+            print(f"[INFO] Warming up camera ({(warmup_cfg or {}).get('strategy', 'fixed')} strategy)...")
+            warmup = _warm_up_camera(camera, warmup_frames, warmup_cfg)
+            print(
+                f"[INFO] Warm-up used {warmup['frames']} frames in {warmup['ms']:.1f} ms "
+                f"(strategy={warmup['strategy']}, stable={warmup['stable']})"
+            )
+    except BaseException:
+        if preload_future is not None:
+            # Let the load finish so a cold adapter is not closed mid-construction.
+            preload_future.result()
+        if backend is not None:
+            backend.close()
+        raise
+
+    loop = _TaskLoop(
+        camera=camera,
+        task_runner=frame_runner,
+        task_name=task_name,
+        library_name=library_name,
+        condition=condition,
+        repeat=repeat,
+        max_frames=max_frames,
+        max_seconds=max_seconds,
+        record_video=record_video,
+        record_format=record_format,
+        video_dir=video_dir,
+        show_preview=show_preview,
+        pool=pool,
+    )
+
+    pipeline_stats = None
+    batch_stats = None
+    if preload_future is not None:
+        # Only whatever load time the camera open and warm-up did not hide is spent here.
+        wait_start = time.perf_counter()
+        model_load_ms, load_error = preload_future.result()
+        model_wait_ms = (time.perf_counter() - wait_start) * 1000.0
+        _report_preload(model_load_ms, load_error)
+
+    # A reused camera kept capturing since the last read (previous run, log writing, preload);
+    # start from the newest frame so that gap is not reported as dropped frames.
+    camera.reset_cursor()
+    capture_baseline = camera.capture_stats()
+    span_recorder = SpanRecorder() if use_spans else None
+    set_buffer_pool(pool)
+    set_span_recorder(span_recorder)
+    try:
+        loop.start()
+        if backend is not None:
+            loop.run_windowed(backend)
+        elif batch_runner is not None:
+            batch_stats = loop.run_batched(batch_runner, batch_size)
+        elif execution_mode == "pipelined":
+            pipeline_stats = loop.run_pipelined(queue_size=pipeline_queue_size, policy=pipeline_policy)
+        else:
+            loop.run_serial()
+    finally:
+        loop.close()
+        adapter_stats = adapter.stats() if backend is None else {}
+        if _WARM_ADAPTERS.get((task_name, library_name)) is not adapter:
+            adapter.close()
+        if backend is not None:
+            backend.close()
+        if owns_camera:
+            camera.close()
+        set_buffer_pool(None)
+        set_span_recorder(None)
+
+    metrics = loop.metrics
+    aggregate = loop.aggregate
+    aggregate.failed_frames += loop.capture_failures
+    video_path = loop.video_path
+    observed_width, observed_height = loop.observed_width, loop.observed_height
+    summary = metrics.summary()
+    capture_stats = _capture_delta(capture_baseline, camera.capture_stats())
+    reported_resolution = (
+        observed_width,
+        observed_height,
+    ) if observed_width is not None and observed_height is not None else camera.actual_resolution()
+    record = _build_run_record(
+        task_name=task_name,
+        library_name=library_name,
+        condition=condition,
+        repeat=repeat,
+        summary=summary,
+        open_ms=open_ms,
+        warmup_frames=warmup_frames,
+        aggregate=aggregate,
+        warmup=warmup,
+        resolution=reported_resolution,
+        video_path=video_path,
+        capture_stats=capture_stats,
+        avg_frame_age_ms=(loop.frame_age_total_ms / metrics.frame_count) if metrics.frame_count else None,
+    )
+    record["camera_reused"] = not owns_camera
+    first_inference_ms, steady_state_ms = _latency_split(metrics)
+    record["model_start"] = model_start
+    record["model_preload"] = preload if backend is None else "workers"
+    record["model_preloaded"] = model_load_ms is not None and load_error is None
+    record["model_load_ms"] = model_load_ms
+    record["model_load_error"] = load_error
+    record["model_wait_ms"] = model_wait_ms
+    record["time_to_first_result_ms"] = (
+        (loop.first_result_at - setup_started_at) * 1000.0 if loop.first_result_at is not None else None
+    )
+    record["first_inference_ms"] = first_inference_ms
+    record["steady_state_ms"] = steady_state_ms
+    record["execution_mode"] = execution_mode
+    if pipeline_stats is not None:
+        queue_stats = pipeline_stats["queues"].values()
+        record["pipeline_dropped_frames"] = sum(stats["dropped"] for stats in queue_stats)
+        record["pipeline_max_queue_depth"] = {name: stats["max_depth"] for name, stats in pipeline_stats["queues"].items()}
+        capture_stats["pipeline"] = pipeline_stats
+    if pool is not None:
+        pool_stats = pool.stats()
+        record["buffer_pool_hit_rate"] = pool_stats["hit_rate"]
+        capture_stats["buffer_pool"] = pool_stats
+    if span_recorder is not None:
+        # Adapter stages are only timed in this process, so the process and server backends
+        # report runner stages alone. A stage can run several times per frame (per view,
+        # window, or batch), so the flat field is time per frame and the p95 per occurrence.
+        stage_stats = span_recorder.stats()
+        for name, stats in stage_stats.items():
+            record[f"stage_{name}_ms"] = (stats["total_ms"] / metrics.frame_count) if metrics.frame_count else None
+            record[f"stage_{name}_p95_ms"] = stats["p95_ms"]
+        capture_stats["spans"] = stage_stats
+    record["inference_backend"] = backend_name
+    if backend is not None:
+        backend_stats = backend.stats()
+        record["inference_workers"] = backend_stats["workers"]
+        record["worker_startup_ms"] = backend_stats["startup_ms"]
+        # Workers load their models in the initializer, before any frame is timed.
+        record["model_preloaded"] = not backend_stats["load_errors"]
+        record["model_load_ms"] = max(backend_stats["worker_load_ms"], default=None)
+        record["model_load_error"] = "; ".join(backend_stats["load_errors"]) or None
+        capture_stats["backend"] = backend_stats
+    if gate is not None:
+        gate_stats = gate.stats()
+        record["ocr_gate_skipped_frames"] = gate_stats["skipped_frames"]
+        record["ocr_gate_area_saved"] = gate_stats["avg_area_saved"]
+        capture_stats["ocr_gate"] = gate_stats
+    if change_gate is not None:
+        change_stats = change_gate.stats()
+        record["change_gate_skipped_frames"] = change_stats["skipped_frames"]
+        record["change_gate_saved_ms"] = change_stats["saved_ms"]
+        capture_stats["change_gate"] = change_stats
+    if result_cache is not None:
+        cache_stats = result_cache.stats()
+        record["result_cache_hit_rate"] = cache_stats["hit_rate"]
+        record["result_cache_lookup_ms"] = cache_stats["avg_lookup_ms"]
+        capture_stats["result_cache"] = cache_stats
+    if tracker is not None:
+        tracking_stats = tracker.stats()
+        record["tracking_detect_every"] = tracking_stats["detect_every"]
+        record["detected_frames"] = tracking_stats["detected_frames"]
+        record["tracked_frames"] = tracking_stats["tracked_frames"]
+        record["detector_only_fps"] = tracking_stats["detector_only_fps"]
+        record["effective_fps"] = tracking_stats["effective_fps"]
+        capture_stats["tracking"] = tracking_stats
+    if batch_stats is not None:
+        record["batch_size"] = batch_stats["batch_size"]
+        record["avg_batch_ms"] = batch_stats["avg_batch_ms"]
+        record["avg_frame_latency_ms"] = batch_stats["avg_frame_latency_ms"]
+        capture_stats["batch"] = batch_stats
+    # With the process backend, adapter telemetry lives in the workers instead.
+    if adapter_stats:
+        record.update(adapter_stats)
+        capture_stats["adapter"] = adapter_stats
+
+    run_payload = _build_run_payload(
+        cfg=cfg,
+        record=record,
+        aggregate=aggregate,
+        summary=summary,
+        open_ms=open_ms,
+        capture_stats=capture_stats,
+        max_frames=max_frames,
+        max_seconds=max_seconds,
+        video_path=video_path,
+        stage_histograms=span_recorder.histograms() if span_recorder is not None else None,
+    )
+
     out_file = None
     if write_log:
         out_file = str(
@@ -0,0 +1,114 @@
+"""Frame-differencing gate that reuses the last result while the scene is unchanged."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+from src.tasks.interface import TaskResult
+
+
+class ChangeGate:
+    """Run the wrapped task only when a frame differs enough from the last processed one.
+
+    Frames are compared on a downscaled grayscale copy. A pixel counts as changed when
+    its absolute difference exceeds `pixel_threshold`; inference is skipped while the
+    changed fraction stays below `min_changed_area`, for at most `max_skip_frames` in a
+    row. With `carry_forward`, a skipped frame keeps only the detections whose boxes
+    contain no changed pixels.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Any], TaskResult],
+        *,
+        scale: float = 0.25,
+        pixel_threshold: int = 25,
+        min_changed_area: float = 0.01,
+        max_skip_frames: int = 30,
+        carry_forward: bool = False,
+    ):
+        """Store the wrapped runner and change thresholds."""
+        self.runner = runner
+        self.scale = min(1.0, max(0.01, float(scale)))
+        self.pixel_threshold = int(pixel_threshold)
+        self.min_changed_area = float(min_changed_area)
+        self.max_skip_frames = max(0, int(max_skip_frames))
+        self.carry_forward = bool(carry_forward)
+        self._reference = None
+        self._last_result: TaskResult | None = None
+        self._since_run = 0
+        self.processed_frames = 0
+        self.skipped_frames = 0
+        self.processed_ms = 0.0
+        self.compare_ms = 0.0
+
+    def _small_gray(self, cv2_module, frame):
+        """Downscale first, then convert, so the comparison touches as few pixels as possible."""
+        small = cv2_module.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2_module.INTER_AREA)
+        if len(small.shape) == 3:
+            small = cv2_module.cvtColor(small, cv2_module.COLOR_BGR2GRAY)
+        return small
+
+    def _carried_result(self, changed_mask) -> TaskResult:
+        """Return the last result, dropping detections that overlap changed pixels when configured."""
+        last = self._last_result
+        outputs = last.get("outputs", {})
+        if not isinstance(outputs, dict):
+            return last
+        detections = outputs.get("detections", [])
+        if self.carry_forward and detections:
+            kept = []
+            for det in detections:
+                bbox = det.get("bbox") or []
+                if len(bbox) != 4:
+                    continue
+                x, y, w, h = [int(v * self.scale) for v in bbox]
+                if not changed_mask[max(0, y) : max(0, y) + max(1, h), max(0, x) : max(0, x) + max(1, w)].any():
+                    kept.append(det)
+            detections = kept
+        return {**last, "outputs": {**outputs, "detections": detections, "reused": True}}
+
+    def __call__(self, frame) -> TaskResult:
+        """Reuse the last result for an unchanged frame, otherwise run the task."""
+        import cv2
+
+        start = time.perf_counter()
+        small = self._small_gray(cv2, frame)
+        last = self._last_result
+        if (
+            last is not None
+            and last.get("ok", False)
+            and self._reference is not None
+            and self._reference.shape == small.shape
+            and self._since_run < self.max_skip_frames
+        ):
+            changed_mask = cv2.absdiff(small, self._reference) > self.pixel_threshold
+            changed_fraction = float(changed_mask.mean())
+            self.compare_ms += (time.perf_counter() - start) * 1000.0
+            if changed_fraction < self.min_changed_area:
+                self._since_run += 1
+                self.skipped_frames += 1
+                return self._carried_result(changed_mask)
+
+        run_start = time.perf_counter()
+        result = self.runner(frame)
+        self.processed_ms += (time.perf_counter() - run_start) * 1000.0
+        self.processed_frames += 1
+        self._since_run = 0
+        self._reference = small
+        self._last_result = result
+        return result
+
+    def stats(self) -> dict:
+        """Return skip counters and the inference time the skips avoided."""
+        avg_processed_ms = (self.processed_ms / self.processed_frames) if self.processed_frames else 0.0
+        return {
+            "processed_frames": self.processed_frames,
+            "skipped_frames": self.skipped_frames,
+            "avg_processed_ms": avg_processed_ms,
+            "avg_compare_ms": (self.compare_ms / (self.processed_frames + self.skipped_frames))
+            if (self.processed_frames + self.skipped_frames)
+            else 0.0,
+            "saved_ms": self.skipped_frames * avg_processed_ms,
+        }
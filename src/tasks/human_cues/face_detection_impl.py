@@ -1,13 +1,34 @@
 """OpenCV human-cues baseline using a Haar face detector only."""
 
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 
-from src.tasks.interface import TaskResult, make_result
+from src.core.buffer_pool import converted_color
+from src.core.spans import span
+from src.tasks.interface import TaskAdapter, TaskResult, make_result
 
-_FACE_DETECTOR: Any | None = None
 _CASCADE_FILENAME = "haarcascade_frontalface_default.xml"
 
+DEFAULT_HAAR_CFG = {
+    "scale": 1.0,
+    "scale_factor": 1.1,
+    "min_neighbors": 5,
+    "min_size": None,
+    "max_size": None,
+    "adaptive_size": False,
+    "size_margin": 0.5,
+    "roi": False,
+    "roi_padding": 0.5,
+    "full_scan_every": 10,
+}
+
+
+def _resolve_haar_config(cfg: dict[str, Any]) -> dict[str, Any]:
+    """Merge the `opencv_haar` config block over the defaults (full-frame, full-resolution search)."""
+    haar_cfg = cfg.get("opencv_haar", {}) if isinstance(cfg, dict) else {}
+    return {**DEFAULT_HAAR_CFG, **(haar_cfg or {})}
+
 
 def _resolve_cascade_path(cv2_module: Any) -> str:
     """Resolve the Haar cascade path across OpenCV stub variants."""
@@ -30,34 +51,173 @@ def _as_detection(label: str, x: int, y: int, w: int, h: int) -> dict:
     }
 
 
-def run(frame) -> TaskResult:
-    """Detect face regions and return standardized detections."""
-    import cv2
-
-    global _FACE_DETECTOR
-    face_detector = _FACE_DETECTOR
+def _size_bounds(
+    haar_cfg: dict[str, Any],
+    scale: float,
+    last_faces: list[list[int]],
+    *,
+    adaptive: bool,
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Return detectMultiScale minSize/maxSize in detection-image pixels."""
+    min_side = int(haar_cfg["min_size"] or 0)
+    max_side = int(haar_cfg["max_size"] or 0)
+    if adaptive and last_faces:
+        margin = float(haar_cfg["size_margin"])
+        sides = [min(face[2], face[3]) for face in last_faces]
+        min_side = max(min_side, int(min(sides) * (1.0 - margin)))
+        adaptive_max = int(max(sides) * (1.0 + margin))
+        max_side = min(max_side, adaptive_max) if max_side else adaptive_max
+    min_side = int(min_side * scale)
+    max_side = int(max_side * scale)
+    return (min_side, min_side), (max_side, max_side)
+
+
+def _merge_faces(faces: list[list[int]]) -> list[list[int]]:
+    """Drop boxes whose center falls inside an already-kept box (overlapping ROI windows)."""
+    kept: list[list[int]] = []
+    for face in sorted(faces, key=lambda f: f[2] * f[3], reverse=True):
+        cx = face[0] + face[2] / 2.0
+        cy = face[1] + face[3] / 2.0
+        if any(k[0] <= cx <= k[0] + k[2] and k[1] <= cy <= k[1] + k[3] for k in kept):
+            continue
+        kept.append(face)
+    return kept
+
+
+class HaarFaceAdapter(TaskAdapter):
+    """OpenCV Haar face detector with per-instance face history for ROI search."""
+
+    task = "human_cues"
+    library = "opencv"
+
+    def __init__(self, cfg: dict[str, Any] | None = None):
+        """Start without a loaded cascade."""
+        self._face_detector: Any | None = None
+        super().__init__(cfg)
+
+    def setup(self, cfg: dict[str, Any]) -> None:
+        """Resolve the Haar search settings and reset the face history used by ROI search."""
+        super().setup(cfg)
+        self.haar_cfg = _resolve_haar_config(self.cfg)
+        self._last_faces: list[list[int]] = []
+        self._frames_since_full_scan = 0
+
+    def _plan_search(self, width: int, height: int) -> tuple[list[tuple[int, int, int, int]], bool]:
+        """Return the full-resolution search windows and whether this is an unrestricted full scan.
+
+        Every `full_scan_every` frames (and whenever no face is known) the whole frame is
+        searched without adaptive size bounds so new faces can be picked up. In between,
+        the search is restricted to padded boxes around the last faces when `roi` is on.
+        """
+        haar_cfg = self.haar_cfg
+        full_frame = [(0, 0, width, height)]
+        if not self._last_faces or self._frames_since_full_scan >= int(haar_cfg["full_scan_every"]):
+            self._frames_since_full_scan = 0
+            return full_frame, True
+
+        self._frames_since_full_scan += 1
+        if not haar_cfg["roi"]:
+            return full_frame, False
+
+        padding = float(haar_cfg["roi_padding"])
+        windows = []
+        for x, y, w, h in self._last_faces:
+            pad_x = int(w * padding)
+            pad_y = int(h * padding)
+            x0 = max(0, x - pad_x)
+            y0 = max(0, y - pad_y)
+            x1 = min(width, x + w + pad_x)
+            y1 = min(height, y + h + pad_y)
+            windows.append((x0, y0, x1 - x0, y1 - y0))
+        return windows, False
+
+    def _detect_faces(self, cv2_module: Any, gray) -> list[list[int]]:
+        """Run detectMultiScale per search window on a downscaled gray image and return frame boxes."""
+        haar_cfg = self.haar_cfg
+        height, width = gray.shape[:2]
+        scale = min(1.0, max(0.05, float(haar_cfg["scale"])))
+        windows, full_scan = self._plan_search(width, height)
+        min_size, max_size = _size_bounds(
+            haar_cfg,
+            scale,
+            self._last_faces,
+            adaptive=bool(haar_cfg["adaptive_size"]) and not full_scan,
+        )
 
-    if face_detector is None:
-        face_detector = cv2.CascadeClassifier(_resolve_cascade_path(cv2))
-        _FACE_DETECTOR = face_detector
+        faces = []
+        for wx, wy, ww, wh in windows:
+            region = gray[wy : wy + wh, wx : wx + ww]
+            if scale < 1.0:
+                with span("preprocess"):
+                    region = cv2_module.resize(region, None, fx=scale, fy=scale, interpolation=cv2_module.INTER_AREA)
+            with span("infer"):
+                found = self._face_detector.detectMultiScale(
+                    region,
+                    scaleFactor=float(haar_cfg["scale_factor"]),
+                    minNeighbors=int(haar_cfg["min_neighbors"]),
+                    minSize=min_size,
+                    maxSize=max_size,
+                )
+            for x, y, w, h in found:
+                faces.append([int(x / scale) + wx, int(y / scale) + wy, int(w / scale), int(h / scale)])
+
+        # An empty history makes the next call rescan the whole frame.
+        self._last_faces = _merge_faces(faces) if len(windows) > 1 else faces
+        return self._last_faces
+
+    def load(self) -> None:
+        """Load the Haar cascade from OpenCV's data directory."""
+        import cv2
+
+        if self._face_detector is None:
+            self._face_detector = cv2.CascadeClassifier(_resolve_cascade_path(cv2))
+        if self._face_detector.empty():
+            raise RuntimeError("OpenCV Haar face cascade failed to load.")
+
+    def process(self, frame) -> TaskResult:
+        """Detect face regions and return standardized detections."""
+        import cv2
+
+        try:
+            self.load()
+        except RuntimeError as exc:
+            return self.failure(str(exc))
+
+        with ExitStack() as stack:
+            with span("preprocess"):
+                gray = stack.enter_context(converted_color(cv2, frame, cv2.COLOR_BGR2GRAY, channels=1))
+            faces = self._detect_faces(cv2, gray)
+
+        with span("postprocess"):
+            detections = []
+            for (x, y, w, h) in faces:
+                detections.append(_as_detection("face", x, y, w, h))
 
-    if face_detector.empty():
         return make_result(
-            task="human_cues",
-            library="opencv",
-            ok=False,
-            error="OpenCV Haar face cascade failed to load.",
+            task=self.task,
+            library=self.library,
+            outputs={"detections": detections},
         )
 
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    faces = face_detector.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5)
+    def close(self) -> None:
+        """Drop the loaded cascade."""
+        self._face_detector = None
 
-    detections = []
-    for (x, y, w, h) in faces:
-        detections.append(_as_detection("face", x, y, w, h))
 
-    return make_result(
-        task="human_cues",
-        library="opencv",
-        outputs={"detections": detections},
-    )
+_ADAPTER: HaarFaceAdapter | None = None
+
+
+def configure(cfg: dict[str, Any]) -> None:
+    """Configure the module-level adapter used by `run(frame)`."""
+    global _ADAPTER
+    if _ADAPTER is None:
+        _ADAPTER = HaarFaceAdapter(cfg)
+    else:
+        _ADAPTER.setup(cfg)
+
+
+def run(frame) -> TaskResult:
+    """Detect face regions using the module-level adapter."""
+    if _ADAPTER is None:
+        configure({})
+    return _ADAPTER.process(frame)
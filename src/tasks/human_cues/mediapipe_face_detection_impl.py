@@ -1,19 +1,13 @@
 """MediaPipe face-detection adapter for the human-cues comparison task."""
 
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any, cast
 
-from src.tasks.interface import TaskResult, make_result
-
-_CONFIG: dict[str, Any] = {}
-_DETECTOR: Any | None = None
-_DETECTOR_MODEL_PATH: str | None = None
-
-
-def configure(cfg: dict[str, Any]) -> None:
-    """Store run-scoped config for later model resolution."""
-    global _CONFIG
-    _CONFIG = cfg
+from src.core.buffer_pool import converted_color
+from src.core.spans import span
+from src.tasks.interface import TaskAdapter, TaskResult, make_result
+from src.tasks.mediapipe_modes import FrameClock, LiveStreamCollector, resolve_running_mode, running_mode_enum
 
 
 def _resolve_tasks_api():
@@ -42,9 +36,8 @@ def _resolve_tasks_api():
     )
 
 
-def _resolve_model_path() -> Path:
+def _resolve_model_path(cfg: dict[str, Any]) -> Path:
     """Resolve the configured MediaPipe face-detector model path."""
-    cfg = _CONFIG or {}
     mediapipe_cfg = cfg.get("mediapipe", {}) if isinstance(cfg, dict) else {}
     configured = mediapipe_cfg.get("face_detector_model")
     if not configured:
@@ -57,58 +50,8 @@ def _resolve_model_path() -> Path:
     return model_path
 
 
-def run(frame) -> TaskResult:
-    """Run MediaPipe face detection and return standardized detections."""
-    try:
-        mp, BaseOptions, FaceDetector, FaceDetectorOptions, VisionRunningMode = _resolve_tasks_api()
-        model_path = _resolve_model_path()
-    except (ImportError, RuntimeError) as exc:
-        return make_result(
-            task="human_cues",
-            library="mediapipe",
-            ok=False,
-            error=str(exc),
-        )
-
-    global _DETECTOR, _DETECTOR_MODEL_PATH
-    detector = _DETECTOR
-    detector_model_path = _DETECTOR_MODEL_PATH
-    if detector is None or detector_model_path != str(model_path):
-        if not model_path.exists():
-            return make_result(
-                task="human_cues",
-                library="mediapipe",
-                ok=False,
-                error=(
-                    f"MediaPipe face detector model not found: {model_path}. "
-                    "Download a Face Detector .task model and set mediapipe.face_detector_model in config."
-                ),
-            )
-
-        options = FaceDetectorOptions(
-            base_options=BaseOptions(model_asset_path=str(model_path)),
-            running_mode=VisionRunningMode.IMAGE,
-            min_detection_confidence=0.35,
-        )
-        detector = FaceDetector.create_from_options(options)
-        _DETECTOR = detector
-        _DETECTOR_MODEL_PATH = str(model_path)
-
-    import cv2
-
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-
-    try:
-        results = detector.detect(mp_image)
-    except Exception as exc:  # noqa: BLE001
-        return make_result(
-            task="human_cues",
-            library="mediapipe",
-            ok=False,
-            error=str(exc),
-        )
-
+def _outputs_from_results(results: Any) -> dict[str, Any]:
+    """Convert a MediaPipe face-detector result into the shared outputs schema."""
     detections = []
     if getattr(results, "detections", None):
         for det in results.detections:
@@ -126,9 +69,154 @@ def run(frame) -> TaskResult:
                     ],
                 }
             )
+    return {"detections": detections}
+
+
+class MediaPipeFaceAdapter(TaskAdapter):
+    """MediaPipe Tasks face detector in IMAGE, VIDEO, or LIVE_STREAM running mode."""
+
+    task = "human_cues"
+    library = "mediapipe"
+
+    def __init__(self, cfg: dict[str, Any] | None = None):
+        """Start without a detector; the Tasks API is imported on first use."""
+        self._api: tuple | None = None
+        self._detector: Any | None = None
+        self._detector_key: tuple[str, str] | None = None
+        self._clock: FrameClock | None = None
+        self._collector: LiveStreamCollector | None = None
+        self._reported_ts: int | None = None
+        super().__init__(cfg)
+
+    def setup(self, cfg: dict[str, Any]) -> None:
+        """Resolve the model path and running mode once."""
+        super().setup(cfg)
+        self.model_path = _resolve_model_path(self.cfg)
+        try:
+            self.mode = resolve_running_mode(self.cfg)
+            self.setup_error = None
+        except ValueError as exc:
+            self.mode = "image"
+            self.setup_error = str(exc)
+        if self._detector_key != (str(self.model_path), self.mode):
+            self.close()
+        elif self._collector is not None:
+            # A warm detector is reused across runs; live-stream telemetry is per run.
+            self._collector.reset_stats()
+        self._reported_ts = None
+
+    def _load_detector(self) -> Any:
+        """Return the cached detector, creating it for the configured running mode on first use."""
+        if self._detector is not None:
+            return self._detector
+        _mp, BaseOptions, FaceDetector, FaceDetectorOptions, VisionRunningMode = self._api
+        if not self.model_path.exists():
+            raise FileNotFoundError(
+                f"MediaPipe face detector model not found: {self.model_path}. "
+                "Download a Face Detector .task model and set mediapipe.face_detector_model in config."
+            )
 
-    return make_result(
-        task="human_cues",
-        library="mediapipe",
-        outputs={"detections": detections},
-    )
+        collector = LiveStreamCollector(_outputs_from_results) if self.mode == "live_stream" else None
+        mode_options = {"result_callback": collector.callback} if collector is not None else {}
+        options = FaceDetectorOptions(
+            base_options=BaseOptions(model_asset_path=str(self.model_path)),
+            running_mode=running_mode_enum(VisionRunningMode, self.mode),
+            min_detection_confidence=0.35,
+            **mode_options,
+        )
+        self._detector = FaceDetector.create_from_options(options)
+        self._detector_key = (str(self.model_path), self.mode)
+        self._clock = FrameClock()
+        self._collector = collector
+        return self._detector
+
+    def load(self) -> Any:
+        """Import the Tasks API and create the detector for the configured running mode."""
+        if self.setup_error is not None:
+            raise ValueError(self.setup_error)
+        if self._api is None:
+            self._api = _resolve_tasks_api()
+        return self._load_detector()
+
+    def process(self, frame) -> TaskResult:
+        """Run MediaPipe face detection and return standardized detections."""
+        try:
+            detector = self.load()
+        except (ImportError, RuntimeError, ValueError, FileNotFoundError) as exc:
+            return self.failure(str(exc))
+        mp = self._api[0]
+
+        import cv2
+
+        mode = self.mode
+        # mp.Image copies the pixels, so the pooled RGB buffer can be reused even in async mode.
+        with ExitStack() as stack:
+            with span("preprocess"):
+                rgb = stack.enter_context(converted_color(cv2, frame, cv2.COLOR_BGR2RGB, channels=3))
+                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+
+            try:
+                with span("infer"):
+                    if mode == "video":
+                        results = detector.detect_for_video(mp_image, self._clock.next_ms())
+                    elif mode == "live_stream":
+                        timestamp_ms = self._clock.next_ms()
+                        self._collector.mark_submitted(timestamp_ms)
+                        detector.detect_async(mp_image, timestamp_ms)
+                    else:
+                        results = detector.detect(mp_image)
+            except Exception as exc:  # noqa: BLE001
+                return self.failure(str(exc))
+
+        if mode == "live_stream":
+            # Results arrive later on MediaPipe's thread. Report each one once, with the frame it
+            # belongs to; until a newer one arrives the frame is pending and left out of the aggregate.
+            latest = self._collector.latest()
+            if latest is None or latest[0] == self._reported_ts:
+                outputs = {"detections": [], "pending": True}
+            else:
+                self._reported_ts = latest[0]
+                outputs = {**latest[1], "result_timestamp_ms": latest[0]}
+            outputs["frame_timestamp_ms"] = timestamp_ms
+            return make_result(task=self.task, library=self.library, outputs=outputs)
+
+        with span("postprocess"):
+            outputs = _outputs_from_results(results)
+        return make_result(task=self.task, library=self.library, outputs=outputs)
+
+    def stats(self) -> dict[str, Any]:
+        """Return running-mode telemetry for the run record."""
+        stats: dict[str, Any] = {"mediapipe_running_mode": self.mode if self._clock is not None else None}
+        if self._collector is not None:
+            live = self._collector.stats()
+            stats["mediapipe_callback_latency_ms"] = live["avg_callback_latency_ms"]
+            stats["mediapipe_skipped_frames"] = live["skipped"]
+        return stats
+
+    def close(self) -> None:
+        """Close the MediaPipe detector, which also stops its live-stream thread."""
+        if self._detector is not None:
+            self._detector.close()
+        self._detector = None
+        self._detector_key = None
+        self._clock = None
+        self._collector = None
+
+
+_ADAPTER: MediaPipeFaceAdapter | None = None
+
+
+def configure(cfg: dict[str, Any]) -> None:
+    """Configure the module-level adapter used by `run(frame)`."""
+    global _ADAPTER
+    if _ADAPTER is None:
+        _ADAPTER = MediaPipeFaceAdapter(cfg)
+    else:
+        _ADAPTER.setup(cfg)
+
+
+def run(frame) -> TaskResult:
+    """Run MediaPipe face detection using the module-level adapter."""
+    if _ADAPTER is None:
+        configure({})
+    return _ADAPTER.process(frame)
@@ -1,5 +1,7 @@
-﻿"""Shared task result contract for task-library adapters."""
+﻿"""Shared task result and adapter contracts for task-library adapters."""
 
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any, TypedDict
 
 
@@ -37,3 +39,57 @@ def make_result(
         "outputs": outputs or {},
         "error": error,
     }
+
+
+class TaskAdapter(ABC):
+    """Stateful task-library adapter.
+
+    `setup(cfg)` resolves run-scoped config once, `load()` builds models ahead of
+    the first frame, and `process(frame)` then only does per-frame work.
+    Instances hold their own models, so independently configured adapters can
+    coexist in one process. Instances are also callable, so they stand in
+    wherever a `run(frame)` function is expected.
+    """
+
+    task = ""
+    library = ""
+
+    def __init__(self, cfg: dict[str, Any] | None = None):
+        """Create the adapter and resolve its config; models load in `load()` or on first use."""
+        self.cfg: dict[str, Any] = {}
+        self.setup(cfg or {})
+
+    def setup(self, cfg: dict[str, Any]) -> None:
+        """Resolve run-scoped config; called again whenever the config changes."""
+        self.cfg = cfg if isinstance(cfg, dict) else {}
+
+    def load(self) -> None:
+        """Build models now instead of on the first frame; raises when they cannot be loaded."""
+
+    @abstractmethod
+    def process(self, frame) -> TaskResult:
+        """Run the task on one frame."""
+
+    def process_batch(self, frames: Sequence[Any]) -> list[TaskResult]:
+        """Run the task on several frames; adapters override this when batching is cheaper."""
+        return [self.process(frame) for frame in frames]
+
+    @property
+    def supports_batch(self) -> bool:
+        """True when the adapter implements a native `process_batch`."""
+        return type(self).process_batch is not TaskAdapter.process_batch
+
+    def stats(self) -> dict[str, Any]:
+        """Return adapter-specific telemetry for the run record."""
+        return {}
+
+    def close(self) -> None:
+        """Release models and worker pools held by the adapter."""
+
+    def failure(self, error: str) -> TaskResult:
+        """Build a failed result tagged with this adapter's task and library."""
+        return make_result(task=self.task, library=self.library, ok=False, error=error)
+
+    def __call__(self, frame) -> TaskResult:
+        """Alias for `process` so adapters plug into runner wrappers."""
+        return self.process(frame)
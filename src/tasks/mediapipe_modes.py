@@ -0,0 +1,103 @@
+"""Running-mode helpers shared by the MediaPipe Tasks adapters."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+MEDIAPIPE_RUNNING_MODES = ("image", "video", "live_stream")
+
+
+def resolve_running_mode(cfg: dict[str, Any] | None) -> str:
+    """Return the configured `mediapipe.running_mode`, defaulting to synchronous IMAGE mode."""
+    mediapipe_cfg = (cfg or {}).get("mediapipe", {}) if isinstance(cfg, dict) else {}
+    mode = str((mediapipe_cfg or {}).get("running_mode", "image")).strip().lower()
+    if mode not in MEDIAPIPE_RUNNING_MODES:
+        raise ValueError(f"Unsupported mediapipe.running_mode: {mode}. Expected one of {MEDIAPIPE_RUNNING_MODES}.")
+    return mode
+
+
+def running_mode_enum(vision_running_mode: Any, mode: str) -> Any:
+    """Map a config mode name onto MediaPipe's RunningMode enum."""
+    return getattr(vision_running_mode, mode.upper())
+
+
+class FrameClock:
+    """Strictly increasing millisecond timestamps, as VIDEO and LIVE_STREAM modes require."""
+
+    def __init__(self):
+        """Anchor the clock at creation time."""
+        self._origin = time.perf_counter()
+        self._last_ms = -1
+
+    def next_ms(self) -> int:
+        """Return the current time in ms since creation, bumped past the previous stamp if needed."""
+        now_ms = int((time.perf_counter() - self._origin) * 1000.0)
+        if now_ms <= self._last_ms:
+            now_ms = self._last_ms + 1
+        self._last_ms = now_ms
+        return now_ms
+
+
+class LiveStreamCollector:
+    """Receive LIVE_STREAM callbacks and map each result back to its frame by timestamp."""
+
+    def __init__(self, convert: Callable[[Any], dict[str, Any]]):
+        """Store the converter that turns a MediaPipe result into adapter outputs."""
+        self.convert = convert
+        self._lock = threading.Lock()
+        self._submitted_at: dict[int, float] = {}
+        self._latest: tuple[int, dict[str, Any]] | None = None
+        self.submitted = 0
+        self.completed = 0
+        self.latency_total_ms = 0.0
+        self.latency_max_ms = 0.0
+
+    def mark_submitted(self, timestamp_ms: int) -> None:
+        """Remember when the frame with `timestamp_ms` was handed to detect_async()."""
+        with self._lock:
+            self._submitted_at[timestamp_ms] = time.perf_counter()
+            self.submitted += 1
+
+    def callback(self, result: Any, _output_image: Any, timestamp_ms: int) -> None:
+        """MediaPipe result callback; runs on MediaPipe's own thread."""
+        outputs = self.convert(result)
+        finished_at = time.perf_counter()
+        with self._lock:
+            submitted_at = self._submitted_at.pop(timestamp_ms, None)
+            # Frames MediaPipe skipped while busy never call back; forget them.
+            for stale in [ts for ts in self._submitted_at if ts < timestamp_ms]:
+                del self._submitted_at[stale]
+            if submitted_at is not None:
+                latency_ms = (finished_at - submitted_at) * 1000.0
+                self.latency_total_ms += latency_ms
+                self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+            self.completed += 1
+            self._latest = (timestamp_ms, outputs)
+
+    def reset_stats(self) -> None:
+        """Start a new run: forget pending frames, the last result, and the counters."""
+        with self._lock:
+            self._submitted_at.clear()
+            self._latest = None
+            self.submitted = 0
+            self.completed = 0
+            self.latency_total_ms = 0.0
+            self.latency_max_ms = 0.0
+
+    def latest(self) -> tuple[int, dict[str, Any]] | None:
+        """Return the newest (frame timestamp, outputs) pair delivered so far."""
+        with self._lock:
+            return self._latest
+
+    def stats(self) -> dict[str, Any]:
+        """Return submission/callback counters for run records."""
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "skipped": max(0, self.submitted - self.completed - len(self._submitted_at)),
+                "avg_callback_latency_ms": (self.latency_total_ms / self.completed) if self.completed else 0.0,
+                "max_callback_latency_ms": self.latency_max_ms,
+            }
@@ -5,7 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from src.tasks.interface import TaskResult, make_result
+from src.core.spans import span
+from src.tasks.interface import TaskAdapter, TaskResult, make_result
 
 
 DEFAULT_MODEL_PATH = Path(__file__).resolve().parents[3] / "models" / "opencv" / "frozen_inference_graph.pb"
@@ -95,20 +96,11 @@ DEFAULT_LABELS = [
     "toothbrush",
 ]
 
-_CONFIG: dict[str, Any] = {}
-_DETECTOR: Any | None = None
-_DETECTOR_KEY: tuple[str, str] | None = None
+_ADAPTER: OpenCVObjectAdapter | None = None
 
 
-def configure(cfg: dict[str, Any]) -> None:
-    """Store run-scoped config for later detector resolution."""
-    global _CONFIG
-    _CONFIG = cfg
-
-
-def _resolve_dnn_config() -> tuple[Path, Path, set[str] | None, float, float, int, float]:
+def _resolve_dnn_config(cfg: dict[str, Any]) -> tuple[Path, Path, set[str] | None, float, float, int, float, bool]:
     """Resolve model, config, and optional label filter paths from config."""
-    cfg = _CONFIG or {}
     dnn_cfg = cfg.get("opencv_dnn", {}) if isinstance(cfg, dict) else {}
 
     model_path = Path(dnn_cfg.get("model", DEFAULT_MODEL_PATH))
@@ -125,6 +117,7 @@ def _resolve_dnn_config() -> tuple[Path, Path, set[str] | None, float, float, in
     nms_threshold = float(dnn_cfg.get("nms_threshold", 0.4))
     input_size = int(dnn_cfg.get("input_size", 320))
     center_crop_fraction = float(dnn_cfg.get("center_crop_fraction", 0.7))
+    batched_views = bool(dnn_cfg.get("batched_views", True))
     return (
         model_path,
         config_path,
@@ -133,6 +126,7 @@ def _resolve_dnn_config() -> tuple[Path, Path, set[str] | None, float, float, in
         nms_threshold,
         input_size,
         center_crop_fraction,
+        batched_views,
     )
 
 
@@ -177,117 +171,237 @@ def _build_candidate_views(frame, *, center_crop_fraction: float) -> list[dict]:
     return views
 
 
-def run(frame) -> TaskResult:
-    """Detect objects in the webcam frame using OpenCV DNN."""
-    import cv2
+def _detect_views_separately(detector: Any, views: list[dict], *, confidence_threshold: float, nms_threshold: float):
+    """Legacy path: run DetectionModel.detect once per view and concatenate the boxes."""
+    found = []
+    for view in views:
+        class_ids, confidences, boxes = detector.detect(
+            view["image"],
+            confThreshold=confidence_threshold,
+            nmsThreshold=nms_threshold,
+        )
 
-    global _DETECTOR, _DETECTOR_KEY
-    (
-        model_path,
-        config_path,
-        label_filter,
-        confidence_threshold,
-        nms_threshold,
-        input_size,
-        center_crop_fraction,
-    ) = _resolve_dnn_config()
-    detector = _DETECTOR
-    detector_key = _DETECTOR_KEY
-    expected_key = (str(model_path), str(config_path))
-
-    if detector is None or detector_key != expected_key:
-        if not model_path.exists():
-            return make_result(
-                task="object_recognition",
-                library="opencv",
-                ok=False,
-                error=f"OpenCV DNN model not found: {model_path}",
-            )
-        if not config_path.exists():
-            return make_result(
-                task="object_recognition",
-                library="opencv",
-                ok=False,
-                error=f"OpenCV DNN config not found: {config_path}",
-            )
+        if class_ids is None or len(class_ids) == 0:
+            continue
 
-        try:
-            net = _create_detection_model(cv2, model_path, config_path)
-            net.setInputSize(input_size, input_size)
+        x_offset, y_offset = view["offset"]
+        for class_id, confidence, box in zip(class_ids.flatten(), confidences.flatten(), boxes):
+            found.append(
+                (
+                    int(class_id),
+                    float(confidence),
+                    [int(box[0] + x_offset), int(box[1] + y_offset), int(box[2]), int(box[3])],
+                )
+            )
+    return found
+
+
+def _detect_views_batched(
+    cv2_module: Any,
+    net: Any,
+    views: list[dict],
+    *,
+    input_size: int,
+    confidence_threshold: float,
+    nms_threshold: float,
+):
+    """Run every view through one batched forward pass and merge the views with class-aware NMS."""
+    # Same preprocessing DetectionModel applies: resize, swap RB, scale to [-1, 1].
+    with span("preprocess"):
+        blob = cv2_module.dnn.blobFromImages(
+            [view["image"] for view in views],
+            scalefactor=1.0 / 127.5,
+            size=(input_size, input_size),
+            mean=(127.5, 127.5, 127.5),
+            swapRB=True,
+            crop=False,
+        )
+    with span("infer"):
+        net.setInput(blob)
+        # DetectionOutput rows: [image_id, class_id, confidence, x1, y1, x2, y2] in view-relative units.
+        rows = net.forward().reshape(-1, 7)
+    with span("postprocess"):
+        return _merge_view_rows(cv2_module, rows, views, confidence_threshold=confidence_threshold, nms_threshold=nms_threshold)
+
+
+def _merge_view_rows(cv2_module: Any, rows, views: list[dict], *, confidence_threshold: float, nms_threshold: float):
+    """Map batched detection rows back to frame coordinates and apply class-aware NMS."""
+    import numpy as np
+
+    rows = rows[rows[:, 2] >= confidence_threshold]
+    if len(rows) == 0:
+        return []
+
+    image_ids = rows[:, 0].astype(np.int64).clip(0, len(views) - 1)
+    sizes = np.array([view["image"].shape[1::-1] for view in views], dtype=np.float32)
+    offsets = np.array([view["offset"] for view in views], dtype=np.float32)
+    view_sizes = sizes[image_ids]
+    view_offsets = offsets[image_ids]
+    x1 = rows[:, 3] * view_sizes[:, 0] + view_offsets[:, 0]
+    y1 = rows[:, 4] * view_sizes[:, 1] + view_offsets[:, 1]
+    x2 = rows[:, 5] * view_sizes[:, 0] + view_offsets[:, 0]
+    y2 = rows[:, 6] * view_sizes[:, 1] + view_offsets[:, 1]
+    boxes = np.stack([x1, y1, x2 - x1, y2 - y1], axis=1)
+    class_ids = rows[:, 1].astype(np.int64)
+    scores = rows[:, 2].astype(np.float32)
+
+    # Shifting each class into its own coordinate band makes one NMS call class-aware.
+    band = float(max(offsets[:, 0].max() + sizes[:, 0].max(), offsets[:, 1].max() + sizes[:, 1].max()) + 1.0)
+    banded = boxes.copy()
+    banded[:, 0] += class_ids * band
+    banded[:, 1] += class_ids * band
+    keep = cv2_module.dnn.NMSBoxes(banded.tolist(), scores.tolist(), confidence_threshold, nms_threshold)
+    keep = np.asarray(keep, dtype=np.int64).reshape(-1)
+    return [
+        (int(class_ids[idx]), float(scores[idx]), [int(round(v)) for v in boxes[idx]])
+        for idx in keep
+    ]
+
+
+class OpenCVObjectAdapter(TaskAdapter):
+    """OpenCV DNN object detector; paths and thresholds are resolved once per setup()."""
+
+    task = "object_recognition"
+    library = "opencv"
+
+    def __init__(self, cfg: dict[str, Any] | None = None):
+        """Start without a loaded network."""
+        self._detector: Any | None = None
+        self._detector_key: tuple[str, str, bool] | None = None
+        super().__init__(cfg)
+
+    def setup(self, cfg: dict[str, Any]) -> None:
+        """Resolve detector settings and drop a loaded network whose files or mode changed."""
+        super().setup(cfg)
+        (
+            self.model_path,
+            self.config_path,
+            self.label_filter,
+            self.confidence_threshold,
+            self.nms_threshold,
+            self.input_size,
+            self.center_crop_fraction,
+            self.batched_views,
+        ) = _resolve_dnn_config(self.cfg)
+        if self._detector_key != (str(self.model_path), str(self.config_path), self.batched_views):
+            self.close()
+
+    def _load_detector(self, cv2_module: Any) -> Any:
+        """Return the cached network, reading it from disk on first use."""
+        if self._detector is not None:
+            return self._detector
+        if not self.model_path.exists():
+            raise FileNotFoundError(f"OpenCV DNN model not found: {self.model_path}")
+        if not self.config_path.exists():
+            raise FileNotFoundError(f"OpenCV DNN config not found: {self.config_path}")
+
+        if self.batched_views:
+            net = cv2_module.dnn.readNet(str(self.model_path), str(self.config_path))
+        else:
+            net = _create_detection_model(cv2_module, self.model_path, self.config_path)
+            net.setInputSize(self.input_size, self.input_size)
             net.setInputScale(1.0 / 127.5)
             net.setInputMean((127.5, 127.5, 127.5))
             net.setInputSwapRB(True)
+        self._detector = net
+        self._detector_key = (str(self.model_path), str(self.config_path), self.batched_views)
+        return net
+
+    def load(self) -> None:
+        """Read the DNN network from disk."""
+        import cv2
+
+        self._load_detector(cv2)
+
+    def process(self, frame) -> TaskResult:
+        """Detect objects in the webcam frame using OpenCV DNN."""
+        import cv2
+
+        try:
+            detector = self._load_detector(cv2)
         except Exception as exc:  # noqa: BLE001
-            return make_result(
-                task="object_recognition",
-                library="opencv",
-                ok=False,
-                error=str(exc),
-            )
+            return self.failure(str(exc))
 
-        _DETECTOR = net
-        _DETECTOR_KEY = expected_key
-        detector = net
-
-    detections = []
-    scores: dict[str, float] = {}
-    best_label = None
-    best_score = 0.0
-
-    try:
-        for view in _build_candidate_views(frame, center_crop_fraction=center_crop_fraction):
-            class_ids, confidences, boxes = detector.detect(
-                view["image"],
-                confThreshold=confidence_threshold,
-                nmsThreshold=nms_threshold,
-            )
+        detections = []
+        scores: dict[str, float] = {}
+        best_label = None
+        best_score = 0.0
 
-            if class_ids is None or len(class_ids) == 0:
-                continue
-
-            x_offset, y_offset = view["offset"]
-            for class_id, confidence, box in zip(class_ids.flatten(), confidences.flatten(), boxes):
-                label = _normalize_label(_class_name_for_id(int(class_id)))
-                score = float(confidence)
-
-                prior = scores.get(label, 0.0)
-                if score > prior:
-                    scores[label] = round(score, 4)
-
-                if label_filter and label.lower() not in label_filter:
-                    continue
-
-                adjusted_box = [
-                    int(box[0] + x_offset),
-                    int(box[1] + y_offset),
-                    int(box[2]),
-                    int(box[3]),
-                ]
-                detections.append(
-                    {
-                        "label": label,
-                        "confidence": score,
-                        "bbox": adjusted_box,
-                    }
+        try:
+            with span("preprocess"):
+                views = _build_candidate_views(frame, center_crop_fraction=self.center_crop_fraction)
+            if self.batched_views:
+                # Times its own blob/forward/NMS stages.
+                found = _detect_views_batched(
+                    cv2,
+                    detector,
+                    views,
+                    input_size=self.input_size,
+                    confidence_threshold=self.confidence_threshold,
+                    nms_threshold=self.nms_threshold,
                 )
-                if score > best_score:
-                    best_score = score
-                    best_label = label
-    except Exception as exc:  # noqa: BLE001
+            else:
+                # DetectionModel.detect resizes, runs the network, and applies NMS in one call.
+                with span("infer"):
+                    found = _detect_views_separately(
+                        detector,
+                        views,
+                        confidence_threshold=self.confidence_threshold,
+                        nms_threshold=self.nms_threshold,
+                    )
+
+            with span("postprocess"):
+                for class_id, score, box in found:
+                    label = _normalize_label(_class_name_for_id(class_id))
+
+                    prior = scores.get(label, 0.0)
+                    if score > prior:
+                        scores[label] = round(score, 4)
+
+                    if self.label_filter and label.lower() not in self.label_filter:
+                        continue
+
+                    detections.append(
+                        {
+                            "label": label,
+                            "confidence": score,
+                            "bbox": box,
+                        }
+                    )
+                    if score > best_score:
+                        best_score = score
+                        best_label = label
+        except Exception as exc:  # noqa: BLE001
+            return self.failure(str(exc))
+
         return make_result(
-            task="object_recognition",
-            library="opencv",
-            ok=False,
-            error=str(exc),
+            task=self.task,
+            library=self.library,
+            outputs={
+                "detections": detections,
+                "scores": scores,
+                "matched_label": best_label,
+                "candidate_labels": list(scores.keys()),
+            },
         )
 
-    return make_result(
-        task="object_recognition",
-        library="opencv",
-        outputs={
-            "detections": detections,
-            "scores": scores,
-            "matched_label": best_label,
-            "candidate_labels": list(scores.keys()),
-        },
-    )
+    def close(self) -> None:
+        """Drop the loaded network."""
+        self._detector = None
+        self._detector_key = None
+
+
+def configure(cfg: dict[str, Any]) -> None:
+    """Configure the module-level adapter used by `run(frame)`."""
+    global _ADAPTER
+    if _ADAPTER is None:
+        _ADAPTER = OpenCVObjectAdapter(cfg)
+    else:
+        _ADAPTER.setup(cfg)
+
+
+def run(frame) -> TaskResult:
+    """Detect objects in the webcam frame using the module-level adapter."""
+    if _ADAPTER is None:
+        configure({})
+    return _ADAPTER.process(frame)
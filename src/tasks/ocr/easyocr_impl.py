@@ -3,9 +3,8 @@
 from collections.abc import Sequence
 from typing import Any, TypeGuard
 
-from src.tasks.interface import TaskResult, make_result
-
-_READER: Any | None = None
+from src.core.spans import span
+from src.tasks.interface import TaskAdapter, TaskResult, make_result
 
 
 def _is_bbox_points(value: object) -> TypeGuard[Sequence[Sequence[float | int]]]:
@@ -32,70 +31,93 @@ def _bbox_to_xywh(points: Sequence[Sequence[float | int]]) -> list[int]:
     return [x_min, y_min, x_max - x_min, y_max - y_min]
 
 
-def run(frame) -> TaskResult:
-    """Process one image and return OCR text plus average confidence."""
-    try:
-        import easyocr
-    except ImportError:
-        return make_result(
-            task="ocr",
-            library="easyocr",
-            ok=False,
-            error="easyocr is not installed. Install it to run this adapter.",
-        )
+class EasyOCRAdapter(TaskAdapter):
+    """EasyOCR reader held per instance and created on first use."""
+
+    task = "ocr"
+    library = "easyocr"
 
-    global _READER
-    reader = _READER
-    if reader is None:
+    def __init__(self, cfg: dict[str, Any] | None = None):
+        """Start without a loaded reader."""
+        self._reader: Any | None = None
+        super().__init__(cfg)
+
+    def load(self) -> None:
+        """Create the EasyOCR reader, which loads its detection and recognition models."""
+        if self._reader is not None:
+            return
+        try:
+            import easyocr
+        except ImportError as exc:
+            raise ImportError("easyocr is not installed. Install it to run this adapter.") from exc
+        self._reader = easyocr.Reader(["en"], gpu=False)
+
+    def process(self, frame) -> TaskResult:
+        """Process one image and return OCR text plus average confidence."""
         try:
-            reader = easyocr.Reader(["en"], gpu=False)
+            self.load()
         except Exception as exc:  # noqa: BLE001
-            return make_result(
-                task="ocr",
-                library="easyocr",
-                ok=False,
-                error=str(exc),
-            )
-        _READER = reader
-
-    try:
-        results = reader.readtext(frame, detail=1, paragraph=False)
-    except Exception as exc:  # noqa: BLE001
+            return self.failure(str(exc))
+
+        try:
+            # readtext does its own resizing and grayscale conversion, so it is all one infer stage.
+            with span("infer"):
+                results = self._reader.readtext(frame, detail=1, paragraph=False)
+        except Exception as exc:  # noqa: BLE001
+            return self.failure(str(exc))
+
+        with span("postprocess"):
+            texts = []
+            confidences = []
+            detections = []
+            for bbox, text, confidence in results:
+                cleaned = str(text).strip()
+                conf_value = float(confidence) if confidence is not None else None
+                if cleaned:
+                    texts.append(cleaned)
+                if conf_value is not None:
+                    confidences.append(conf_value)
+
+                bbox_xywh = _bbox_to_xywh(bbox) if _is_bbox_points(bbox) else [0, 0, 0, 0]
+                detections.append(
+                    {
+                        "label": "text",
+                        "confidence": conf_value,
+                        "bbox": bbox_xywh,
+                    }
+                )
+
+            avg_confidence = (sum(confidences) / len(confidences)) if confidences else None
+
         return make_result(
-            task="ocr",
-            library="easyocr",
-            ok=False,
-            error=str(exc),
+            task=self.task,
+            library=self.library,
+            outputs={
+                "text": " ".join(texts).strip(),
+                "confidence": avg_confidence,
+                "detections": detections,
+            },
         )
 
-    texts = []
-    confidences = []
-    detections = []
-    for bbox, text, confidence in results:
-        cleaned = str(text).strip()
-        conf_value = float(confidence) if confidence is not None else None
-        if cleaned:
-            texts.append(cleaned)
-        if conf_value is not None:
-            confidences.append(conf_value)
-
-        bbox_xywh = _bbox_to_xywh(bbox) if _is_bbox_points(bbox) else [0, 0, 0, 0]
-        detections.append(
-            {
-                "label": "text",
-                "confidence": conf_value,
-                "bbox": bbox_xywh,
-            }
-        )
+    def close(self) -> None:
+        """Drop the loaded reader."""
+        self._reader = None
+
+
+_ADAPTER: EasyOCRAdapter | None = None
 
-    avg_confidence = (sum(confidences) / len(confidences)) if confidences else None
-
-    return make_result(
-        task="ocr",
-        library="easyocr",
-        outputs={
-            "text": " ".join(texts).strip(),
-            "confidence": avg_confidence,
-            "detections": detections,
-        },
-    )
+
+def configure(cfg: dict[str, Any]) -> None:
+    """Configure the module-level adapter used by `run(frame)`."""
+    global _ADAPTER
+    if _ADAPTER is None:
+        _ADAPTER = EasyOCRAdapter(cfg)
+    else:
+        _ADAPTER.setup(cfg)
+
+
+def run(frame) -> TaskResult:
+    """Process one image with the module-level adapter."""
+    if _ADAPTER is None:
+        configure({})
+    return _ADAPTER.process(frame)
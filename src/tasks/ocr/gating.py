@@ -0,0 +1,101 @@
+"""Text-region gate that only sends text-bearing crops to an OCR adapter."""
+
+from typing import Any, Callable
+
+from src.tasks.interface import TaskResult, make_result
+from src.tasks.ocr.text_regions import find_text_regions
+
+GATE_CROP_MODES = ("union", "regions")
+
+
+class TextRegionGate:
+    """Wrap an OCR runner so frames without text candidates are skipped and the rest are cropped.
+
+    `union` sends one crop covering every candidate region; `regions` sends each region
+    separately and joins the text in reading order. Detection boxes are shifted back
+    into full-frame coordinates either way.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Any], TaskResult],
+        *,
+        library_name: str,
+        region_params: dict[str, Any],
+        crop: str = "union",
+    ):
+        """Store the wrapped runner, region-proposal settings, and crop mode."""
+        if crop not in GATE_CROP_MODES:
+            raise ValueError(f"Unsupported ocr.gate.crop: {crop}. Expected one of {GATE_CROP_MODES}.")
+        self.runner = runner
+        self.library_name = library_name
+        self.region_params = region_params
+        self.crop = crop
+        self.frames = 0
+        self.skipped_frames = 0
+        self.area_saved_total = 0.0
+
+    def _crop_boxes(self, regions: list[list[int]]) -> list[list[int]]:
+        """Return the boxes to OCR for this frame's regions."""
+        if self.crop == "regions":
+            return regions
+        x0 = min(box[0] for box in regions)
+        y0 = min(box[1] for box in regions)
+        x1 = max(box[0] + box[2] for box in regions)
+        y1 = max(box[1] + box[3] for box in regions)
+        return [[x0, y0, x1 - x0, y1 - y0]]
+
+    def __call__(self, frame) -> TaskResult:
+        """Skip the OCR call when no text is proposed; otherwise OCR only the cropped area."""
+        self.frames += 1
+        height, width = frame.shape[:2]
+        regions = find_text_regions(frame, self.region_params)
+        if not regions:
+            self.skipped_frames += 1
+            self.area_saved_total += 1.0
+            return make_result(
+                task="ocr",
+                library=self.library_name,
+                outputs={"text": "", "confidence": None, "detections": [], "gated": True},
+            )
+
+        boxes = self._crop_boxes(regions)
+        cropped_area = sum(w * h for _x, _y, w, h in boxes)
+        self.area_saved_total += max(0.0, 1.0 - cropped_area / float(width * height))
+
+        texts = []
+        confidences = []
+        detections = []
+        for x, y, w, h in boxes:
+            result = self.runner(frame[y : y + h, x : x + w])
+            if not result.get("ok", False):
+                return result
+            outputs = result.get("outputs", {})
+            text = str(outputs.get("text") or "").strip()
+            if text:
+                texts.append(text)
+            for det in outputs.get("detections", []):
+                bbox = det.get("bbox") or [0, 0, 0, 0]
+                detections.append({**det, "bbox": [int(bbox[0]) + x, int(bbox[1]) + y, int(bbox[2]), int(bbox[3])]})
+                if det.get("confidence") is not None:
+                    confidences.append(float(det["confidence"]))
+
+        return make_result(
+            task="ocr",
+            library=self.library_name,
+            outputs={
+                "text": " ".join(texts).strip(),
+                "confidence": (sum(confidences) / len(confidences)) if confidences else None,
+                "detections": detections,
+                "gated": False,
+            },
+        )
+
+    def stats(self) -> dict:
+        """Return skip and area-saved counters for run records."""
+        return {
+            "crop": self.crop,
+            "frames": self.frames,
+            "skipped_frames": self.skipped_frames,
+            "avg_area_saved": (self.area_saved_total / self.frames) if self.frames else 0.0,
+        }
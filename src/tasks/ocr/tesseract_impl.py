@@ -1,11 +1,22 @@
 """Tesseract OCR adapter for saved-image comparison runs."""
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import multiprocessing
 import os
 from pathlib import Path
 import shutil
+import tempfile
+from typing import Any, Sequence
 
-from src.tasks.interface import TaskResult, make_result
+from src.core.buffer_pool import converted_color
+from src.core.spans import span
+from src.tasks.interface import TaskAdapter, TaskResult, make_result
+from src.tasks.ocr.text_regions import find_text_regions, region_config
 
+TESSERACT_MODES = ("page", "regions")
+# Single text line: each proposed region is one line of the note.
+REGION_PSM_CONFIG = "--psm 7"
 
 WINDOWS_TESSERACT_CANDIDATES = [
     Path(r"C:\Program Files\Tesseract-OCR\tesseract.exe"),
@@ -13,11 +24,12 @@ WINDOWS_TESSERACT_CANDIDATES = [
 ]
 
 
-def _resolve_tesseract_cmd() -> str | None:
-    """Resolve the Tesseract executable from env, PATH, or common Windows paths."""
-    configured = os.getenv("TESSERACT_CMD")
+def _resolve_tesseract_cmd(cfg: dict[str, Any]) -> str | None:
+    """Resolve the Tesseract executable from config, env, PATH, or common Windows paths."""
+    ocr_cfg = cfg.get("ocr", {}) if isinstance(cfg, dict) else {}
+    configured = (ocr_cfg or {}).get("tesseract_cmd") or os.getenv("TESSERACT_CMD")
     if configured:
-        return configured
+        return str(configured)
 
     discovered = shutil.which("tesseract")
     if discovered:
@@ -30,61 +42,70 @@ def _resolve_tesseract_cmd() -> str | None:
     return None
 
 
-def _configure_tesseract(pytesseract_module) -> str | None:
-    """Point pytesseract at a resolved Tesseract executable, if one can be found."""
-    tesseract_cmd = _resolve_tesseract_cmd()
-    if tesseract_cmd:
-        pytesseract_module.pytesseract.tesseract_cmd = tesseract_cmd
-    return tesseract_cmd
+def _missing_result(configured_cmd: str | None) -> TaskResult:
+    """Build the failed result returned when the Tesseract executable cannot be found."""
+    detail = (
+        f"Configured path: {configured_cmd}" if configured_cmd else "Checked PATH and common Windows install locations."
+    )
+    return make_result(
+        task="ocr",
+        library="tesseract",
+        ok=False,
+        error=(
+            "Tesseract executable not found. Install Tesseract OCR and either add it to PATH, "
+            "set TESSERACT_CMD, or set ocr.tesseract_cmd in configs/task_ocr_live.yaml. "
+            f"{detail}"
+        ),
+    )
 
 
-def run(frame) -> TaskResult:
-    """Process one image and return OCR text plus average confidence."""
-    try:
-        import pytesseract
-    except ImportError:
-        return make_result(
-            task="ocr",
-            library="tesseract",
-            ok=False,
-            error="pytesseract is not installed. Install it to run this adapter.",
-        )
+def _image_to_data(pytesseract_module, cv2_module, frame) -> dict:
+    """Run Tesseract on a grayscale copy of the frame and return its word table."""
+    with ExitStack() as stack:
+        gray = frame
+        if len(frame.shape) == 3:
+            with span("preprocess"):
+                gray = stack.enter_context(converted_color(cv2_module, frame, cv2_module.COLOR_BGR2GRAY, channels=1))
+        with span("infer"):
+            return pytesseract_module.image_to_data(gray, output_type=pytesseract_module.Output.DICT)
+
+
+def _tesseract_mode(cfg: dict[str, Any]) -> str:
+    """Return the configured `ocr.tesseract_mode`, defaulting to whole-page OCR."""
+    ocr_cfg = cfg.get("ocr", {}) if isinstance(cfg, dict) else {}
+    mode = str((ocr_cfg or {}).get("tesseract_mode", "page")).strip().lower()
+    if mode not in TESSERACT_MODES:
+        raise ValueError(f"Unsupported ocr.tesseract_mode: {mode}. Expected one of {TESSERACT_MODES}.")
+    return mode
 
-    import cv2
 
-    configured_cmd = _configure_tesseract(pytesseract)
+def _init_region_worker(tesseract_cmd: str | None) -> None:
+    """Point a region worker's pytesseract at the parent's resolved executable."""
+    import pytesseract
+
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
 
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
+def _ocr_region(crop) -> tuple[dict | None, str | None]:
+    """OCR one single-line crop; errors come back as text so they pickle cleanly."""
+    import pytesseract
 
     try:
-        data = pytesseract.image_to_data(gray, output_type=pytesseract.Output.DICT)
+        return pytesseract.image_to_data(crop, config=REGION_PSM_CONFIG, output_type=pytesseract.Output.DICT), None
     except pytesseract.pytesseract.TesseractNotFoundError:
-        detail = (
-            f"Configured path: {configured_cmd}" if configured_cmd else "Checked PATH and common Windows install locations."
-        )
-        return make_result(
-            task="ocr",
-            library="tesseract",
-            ok=False,
-            error=(
-                "Tesseract executable not found. Install Tesseract OCR and either add it to PATH, "
-                "set TESSERACT_CMD, or set ocr.tesseract_cmd in configs/task_ocr_live.yaml. "
-                f"{detail}"
-            ),
-        )
+        return None, "not_found"
     except Exception as exc:  # noqa: BLE001
-        return make_result(
-            task="ocr",
-            library="tesseract",
-            ok=False,
-            error=str(exc),
-        )
+        return None, str(exc)
+
 
+def _build_result(data: dict, rows) -> TaskResult:
+    """Convert the selected rows of a Tesseract word table into a standardized result."""
     texts = []
     confidences = []
     detections = []
-    for idx, raw_text in enumerate(data.get("text", [])):
-        text = str(raw_text).strip()
+    for idx in rows:
+        text = str(data["text"][idx]).strip()
         conf_raw = data.get("conf", ["-1"])[idx]
         try:
             conf_value = float(conf_raw)
@@ -122,3 +143,212 @@ def run(frame) -> TaskResult:
             "detections": detections,
         },
     )
+
+
+class TesseractAdapter(TaskAdapter):
+    """Tesseract OCR; the executable and OCR mode are resolved once per setup()."""
+
+    task = "ocr"
+    library = "tesseract"
+
+    def __init__(self, cfg: dict[str, Any] | None = None):
+        """Start without a region worker pool."""
+        self._api: Any | None = None
+        self._region_pool: ProcessPoolExecutor | None = None
+        self._region_pool_key: tuple[int, str | None] | None = None
+        super().__init__(cfg)
+
+    def setup(self, cfg: dict[str, Any]) -> None:
+        """Resolve the executable, OCR mode, and region settings."""
+        super().setup(cfg)
+        ocr_cfg = self.cfg.get("ocr", {}) or {}
+        self.tesseract_cmd = _resolve_tesseract_cmd(self.cfg)
+        try:
+            self.mode = _tesseract_mode(self.cfg)
+            self.setup_error = None
+        except ValueError as exc:
+            self.mode = "page"
+            self.setup_error = str(exc)
+        self.region_workers = int(ocr_cfg.get("region_workers") or os.cpu_count() or 1)
+        self.region_params = region_config(self.cfg)
+
+    def _pytesseract(self):
+        """Import pytesseract once and point it at the resolved executable."""
+        if self._api is None:
+            import pytesseract
+
+            self._api = pytesseract
+        if self.tesseract_cmd:
+            self._api.pytesseract.tesseract_cmd = self.tesseract_cmd
+        return self._api
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Return the region pool, rebuilding it if the worker count or executable changed."""
+        key = (self.region_workers, self.tesseract_cmd)
+        if self._region_pool is None or self._region_pool_key != key:
+            self.close()
+            self._region_pool = ProcessPoolExecutor(
+                max_workers=self.region_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_region_worker,
+                initargs=(self.tesseract_cmd,),
+            )
+            self._region_pool_key = key
+        return self._region_pool
+
+    def load(self) -> None:
+        """Import pytesseract and create the region pool; Tesseract itself starts per call."""
+        if self.setup_error is not None:
+            raise ValueError(self.setup_error)
+        self._pytesseract()
+        if self.mode == "regions" and self.region_workers > 1:
+            self._pool()
+
+    def _run_regions(self, cv2_module, frame) -> TaskResult:
+        """OCR each proposed text line in parallel and merge the words back in reading order."""
+        with span("preprocess"):
+            regions = find_text_regions(frame, self.region_params)
+            if not regions:
+                return make_result(
+                    task=self.task,
+                    library=self.library,
+                    outputs={"text": "", "confidence": None, "detections": [], "regions": 0},
+                )
+
+            def _crops(gray) -> list:
+                return [gray[y : y + h, x : x + w].copy() for x, y, w, h in regions]
+
+            if len(frame.shape) == 3:
+                with converted_color(cv2_module, frame, cv2_module.COLOR_BGR2GRAY, channels=1) as gray:
+                    crops = _crops(gray)
+            else:
+                crops = _crops(frame)
+
+        with span("infer"):
+            if self.region_workers <= 1 or len(crops) == 1:
+                tables = [_ocr_region(crop) for crop in crops]
+            else:
+                tables = list(self._pool().map(_ocr_region, crops))
+
+        with span("postprocess"):
+            merged: dict[str, list] = {key: [] for key in ("text", "conf", "left", "top", "width", "height")}
+            for (x, y, _w, _h), (data, error) in zip(regions, tables):
+                if error == "not_found":
+                    return _missing_result(self.tesseract_cmd)
+                if error is not None:
+                    return self.failure(error)
+                # Word boxes come back relative to the crop; shift them into frame coordinates.
+                for idx, text in enumerate(data.get("text", [])):
+                    merged["text"].append(text)
+                    merged["conf"].append(data.get("conf", ["-1"])[idx])
+                    merged["left"].append(int(data.get("left", [0])[idx]) + x)
+                    merged["top"].append(int(data.get("top", [0])[idx]) + y)
+                    merged["width"].append(data.get("width", [0])[idx])
+                    merged["height"].append(data.get("height", [0])[idx])
+
+            result = _build_result(merged, range(len(merged["text"])))
+            result["outputs"]["regions"] = len(regions)
+        return result
+
+    def process(self, frame) -> TaskResult:
+        """Process one image and return OCR text plus average confidence."""
+        if self.setup_error is not None:
+            return self.failure(self.setup_error)
+        try:
+            pytesseract = self._pytesseract()
+        except ImportError:
+            return self.failure("pytesseract is not installed. Install it to run this adapter.")
+
+        import cv2
+
+        if self.mode == "regions":
+            try:
+                return self._run_regions(cv2, frame)
+            except Exception as exc:  # noqa: BLE001
+                return self.failure(str(exc))
+
+        try:
+            data = _image_to_data(pytesseract, cv2, frame)
+        except pytesseract.pytesseract.TesseractNotFoundError:
+            return _missing_result(self.tesseract_cmd)
+        except Exception as exc:  # noqa: BLE001
+            return self.failure(str(exc))
+
+        with span("postprocess"):
+            return _build_result(data, range(len(data.get("text", []))))
+
+    def process_batch(self, frames: Sequence[Any]) -> list[TaskResult]:
+        """Process several images with one Tesseract invocation and return one result per image.
+
+        Frames are written as grayscale pages and handed to Tesseract as an image list,
+        so process start-up and model load are paid once per batch instead of per frame.
+        Regions mode has no page-list form, so it falls back to `process` per frame.
+        """
+        if not frames:
+            return []
+        if self.setup_error is not None:
+            return [self.failure(self.setup_error) for _ in frames]
+        if self.mode == "regions":
+            return [self.process(frame) for frame in frames]
+        try:
+            pytesseract = self._pytesseract()
+        except ImportError:
+            return [self.failure("pytesseract is not installed. Install it to run this adapter.") for _ in frames]
+
+        import cv2
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="tess_batch_") as tmp_dir:
+                with span("preprocess"):
+                    page_paths = []
+                    for idx, frame in enumerate(frames):
+                        page_path = Path(tmp_dir) / f"page_{idx:04d}.png"
+                        if len(frame.shape) == 3:
+                            with converted_color(cv2, frame, cv2.COLOR_BGR2GRAY, channels=1) as gray:
+                                cv2.imwrite(str(page_path), gray, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                        else:
+                            cv2.imwrite(str(page_path), frame, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                        page_paths.append(str(page_path))
+                    list_path = Path(tmp_dir) / "pages.txt"
+                    list_path.write_text("\n".join(page_paths) + "\n", encoding="utf-8")
+                with span("infer"):
+                    data = pytesseract.image_to_data(str(list_path), output_type=pytesseract.Output.DICT)
+        except pytesseract.pytesseract.TesseractNotFoundError:
+            return [_missing_result(self.tesseract_cmd) for _ in frames]
+        except Exception as exc:  # noqa: BLE001
+            return [self.failure(str(exc)) for _ in frames]
+
+        # Tesseract numbers pages from 1 in list order.
+        with span("postprocess"):
+            rows_by_page: list[list[int]] = [[] for _ in frames]
+            for idx, page_num in enumerate(data.get("page_num", [])):
+                page = int(page_num) - 1
+                if 0 <= page < len(frames):
+                    rows_by_page[page].append(idx)
+            return [_build_result(data, rows) for rows in rows_by_page]
+
+    def close(self) -> None:
+        """Shut down the region worker pool."""
+        if self._region_pool is not None:
+            self._region_pool.shutdown(wait=True)
+        self._region_pool = None
+        self._region_pool_key = None
+
+
+_ADAPTER: TesseractAdapter | None = None
+
+
+def configure(cfg: dict[str, Any]) -> None:
+    """Configure the module-level adapter used by `run(frame)`."""
+    global _ADAPTER
+    if _ADAPTER is None:
+        _ADAPTER = TesseractAdapter(cfg)
+    else:
+        _ADAPTER.setup(cfg)
+
+
+def run(frame) -> TaskResult:
+    """Process one image with the module-level adapter."""
+    if _ADAPTER is None:
+        configure({})
+    return _ADAPTER.process(frame)
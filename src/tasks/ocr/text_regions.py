@@ -0,0 +1,90 @@
+"""Cheap classical text-region proposals shared by the OCR adapters."""
+
+from typing import Any
+
+from src.core.buffer_pool import converted_color
+
+DEFAULT_REGION_CFG = {
+    "scale": 0.5,
+    "min_area": 300,
+    "min_height": 8,
+    "pad": 6,
+    "max_regions": 32,
+    "close_width": 15,
+    "close_height": 3,
+}
+
+
+def region_config(cfg: dict[str, Any] | None) -> dict[str, Any]:
+    """Merge the `ocr.regions` block of a run config over the defaults."""
+    ocr_cfg = (cfg or {}).get("ocr", {}) if isinstance(cfg, dict) else {}
+    overrides = (ocr_cfg or {}).get("regions", {}) or {}
+    return {**DEFAULT_REGION_CFG, **overrides}
+
+
+def reading_order(boxes: list[list[int]]) -> list[list[int]]:
+    """Sort [x, y, w, h] boxes top-to-bottom by line, then left-to-right within a line."""
+    lines: list[list[list[int]]] = []
+    for box in sorted(boxes, key=lambda b: b[1]):
+        center_y = box[1] + box[3] / 2.0
+        for line in lines:
+            top = min(b[1] for b in line)
+            bottom = max(b[1] + b[3] for b in line)
+            if top <= center_y <= bottom:
+                line.append(box)
+                break
+        else:
+            lines.append([box])
+    return [box for line in lines for box in sorted(line, key=lambda b: b[0])]
+
+
+def find_text_regions(frame, params: dict[str, Any] | None = None) -> list[list[int]]:
+    """Return padded [x, y, w, h] text-line candidates in full-frame coordinates, in reading order.
+
+    The search runs on a downscaled grayscale copy: a morphological gradient picks out
+    stroke edges, Otsu binarizes them, and a wide closing kernel joins characters into
+    line-shaped blobs whose bounding rectangles become the regions.
+    """
+    import cv2
+
+    params = {**DEFAULT_REGION_CFG, **(params or {})}
+    frame_height, frame_width = frame.shape[:2]
+    scale = float(params["scale"])
+
+    def _propose(gray) -> list[list[int]]:
+        small = gray if scale >= 1.0 else cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        gradient = cv2.morphologyEx(small, cv2.MORPH_GRADIENT, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+        _thresh, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        kernel = cv2.getStructuringElement(
+            cv2.MORPH_RECT,
+            (max(1, int(params["close_width"])), max(1, int(params["close_height"]))),
+        )
+        closed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        contours, _hierarchy = cv2.findContours(closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        inv = 1.0 / scale if scale < 1.0 else 1.0
+        pad = int(params["pad"])
+        boxes = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            x, y, w, h = int(x * inv), int(y * inv), int(w * inv), int(h * inv)
+            if w * h < int(params["min_area"]) or h < int(params["min_height"]) or w < h:
+                continue
+            x0 = max(0, x - pad)
+            y0 = max(0, y - pad)
+            x1 = min(frame_width, x + w + pad)
+            y1 = min(frame_height, y + h + pad)
+            boxes.append([x0, y0, x1 - x0, y1 - y0])
+        return boxes
+
+    if len(frame.shape) == 3:
+        with converted_color(cv2, frame, cv2.COLOR_BGR2GRAY, channels=1) as gray:
+            boxes = _propose(gray)
+    else:
+        boxes = _propose(frame)
+
+    # Keep the largest candidates when a cluttered scene produces too many blobs.
+    max_regions = int(params["max_regions"])
+    if len(boxes) > max_regions:
+        boxes = sorted(boxes, key=lambda b: b[2] * b[3], reverse=True)[:max_regions]
+    return reading_order(boxes)
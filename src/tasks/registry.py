@@ -1,9 +1,9 @@
-"""Task registry for resolving task+library pairs into runnable callables."""
+"""Task registry for resolving task+library pairs into adapters and runnable callables."""
 
 from importlib import import_module
-from typing import Callable, cast
+from typing import Any, Callable, cast
 
-from src.tasks.interface import TaskResult
+from src.tasks.interface import TaskAdapter, TaskResult
 
 TASK_MODULES = {
     ("object_recognition", "opencv"): "src.tasks.object_recognition.opencv_impl",
@@ -14,17 +14,44 @@ TASK_MODULES = {
     ("human_cues", "mediapipe"): "src.tasks.human_cues.mediapipe_face_detection_impl",
 }
 
+TASK_ADAPTERS = {
+    ("object_recognition", "opencv"): "OpenCVObjectAdapter",
+    ("object_recognition", "mediapipe"): "MediaPipeObjectAdapter",
+    ("ocr", "tesseract"): "TesseractAdapter",
+    ("ocr", "easyocr"): "EasyOCRAdapter",
+    ("human_cues", "opencv"): "HaarFaceAdapter",
+    ("human_cues", "mediapipe"): "MediaPipeFaceAdapter",
+}
 
-def get_task_runner(task_name: str, library_name: str) -> Callable[[object], TaskResult]:
-    """Load and return the run(frame) function for a task-library combination."""
-    key = (task_name, library_name)
-    module_path = TASK_MODULES.get(key)
+
+def _task_module_path(task_name: str, library_name: str) -> str:
+    """Return the adapter module path for a task-library combination."""
+    module_path = TASK_MODULES.get((task_name, library_name))
     if module_path is None:
         supported = ", ".join(f"{task}/{lib}" for task, lib in sorted(TASK_MODULES))
         raise ValueError(
             f"Unsupported task/library: {task_name}/{library_name}. Supported: {supported}"
         )
+    return module_path
+
+
+def get_task_adapter_class(task_name: str, library_name: str) -> type[TaskAdapter]:
+    """Import and return the adapter class for a task-library combination without instantiating it."""
+    module_path = _task_module_path(task_name, library_name)
+    adapter_cls = getattr(import_module(module_path), TASK_ADAPTERS[(task_name, library_name)], None)
+    if not (isinstance(adapter_cls, type) and issubclass(adapter_cls, TaskAdapter)):
+        raise RuntimeError(f"Module {module_path} does not expose a TaskAdapter subclass")
+    return adapter_cls
 
+
+def create_task_adapter(task_name: str, library_name: str, cfg: dict[str, Any] | None = None) -> TaskAdapter:
+    """Create a new, independently configured adapter instance for a task-library combination."""
+    return get_task_adapter_class(task_name, library_name)(cfg)
+
+
+def get_task_runner(task_name: str, library_name: str) -> Callable[[object], TaskResult]:
+    """Load and return the run(frame) function for a task-library combination."""
+    module_path = _task_module_path(task_name, library_name)
     module = import_module(module_path)
     runner = getattr(module, "run", None)
     if not callable(runner):
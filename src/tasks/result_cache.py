@@ -0,0 +1,100 @@
+"""Perceptual-hash result cache that short-circuits task runners on repeated scenes."""
+
+from collections import OrderedDict
+import time
+from typing import Any, Callable
+
+from src.tasks.interface import TaskResult
+
+
+def difference_hash(frame, hash_size: int = 8) -> int:
+    """Return a dHash of the frame: one bit per horizontally adjacent pixel pair on a tiny gray copy."""
+    import cv2
+    import numpy as np
+
+    small = cv2.resize(frame, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    if len(small.shape) == 3:
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class ResultCache:
+    """Serve a previous TaskResult when a frame's hash is within `max_distance` bits of a cached one.
+
+    Entries are kept in LRU order, capped at `max_entries`, and expire `ttl_s` seconds
+    after they were computed so a slowly changing scene is still re-inferred.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Any], TaskResult],
+        *,
+        max_entries: int = 32,
+        ttl_s: float = 5.0,
+        max_distance: int = 4,
+        hash_size: int = 8,
+    ):
+        """Store the wrapped runner and cache limits."""
+        self.runner = runner
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_s = float(ttl_s)
+        self.max_distance = max(0, int(max_distance))
+        self.hash_size = max(2, int(hash_size))
+        self._entries: OrderedDict[int, tuple[float, TaskResult]] = OrderedDict()
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+        self.expired = 0
+        self.lookup_ms = 0.0
+
+    def _lookup(self, key: int, now: float) -> TaskResult | None:
+        """Return the closest fresh entry within tolerance, dropping expired ones on the way."""
+        best_key = None
+        best_distance = self.max_distance + 1
+        for cached_key, (stored_at, _result) in list(self._entries.items()):
+            if now - stored_at > self.ttl_s:
+                del self._entries[cached_key]
+                self.expired += 1
+                continue
+            distance = (cached_key ^ key).bit_count()
+            if distance < best_distance:
+                best_key = cached_key
+                best_distance = distance
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1]
+
+    def __call__(self, frame) -> TaskResult:
+        """Return a cached result for a near-identical frame, or run the task and cache it."""
+        start = time.perf_counter()
+        key = difference_hash(frame, self.hash_size)
+        cached = self._lookup(key, start)
+        self.lookup_ms += (time.perf_counter() - start) * 1000.0
+        self.lookups += 1
+        if cached is not None:
+            self.hits += 1
+            outputs = cached.get("outputs", {})
+            return {**cached, "outputs": {**outputs, "cached": True}}
+
+        result = self.runner(frame)
+        if result.get("ok", False):
+            self._entries[key] = (time.perf_counter(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def stats(self) -> dict:
+        """Return hit-rate and lookup-cost counters for run records."""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": (self.hits / self.lookups) if self.lookups else 0.0,
+            "avg_lookup_ms": (self.lookup_ms / self.lookups) if self.lookups else 0.0,
+            "entries": len(self._entries),
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
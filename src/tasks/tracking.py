@@ -0,0 +1,169 @@
+"""Detect-every-N wrapper that propagates boxes with optical flow between detector runs."""
+
+import time
+from typing import Any, Callable
+
+from src.tasks.interface import TaskResult
+
+
+class DetectTrackRunner:
+    """Wrap any task runner so the detector only runs every `detect_every` frames.
+
+    In between, each detection box is shifted by the median Lucas-Kanade flow of
+    corner features inside it. The detector runs early whenever a box loses too
+    many of its features (forward-backward check), so tracking confidence never
+    falls below `min_confidence`. Outputs carry `frame_mode: detected|tracked`.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Any], TaskResult],
+        *,
+        detect_every: int = 5,
+        min_confidence: float = 0.5,
+        max_points: int = 30,
+        max_fb_error: float = 1.0,
+    ):
+        """Store the wrapped runner and tracking thresholds."""
+        self.runner = runner
+        self.detect_every = max(1, int(detect_every))
+        self.min_confidence = float(min_confidence)
+        self.max_points = max(4, int(max_points))
+        self.max_fb_error = float(max_fb_error)
+        self._last_result: TaskResult | None = None
+        self._prev_gray = None
+        self._next_gray = None
+        self._since_detect = 0
+        self.detected_frames = 0
+        self.tracked_frames = 0
+        self.redetections = 0
+        self.detect_ms = 0.0
+        self.track_ms = 0.0
+        self.total_ms = 0.0
+
+    def _to_gray(self, cv2_module, frame):
+        """Convert into the spare gray buffer so the previous frame stays intact."""
+        if len(frame.shape) != 3:
+            return frame.copy()
+        height, width = frame.shape[:2]
+        if self._next_gray is None or self._next_gray.shape != (height, width):
+            self._next_gray = cv2_module.cvtColor(frame, cv2_module.COLOR_BGR2GRAY)
+            return self._next_gray
+        return cv2_module.cvtColor(frame, cv2_module.COLOR_BGR2GRAY, dst=self._next_gray)
+
+    def _swap(self, gray) -> None:
+        """Keep `gray` as the reference frame and recycle the old reference buffer."""
+        if gray is self._next_gray:
+            self._next_gray = self._prev_gray
+        self._prev_gray = gray
+
+    def _detect(self, frame, gray) -> TaskResult:
+        """Run the wrapped detector and reset the tracking reference."""
+        start = time.perf_counter()
+        result = self.runner(frame)
+        self.detect_ms += (time.perf_counter() - start) * 1000.0
+        self.detected_frames += 1
+        self._since_detect = 0
+        self._last_result = result
+        self._swap(gray)
+        return _with_mode(result, "detected")
+
+    def _track_box(self, cv2_module, np_module, gray, bbox: list[int]) -> tuple[list[int], float]:
+        """Shift one box by its median feature flow and return it with the surviving-point ratio."""
+        x, y, w, h = [int(v) for v in bbox]
+        height, width = gray.shape[:2]
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(width, x + w), min(height, y + h)
+        if x1 - x0 < 4 or y1 - y0 < 4:
+            return bbox, 0.0
+
+        points = cv2_module.goodFeaturesToTrack(
+            self._prev_gray[y0:y1, x0:x1],
+            maxCorners=self.max_points,
+            qualityLevel=0.01,
+            minDistance=3,
+        )
+        if points is None or len(points) == 0:
+            return bbox, 0.0
+        points = points.reshape(-1, 1, 2) + np_module.array([x0, y0], dtype=np_module.float32)
+
+        forward, status_fwd, _err = cv2_module.calcOpticalFlowPyrLK(self._prev_gray, gray, points, None)
+        backward, status_bwd, _err = cv2_module.calcOpticalFlowPyrLK(gray, self._prev_gray, forward, None)
+        fb_error = np_module.linalg.norm((points - backward).reshape(-1, 2), axis=1)
+        good = (status_fwd.ravel() == 1) & (status_bwd.ravel() == 1) & (fb_error <= self.max_fb_error)
+        confidence = float(good.sum()) / float(len(points))
+        if not good.any():
+            return bbox, 0.0
+
+        shift = np_module.median((forward - points).reshape(-1, 2)[good], axis=0)
+        return [int(round(x + shift[0])), int(round(y + shift[1])), w, h], confidence
+
+    def __call__(self, frame) -> TaskResult:
+        """Return a detector result every N frames and tracked boxes in between."""
+        start = time.perf_counter()
+        try:
+            return self._step(frame)
+        finally:
+            # Wall time of the whole call, so the per-frame gray conversion counts too.
+            self.total_ms += (time.perf_counter() - start) * 1000.0
+
+    def _step(self, frame) -> TaskResult:
+        """Convert the frame to gray, then either re-detect or track the previous boxes."""
+        import cv2
+
+        gray = self._to_gray(cv2, frame)
+        last = self._last_result
+        if (
+            last is None
+            or not last.get("ok", False)
+            or self._prev_gray is None
+            or self._prev_gray.shape != gray.shape
+            or self._since_detect + 1 >= self.detect_every
+        ):
+            return self._detect(frame, gray)
+
+        import numpy as np
+
+        start = time.perf_counter()
+        outputs = last.get("outputs", {})
+        tracked = []
+        for det in outputs.get("detections", []) if isinstance(outputs, dict) else []:
+            bbox = det.get("bbox") or []
+            if len(bbox) != 4:
+                continue
+            new_bbox, confidence = self._track_box(cv2, np, gray, bbox)
+            if confidence < self.min_confidence:
+                self.track_ms += (time.perf_counter() - start) * 1000.0
+                self.redetections += 1
+                return self._detect(frame, gray)
+            tracked.append({**det, "bbox": new_bbox})
+        self.track_ms += (time.perf_counter() - start) * 1000.0
+
+        self.tracked_frames += 1
+        self._since_detect += 1
+        self._last_result = {**last, "outputs": {**outputs, "detections": tracked}}
+        self._swap(gray)
+        return _with_mode(self._last_result, "tracked")
+
+    def stats(self) -> dict:
+        """Return detect/track counts and processing-time FPS for run records."""
+        frames = self.detected_frames + self.tracked_frames
+        total_ms = self.total_ms
+        return {
+            "detect_every": self.detect_every,
+            "detected_frames": self.detected_frames,
+            "tracked_frames": self.tracked_frames,
+            "redetections": self.redetections,
+            "avg_detect_ms": (self.detect_ms / self.detected_frames) if self.detected_frames else 0.0,
+            "avg_track_ms": (self.track_ms / self.tracked_frames) if self.tracked_frames else 0.0,
+            "detector_only_fps": (self.detected_frames * 1000.0 / self.detect_ms) if self.detect_ms > 0 else 0.0,
+            "effective_fps": (frames * 1000.0 / total_ms) if total_ms > 0 else 0.0,
+        }
+
+
+def _with_mode(result: TaskResult, mode: str) -> TaskResult:
+    """Return a copy of `result` whose outputs are tagged with how the frame was produced."""
+    outputs = result.get("outputs", {})
+    if not isinstance(outputs, dict):
+        return result
+    return {**result, "outputs": {**outputs, "frame_mode": mode}}